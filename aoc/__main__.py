@@ -0,0 +1,84 @@
+import argparse
+import os
+import sys
+import time
+
+from aoc.answers import AnswerStore
+from aoc.profiling import DEFAULT_PROFILE_DIRECTORY, PROFILERS
+from handy_dandy_library.instrumentation import format_snapshot
+from aoc.runner import (discover_puzzles, select_puzzles, by_day, run_day, run_parallel, load_timings, save_timings,
+                        report_line, totals_line)
+
+
+def argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc",
+                                     description="Run Advent of Code 2023 solutions, timing parse, solve and output")
+    parser.add_argument("selections", nargs="*", metavar="SELECTION",
+                        help="5 (both parts of day 5), 5.2 (day 5 part 2) or 1-5 (days 1 to 5). Default: everything")
+    parser.add_argument("--inputs", metavar="DIR",
+                        help="look up each puzzle's INPUT_FILE_NAME here instead of next to its solution")
+    parser.add_argument("--input", metavar="FILE", help="use this input file for every selected puzzle")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip tracemalloc, which slows allocation heavy solutions down a lot")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="run puzzles across this many worker processes, longest first. 0 is one per core")
+    parser.add_argument("--profile", choices=sorted(PROFILERS), default=os.environ.get("AOC_PROFILE") or None,
+                        help="wrap each puzzle in cProfile, tracemalloc or a sampling profiler, write the profiles to "
+                             "--profile-dir and summarise the hot spots at the end. Default: $AOC_PROFILE, else off")
+    parser.add_argument("--profile-dir", metavar="DIR",
+                        default=os.environ.get("AOC_PROFILE_DIR", DEFAULT_PROFILE_DIRECTORY),
+                        help="where profiles go, one per day and part. Default: $AOC_PROFILE_DIR, else %(default)s")
+    parser.add_argument("--counters", action="store_true", default=os.environ.get("AOC_COUNTERS", "0") != "0",
+                        help="collect the solutions' diagnostic counters and gauges and summarise them at the end. "
+                             "Default: on when $AOC_COUNTERS is set to anything but 0")
+    parser.add_argument("--reparse", action="store_true",
+                        help="parse again for every part instead of handing part 2 the model part 1 parsed")
+    parser.add_argument("--recompute", action="store_true",
+                        help="solve even where the answer store has this input's answer from the same solver code")
+    parser.add_argument("--list", action="store_true", help="list the discovered puzzles and exit")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    arguments = argument_parser().parse_args(argv)
+    puzzles = select_puzzles(discover_puzzles(), arguments.selections)
+
+    if arguments.list:
+        for puzzle in puzzles:
+            print(f"{puzzle}  {puzzle.file_path}")
+        return 0
+
+    jobs = arguments.jobs or os.cpu_count() or 1
+    trace_memory = not arguments.no_memory
+    answers = None if arguments.recompute else AnswerStore.default()
+    started = time.perf_counter()
+    if jobs > 1:
+        runs = run_parallel(puzzles, jobs, arguments.input, arguments.inputs, trace_memory, load_timings(),
+                            report=lambda run: print(report_line(run), flush=True),
+                            profiler_name=arguments.profile, profile_directory=arguments.profile_dir,
+                            collect_counters=arguments.counters, share_parses=not arguments.reparse,
+                            answers=answers)
+    else:
+        runs = []
+        for day in by_day(puzzles):
+            runs.extend(run_day(day, arguments.input, arguments.inputs, trace_memory, arguments.profile,
+                                arguments.profile_dir, arguments.counters, not arguments.reparse,
+                                report=lambda run: print(report_line(run), flush=True), answers=answers))
+    print(totals_line(runs, time.perf_counter() - started))
+
+    for run in runs:
+        if run.counters:
+            print(f"\nday {run.puzzle.day} part {run.puzzle.part} counters")
+            print(format_snapshot(run.counters))
+    for run in runs:
+        if run.profile_summary is not None:
+            print(f"\nday {run.puzzle.day} part {run.puzzle.part} {arguments.profile} profile, {run.profile_path}")
+            print(run.profile_summary)
+    # Only real inputs say how long a puzzle usually takes, --input may be anything
+    if arguments.input is None:
+        save_timings(runs)
+    return 1 if any(run.error is not None for run in runs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
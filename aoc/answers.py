@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import glob
+import hashlib
+import os
+import time
+
+from dataclasses import dataclass
+
+from handy_dandy_library.parse_cache import DEFAULT_CACHE_DIRECTORY, DiskCache, file_content_hash
+
+
+LIBRARY_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "handy_dandy_library")
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+
+def solver_fingerprint(solution_directory: str) -> str:
+    """
+    Hash of every source file a solution can reach: its day's directory, as parts import their siblings, and the
+    shared library. Editing any of them changes the fingerprint, whether or not the edit touches this part
+    """
+    digest = hashlib.sha256()
+    for directory in (solution_directory, LIBRARY_DIRECTORY):
+        for file_path in sorted(glob.glob(os.path.join(directory, "*.py"))):
+            digest.update(f"{os.path.basename(file_path)}:{file_content_hash(file_path)}\n".encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class StoredAnswer:
+    answer: str
+    phase_seconds: dict[str, tuple[float, float]]  # (wall, cpu) seconds of the run that produced the answer
+    stored_at: float
+
+
+class AnswerStore:
+    """
+    Answers and timings of earlier runs, keyed by the input's content, the day and part and the solver's fingerprint,
+    so a rerun of unchanged code on an unchanged input can skip parse and solve altogether
+    """
+    def __init__(self, disk_cache: DiskCache):
+        self.disk_cache = disk_cache
+        self.fingerprints: dict[str, str] = {}
+
+    def __repr__(self) -> str:
+        return f"AnswerStore({self.disk_cache})"
+
+    @classmethod
+    def default(cls, max_bytes: int = DEFAULT_MAX_BYTES, max_age_seconds: float | None = DEFAULT_MAX_AGE_SECONDS):
+        return cls(DiskCache(os.path.join(DEFAULT_CACHE_DIRECTORY, "answers"), max_bytes, max_age_seconds))
+
+    def fingerprint(self, solution_directory: str) -> str:
+        """ Computed once per directory, source edits during a run are not picked up until the next one """
+        if solution_directory not in self.fingerprints:
+            self.fingerprints[solution_directory] = solver_fingerprint(solution_directory)
+        return self.fingerprints[solution_directory]
+
+    def key(self, day: int, part: int, solution_directory: str, input_path: str) -> str:
+        identity = f"{file_content_hash(input_path)}|{day}.{part}|{self.fingerprint(solution_directory)}"
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def get(self, day: int, part: int, solution_directory: str, input_path: str) -> StoredAnswer | None:
+        return self.disk_cache.get(self.key(day, part, solution_directory, input_path))
+
+    def put(self, day: int, part: int, solution_directory: str, input_path: str, answer: str,
+            phase_seconds: dict[str, tuple[float, float]]) -> None:
+        stored = StoredAnswer(answer, phase_seconds, time.time())
+        self.disk_cache.put(self.key(day, part, solution_directory, input_path), stored)
+        return None
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
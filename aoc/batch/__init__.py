@@ -0,0 +1,86 @@
+"""
+One day's solutions over many inputs, such as everyone's input for a day, fanned out over worker processes.
+
+Workers live for the whole batch and import the day's modules once when they start, so module level state (compiled
+regexes, lookup tables) is built once per worker rather than once per file. Each file's parts share one parse, as in
+the runner. Results come back one JSON object per input and part, in the order the files finish.
+"""
+from __future__ import annotations
+
+import glob
+import json
+import os
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator
+
+from aoc.runner import Puzzle, PuzzleRun, load_module, run_day
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[str]:
+    """ Every file a directory holds, files as given and globs expanded, without duplicates and in name order """
+    found = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        elif os.path.isfile(pattern):
+            candidates = [pattern]
+        else:
+            candidates = glob.glob(pattern, recursive=True)
+        found.update(os.path.normpath(candidate) for candidate in candidates if os.path.isfile(candidate))
+    return sorted(found)
+
+
+def largest_first(input_paths: Iterable[str]) -> list[str]:
+    """ A file's size stands in for how long it takes, so no large input starts last and holds up the finish """
+    return sorted(input_paths, key=lambda input_path: -os.path.getsize(input_path))
+
+
+def warm_up(puzzles: list[Puzzle]) -> None:
+    """ Worker initialiser: imports the day's modules before the first file arrives """
+    for puzzle in puzzles:
+        load_module(puzzle)
+    return None
+
+
+def run_input(puzzles: list[Puzzle], input_path: str, share_parses: bool = True) -> list[PuzzleRun]:
+    return run_day(puzzles, input_path, trace_memory=False, share_parses=share_parses)
+
+
+def run_batch(puzzles: list[Puzzle], input_paths: list[str], jobs: int,
+              share_parses: bool = True) -> Iterator[PuzzleRun]:
+    """ Yields each file's runs, part by part, as soon as the file is done. One job runs them in this process """
+    if jobs == 1:
+        warm_up(puzzles)
+        for input_path in input_paths:
+            yield from run_input(puzzles, input_path, share_parses)
+        return None
+    with ProcessPoolExecutor(max_workers=jobs, initializer=warm_up, initargs=(puzzles,)) as executor:
+        futures = {executor.submit(run_input, puzzles, input_path, share_parses): input_path
+                   for input_path in largest_first(input_paths)}
+        for future in as_completed(futures):
+            input_path = futures[future]
+            try:
+                runs = future.result()
+            except Exception as error:
+                # The worker itself died, e.g. killed for memory, rather than the solution raising
+                runs = [PuzzleRun(puzzle, input_path, error=f"worker failed: {type(error).__name__}: {error}")
+                        for puzzle in puzzles]
+            yield from runs
+    return None
+
+
+def run_record(run: PuzzleRun) -> dict:
+    record = {"input": run.input_path, "day": run.puzzle.day, "part": run.puzzle.part, "answer": run.answer}
+    if run.ok:
+        record.update({f"{phase}_seconds": measurement.wall_seconds for phase, measurement in run.phases.items()})
+        record["parse_reused"] = run.parse_reused
+    if run.skipped is not None:
+        record["skipped"] = run.skipped
+    if run.error is not None:
+        record["error"] = run.error
+    return record
+
+
+def record_line(run: PuzzleRun) -> str:
+    return json.dumps(run_record(run))
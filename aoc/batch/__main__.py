@@ -0,0 +1,47 @@
+import argparse
+import os
+import sys
+import time
+
+from aoc.batch import expand_inputs, record_line, run_batch
+from aoc.runner import discover_puzzles, select_puzzles, format_seconds
+
+
+def argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc.batch",
+                                     description="Run one day's solutions over many inputs, printing JSON lines")
+    parser.add_argument("puzzle", metavar="DAY[.PART]", help="7 (both parts of day 7) or 7.2 (day 7 part 2)")
+    parser.add_argument("inputs", nargs="+", metavar="INPUT",
+                        help="input files, directories of them or globs such as 'inputs/day7_*.txt'")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="worker processes. Default: 0, one per core")
+    parser.add_argument("--reparse", action="store_true",
+                        help="parse again for every part instead of handing part 2 the model part 1 parsed")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argument_parser()
+    arguments = parser.parse_args(argv)
+    day, _, part = arguments.puzzle.partition('.')
+    if not day.isdigit() or (part and not part.isdigit()):
+        parser.error(f"expected DAY or DAY.PART, not {arguments.puzzle!r}")
+    puzzles = select_puzzles(discover_puzzles(), [arguments.puzzle])
+    if not puzzles:
+        parser.error(f"no solutions for {arguments.puzzle}")
+    input_paths = expand_inputs(arguments.inputs)
+    if not input_paths:
+        parser.error(f"no input files in {' '.join(arguments.inputs)}")
+
+    jobs = min(arguments.jobs or os.cpu_count() or 1, len(input_paths))
+    started = time.perf_counter()
+    failures = 0
+    for run in run_batch(puzzles, input_paths, jobs, share_parses=not arguments.reparse):
+        print(record_line(run), flush=True)
+        failures += run.error is not None
+    print(f"{len(input_paths)} inputs, {len(puzzles)} parts each, {failures} failed, on {jobs} workers in "
+          f"{format_seconds(time.perf_counter() - started)}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+Repeatable timings of every puzzle over generated inputs of several sizes, saved as JSON and checked against a baseline.
+
+Each (puzzle, scale) is measured in a child process with a hard timeout, so one pathological solver cannot hold up the
+rest of the suite, and the parse cache is off there so every repeat really parses.
+"""
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import tempfile
+import time
+
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+
+from aoc.generators import GENERATORS, write_input
+from aoc.runner import REPOSITORY_DIRECTORY, Puzzle, load_module, measure
+
+
+BASELINE_PATH = os.path.join(REPOSITORY_DIRECTORY, "aoc", "benchmark", "baseline.json")
+DEFAULT_SCALES = (0.1, 0.3, 1.0)
+# Below this many seconds a change in the median is timer and scheduler noise, not a regression
+NOISE_FLOOR_SECONDS = 0.005
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    puzzle: Puzzle
+    scale: float
+    engine: str | None = None  # A module standing in for the puzzle's own solution, e.g. day12_solution_from_reddit
+
+    @property
+    def key(self) -> str:
+        engine = "" if self.engine is None else f":{self.engine}"
+        return f"{self.puzzle}{engine}@{self.scale:g}"
+
+    @property
+    def solution(self) -> Puzzle:
+        if self.engine is None:
+            return self.puzzle
+        return Puzzle(self.puzzle.day, self.puzzle.part, os.path.join(self.puzzle.directory, f"{self.engine}.py"))
+
+
+@dataclass
+class BenchmarkResult:
+    key: str
+    answer: str | None = None
+    parse_seconds: list[float] = field(default_factory=list)
+    solve_seconds: list[float] = field(default_factory=list)
+    skipped: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.skipped is None and self.error is None and bool(self.solve_seconds)
+
+    @property
+    def total_seconds(self) -> list[float]:
+        return [parse + solve for parse, solve in zip(self.parse_seconds, self.solve_seconds)]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.total_seconds)
+
+    @property
+    def best(self) -> float:
+        return min(self.total_seconds)
+
+    @classmethod
+    def from_json(cls, key: str, values: dict) -> BenchmarkResult:
+        return cls(key, values.get("answer"), values.get("parse_seconds", []), values.get("solve_seconds", []),
+                   values.get("skipped"), values.get("error"))
+
+    def to_json(self) -> dict:
+        values = asdict(self)
+        del values["key"]
+        return values
+
+
+@dataclass(frozen=True)
+class Comparison:
+    key: str
+    verdict: str  # "regressed", "improved", "unchanged", "new" or "answer changed"
+    baseline_median: float | None = None
+    current_median: float | None = None
+
+    @property
+    def failed(self) -> bool:
+        return self.verdict in ("regressed", "answer changed")
+
+    def __str__(self) -> str:
+        if self.baseline_median is None or self.current_median is None:
+            return self.verdict
+        change = self.current_median / self.baseline_median - 1 if self.baseline_median else 0.0
+        return f"{self.verdict} ({change:+.0%} vs baseline)"
+
+
+def measure_benchmark(benchmark: Benchmark, input_path: str, warmup: int, repeats: int,
+                      time_budget: float) -> BenchmarkResult:
+    """ warmup untimed runs then repeats timed ones, stopping early rather than letting another run blow the budget """
+    from handy_dandy_library import parse_cache
+    parse_cache.PARSE_CACHE_ENABLED = False
+
+    result = BenchmarkResult(benchmark.key)
+    try:
+        module = load_module(benchmark.solution)
+    except Exception as error:
+        result.error = f"import failed: {error!r}"
+        return result
+    if not (callable(getattr(module, "parse", None)) and callable(getattr(module, "solve", None))):
+        result.skipped = "no parse/solve hooks"
+        return result
+
+    started = time.perf_counter()
+    for run in range(warmup + repeats):
+        try:
+            model, parse_measurement = measure(module.parse, input_path, trace_memory=False)
+            answer, solve_measurement = measure(module.solve, model, trace_memory=False)
+        except Exception as error:
+            result.error = f"{type(error).__name__}: {error}"
+            return result
+        result.answer = str(answer)
+        run_seconds = parse_measurement.wall_seconds + solve_measurement.wall_seconds
+        last_run = run == warmup + repeats - 1
+        out_of_time = time.perf_counter() - started + run_seconds > time_budget
+        # A warm-up run still counts when it is the only one there is time for
+        if run >= warmup or ((last_run or out_of_time) and not result.solve_seconds):
+            result.parse_seconds.append(parse_measurement.wall_seconds)
+            result.solve_seconds.append(solve_measurement.wall_seconds)
+        if out_of_time:
+            break
+    return result
+
+
+def run_isolated(benchmark: Benchmark, input_path: str, warmup: int, repeats: int, timeout: float) -> BenchmarkResult:
+    """ measure_benchmark in a fresh process, killed once timeout seconds are up """
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        pending = pool.apply_async(measure_benchmark, (benchmark, input_path, warmup, repeats, timeout / 2))
+        try:
+            return pending.get(timeout)
+        except multiprocessing.TimeoutError:
+            return BenchmarkResult(benchmark.key, skipped=f"timed out after {timeout:g}s")
+
+
+def benchmarks_for(puzzles: list[Puzzle], scales: list[float],
+                   engines: dict[str, list[str]] | None = None) -> list[Benchmark]:
+    """ Puzzle by puzzle, smallest scale first, with each puzzle's engine swaps straight after the puzzle itself """
+    engines = engines or {}
+    benchmarks = []
+    for puzzle in puzzles:
+        for engine in [None] + engines.get(str(puzzle), []):
+            benchmarks.extend(Benchmark(puzzle, scale, engine) for scale in sorted(scales))
+    return benchmarks
+
+
+def run_benchmarks(benchmarks: list[Benchmark], seed: int = 0, warmup: int = 1, repeats: int = 5,
+                   timeout: float = 60.0, report=None) -> dict[str, BenchmarkResult]:
+    """
+    Benchmarks for days without an input generator are skipped. Once a puzzle fails or times out at one scale, its
+    larger scales are skipped too, as they could only take longer
+    """
+    results = {}
+    given_up = set()
+    with tempfile.TemporaryDirectory(prefix="aoc_benchmark_") as directory:
+        for benchmark in benchmarks:
+            day, variant = benchmark.puzzle.day, (benchmark.puzzle, benchmark.engine)
+            if day not in GENERATORS:
+                result = BenchmarkResult(benchmark.key, skipped=f"no input generator for day {day}")
+            elif variant in given_up:
+                result = BenchmarkResult(benchmark.key, skipped="a smaller scale already failed or timed out")
+            else:
+                input_path = os.path.join(directory, f"day_{day}_scale_{benchmark.scale:g}_seed_{seed}.txt")
+                if not os.path.exists(input_path):
+                    write_input(day, input_path, benchmark.scale, seed)
+                result = run_isolated(benchmark, input_path, warmup, repeats, timeout)
+                if not result.ok:
+                    given_up.add(variant)
+            results[benchmark.key] = result
+            if report is not None:
+                report(result)
+    return results
+
+
+def compare(results: dict[str, BenchmarkResult], baseline: dict[str, BenchmarkResult],
+            threshold: float = 0.25) -> dict[str, Comparison]:
+    """ A median more than threshold (0.25 is 25%) slower than the baseline's is a regression, as is a new answer """
+    comparisons = {}
+    for key, result in results.items():
+        before = baseline.get(key)
+        if not result.ok:
+            continue
+        if before is None or not before.ok:
+            comparisons[key] = Comparison(key, "new", current_median=result.median)
+            continue
+        if before.answer != result.answer:
+            comparisons[key] = Comparison(key, "answer changed", before.median, result.median)
+            continue
+        difference = result.median - before.median
+        if difference > max(threshold * before.median, NOISE_FLOOR_SECONDS):
+            verdict = "regressed"
+        elif -difference > max(threshold * before.median, NOISE_FLOOR_SECONDS):
+            verdict = "improved"
+        else:
+            verdict = "unchanged"
+        comparisons[key] = Comparison(key, verdict, before.median, result.median)
+    return comparisons
+
+
+def save_results(file_path: str, results: dict[str, BenchmarkResult], settings: dict) -> None:
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "settings": settings,
+        "results": {key: result.to_json() for key, result in results.items()},
+    }
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    with open(file_path, 'w') as file:
+        json.dump(document, file, indent=2)
+        file.write('\n')
+    return None
+
+
+def load_results(file_path: str) -> dict[str, BenchmarkResult]:
+    with open(file_path) as file:
+        document = json.load(file)
+    return {key: BenchmarkResult.from_json(key, values) for key, values in document["results"].items()}
@@ -0,0 +1,89 @@
+import argparse
+import os
+import sys
+
+from aoc.benchmark import (BASELINE_PATH, DEFAULT_SCALES, BenchmarkResult, benchmarks_for, compare, load_results,
+                           run_benchmarks, save_results)
+from aoc.runner import discover_puzzles, select_puzzles, format_seconds
+
+
+def argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc.benchmark",
+                                     description="Time every puzzle over generated inputs and check for regressions")
+    parser.add_argument("selections", nargs="*", metavar="SELECTION",
+                        help="5 (both parts of day 5), 5.2 (day 5 part 2) or 1-5 (days 1 to 5). Default: everything")
+    parser.add_argument("--scales", nargs="+", type=float, default=list(DEFAULT_SCALES), metavar="SCALE",
+                        help="input sizes to generate, 1 being about a real input. Default: %(default)s")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before the timed ones")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per puzzle and scale")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="seconds a puzzle gets per scale before it is killed and its larger scales skipped")
+    parser.add_argument("--engine", action="append", default=[], metavar="PUZZLE=MODULE",
+                        help="also time MODULE from the puzzle's directory as a stand-in solution, "
+                             "e.g. 12.2=day12_solution_from_reddit. Repeatable")
+    parser.add_argument("--output", metavar="FILE", help="write the results here as JSON")
+    parser.add_argument("--baseline", default=BASELINE_PATH, metavar="FILE",
+                        help="results to compare against. Default: %(default)s")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="how much slower the median may get before it counts as a regression. Default: 0.25")
+    return parser
+
+
+def parse_engines(engines: list[str]) -> dict[str, list[str]]:
+    parsed = {}
+    for engine in engines:
+        puzzle, _, module_name = engine.partition('=')
+        if not module_name:
+            raise argparse.ArgumentTypeError(f"--engine takes PUZZLE=MODULE, not {engine!r}")
+        parsed.setdefault(puzzle, []).append(module_name.removesuffix(".py"))
+    return parsed
+
+
+def result_line(result: BenchmarkResult) -> str:
+    if result.skipped is not None:
+        return f"{result.key:<42}  skipped: {result.skipped}"
+    if not result.ok:
+        return f"{result.key:<42}  failed: {result.error}"
+    return (f"{result.key:<42}  {result.answer:>20}  median {format_seconds(result.median)}  "
+            f"best {format_seconds(result.best)}  runs {len(result.total_seconds)}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argument_parser()
+    arguments = parser.parse_args(argv)
+    try:
+        engines = parse_engines(arguments.engine)
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+
+    puzzles = select_puzzles(discover_puzzles(), arguments.selections)
+    benchmarks = benchmarks_for(puzzles, arguments.scales, engines)
+    results = run_benchmarks(benchmarks, arguments.seed, arguments.warmup, arguments.repeats, arguments.timeout,
+                             report=lambda result: print(result_line(result), flush=True))
+
+    settings = {"scales": arguments.scales, "seed": arguments.seed, "warmup": arguments.warmup,
+                "repeats": arguments.repeats, "timeout": arguments.timeout}
+    if arguments.output is not None:
+        save_results(arguments.output, results, settings)
+
+    failed = any(result.error is not None for result in results.values())
+    if os.path.isfile(arguments.baseline) and not arguments.save_baseline:
+        comparisons = compare(results, load_results(arguments.baseline), arguments.threshold)
+        print(f"\nAgainst {arguments.baseline}:")
+        for comparison in comparisons.values():
+            if comparison.verdict != "unchanged":
+                print(f"{comparison.key:<42}  {comparison}")
+        regressions = [comparison for comparison in comparisons.values() if comparison.failed]
+        print(f"{len(regressions)} regressions in {len(comparisons)} benchmarks")
+        failed = failed or bool(regressions)
+
+    if arguments.save_baseline:
+        save_results(arguments.baseline, results, settings)
+        print(f"\nSaved baseline {arguments.baseline}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Synthetic puzzle inputs at any size. Every generator yields the lines of a valid input for its day, drawn from a
+seeded Random so the same (day, scale, seed) always gives the same file.
+
+scale 1 is roughly the size of a real puzzle input, and it multiplies whatever the natural size of that day's input
+is: the line count for line based days, the side length for grids, the node count for graphs.
+"""
+from __future__ import annotations
+
+from random import Random
+from typing import Callable, Iterator
+
+
+type Generator = Callable[[Random, float], Iterator[str]]
+
+GENERATORS: dict[int, Generator] = {}
+
+
+def generator(day: int) -> Callable[[Generator], Generator]:
+    def decorator(function: Generator) -> Generator:
+        GENERATORS[day] = function
+        return function
+    return decorator
+
+
+def scaled(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * scale))
+
+
+def generate_lines(day: int, scale: float = 1.0, seed: int = 0) -> Iterator[str]:
+    if day not in GENERATORS:
+        raise KeyError(f"No input generator for day {day}")
+    # Seeding with the day too keeps the days independent of each other for a shared seed
+    return GENERATORS[day](Random(f"{day}:{seed}"), scale)
+
+
+def write_input(day: int, file_path: str, scale: float = 1.0, seed: int = 0) -> None:
+    with open(file_path, 'w') as file:
+        for line in generate_lines(day, scale, seed):
+            file.write(line)
+            file.write('\n')
+    return None
+
+
+# Registration happens on import, so these come after generator() exists
+from aoc.generators import lines, grids, networks, geometry  # noqa: E402
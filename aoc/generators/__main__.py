@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+
+from aoc.generators import GENERATORS, write_input
+from aoc.runner import discover_puzzles, load_module
+
+
+def argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc.generators",
+                                     description="Write synthetic Advent of Code 2023 inputs at any scale")
+    parser.add_argument("days", nargs="*", type=int, metavar="DAY", help="days to generate. Default: every day")
+    parser.add_argument("--scale", type=float, default=1.0, help="1 is about the size of a real input")
+    parser.add_argument("--seed", type=int, default=0)
+    destination = parser.add_mutually_exclusive_group(required=True)
+    destination.add_argument("--output", metavar="FILE", help="write a single day's input here")
+    destination.add_argument("--directory", metavar="DIR",
+                             help="write each day under its INPUT_FILE_NAME, ready for python -m aoc --inputs DIR")
+    return parser
+
+
+def input_file_names() -> dict[int, str]:
+    """ The first part of each day names the input file that the day's parts share """
+    return {puzzle.day: load_module(puzzle).INPUT_FILE_NAME for puzzle in discover_puzzles() if puzzle.part == 1}
+
+
+def main(argv: list[str] | None = None) -> int:
+    arguments = argument_parser().parse_args(argv)
+    days = arguments.days or sorted(GENERATORS)
+
+    if arguments.output is not None:
+        if len(days) != 1:
+            print("--output takes exactly one day, use --directory for several", file=sys.stderr)
+            return 2
+        write_input(days[0], arguments.output, arguments.scale, arguments.seed)
+        return 0
+
+    os.makedirs(arguments.directory, exist_ok=True)
+    file_names = input_file_names()
+    for day in days:
+        file_path = os.path.join(arguments.directory, file_names[day])
+        write_input(day, file_path, arguments.scale, arguments.seed)
+        print(f"day {day:>2}  {file_path}  {os.path.getsize(file_path)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from random import Random
+from typing import Iterator
+
+from aoc.generators import generator, scaled
+
+
+DIRECTION_CODES = {'R': 0, 'D': 1, 'L': 2, 'U': 3}
+
+
+def distinct_neighbours(random: Random, count: int, low: int, high: int) -> list[int]:
+    """ count values in [low, high] where no two consecutive ones are equal """
+    values = [random.randint(low, high)]
+    while len(values) < count:
+        value = random.randint(low, high)
+        if value != values[-1]:
+            values.append(value)
+    return values
+
+
+def skyline(random: Random, columns: int, longest: int) -> list[tuple[str, int]]:
+    """
+    Dig steps round a simple rectilinear polygon with 4 * columns edges. It is x-monotone: a stepped roof above
+    the x axis, a stepped floor below it, so it can never cross itself
+    """
+    widths = [random.randint(1, longest) for _ in range(columns)]
+    heights = distinct_neighbours(random, columns, 1, longest)
+    depths = distinct_neighbours(random, columns, 1, longest)
+    steps = []
+    for i in range(columns):
+        steps.append(('R', widths[i]))
+        if i < columns - 1:
+            rise = heights[i + 1] - heights[i]
+            steps.append(('U' if rise > 0 else 'D', abs(rise)))
+    steps.append(('D', heights[-1] + depths[-1]))
+    for i in reversed(range(columns)):
+        steps.append(('L', widths[i]))
+        if i > 0:
+            rise = depths[i] - depths[i - 1]
+            steps.append(('U' if rise > 0 else 'D', abs(rise)))
+    steps.append(('U', depths[0] + heights[0]))
+    return steps
+
+
+@generator(18)
+def dig_plan(random: Random, scale: float) -> Iterator[str]:
+    """
+    700 steps per unit scale. The plain steps and the ones hidden in the colours are two separate closed outlines
+    with the same number of edges, the hidden one tens of thousands of times bigger but still within 5 hex digits
+    """
+    columns = scaled(175, scale)
+    for (direction, length), (hidden_direction, hidden_length) in zip(skyline(random, columns, 10),
+                                                                         skyline(random, columns, 500_000)):
+        yield f"{direction} {length} (#{hidden_length:05x}{DIRECTION_CODES[hidden_direction]})"
+
+
+@generator(22)
+def brick_snapshot(random: Random, scale: float) -> Iterator[str]:
+    """ 1200 bricks per unit scale in a 10x10 column, about 8% full, with no two bricks overlapping """
+    n = scaled(1200, scale)
+    height = max(10, 3 * n // 10)
+    occupied = set()
+    placed = 0
+    while placed < n:
+        x, y, z = random.randrange(10), random.randrange(10), random.randint(1, height)
+        axis, length = random.randrange(3), random.randint(1, 5) if random.random() < 0.9 else 1
+        end = [x, y, z]
+        end[axis] = min(end[axis] + length - 1, 9 if axis < 2 else height)
+        cubes = {(i, j, k) for i in range(x, end[0] + 1) for j in range(y, end[1] + 1) for k in range(z, end[2] + 1)}
+        if cubes & occupied:
+            continue
+        occupied |= cubes
+        placed += 1
+        yield f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}"
+
+
+@generator(24)
+def hailstones(random: Random, scale: float) -> Iterator[str]:
+    """
+    300 hailstones per unit scale around part 1's test area. A rock is thrown first and every hailstone is put
+    where it will meet the rock at its own distinct time, so part 2 always has its answer
+    """
+    rock_position = [random.randint(250_000_000_000_000, 350_000_000_000_000) for _ in range(3)]
+    rock_velocity = [random.randint(-100, 100) for _ in range(3)]
+    times = random.sample(range(100_000_000_000, 1_000_000_000_000), scaled(300, scale, minimum=3))
+    for t in times:
+        relative_velocity = [random.choice((-1, 1)) * random.randint(1, 100) for _ in range(3)]
+        velocity = [v + dv for v, dv in zip(rock_velocity, relative_velocity)]
+        position = [p - t * dv for p, dv in zip(rock_position, relative_velocity)]
+        yield f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
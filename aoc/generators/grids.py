@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+from random import Random
+from typing import Iterator
+
+from aoc.generators import generator, scaled
+
+
+def random_grid(random: Random, n: int, m: int, weights: dict[str, float]) -> list[list[str]]:
+    chars, char_weights = list(weights), list(weights.values())
+    return [random.choices(chars, char_weights, k=m) for _ in range(n)]
+
+
+@generator(3)
+def engine_schematic(random: Random, scale: float) -> Iterator[str]:
+    """ 140x140 per unit scale of part numbers and symbols """
+    n = scaled(140, scale, minimum=3)
+    symbols = "*#+$/@%=&-"
+    for _ in range(n):
+        row = []
+        while len(row) < n:
+            roll = random.random()
+            room = n - len(row)
+            if roll < 0.12 and room >= 2:
+                digits = str(random.randint(1, 10 ** min(3, room - 1) - 1))
+                row.extend(digits)
+                row.append('.')  # Numbers never run into the next one
+            elif roll < 0.2:
+                row.append('*' if random.random() < 0.4 else random.choice(symbols))
+            else:
+                row.append('.')
+        yield ''.join(row)
+
+
+def random_tree(random: Random, rows: int, columns: int, size: int) -> dict[tuple[int, int], set[tuple[int, int]]]:
+    """ Randomised Prim's spanning tree over size cells of a rows x columns grid, as cell -> neighbours in the tree """
+    root = (rows // 2, columns // 2)
+    tree = {root: set()}
+    frontier = [(root, neighbour) for neighbour in grid_neighbours(root, rows, columns)]
+    while frontier and len(tree) < size:
+        i = random.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        parent, cell = frontier.pop()
+        if cell in tree:
+            continue
+        tree[cell] = {parent}
+        tree[parent].add(cell)
+        frontier.extend((cell, neighbour) for neighbour in grid_neighbours(cell, rows, columns))
+    return tree
+
+
+def grid_neighbours(cell: tuple[int, int], rows: int, columns: int) -> Iterator[tuple[int, int]]:
+    i, j = cell
+    for neighbour in ((i - 1, j), (i, j + 1), (i + 1, j), (i, j - 1)):
+        if 0 <= neighbour[0] < rows and 0 <= neighbour[1] < columns:
+            yield neighbour
+
+
+# Corner pipes of a 3x3 block, keyed by which of the corner's two block sides have a tree edge through them
+TOP_LEFT = {(True, True): 'J', (True, False): '|', (False, True): '-', (False, False): 'F'}
+TOP_RIGHT = {(True, True): 'L', (True, False): '|', (False, True): '-', (False, False): '7'}
+BOTTOM_LEFT = {(True, True): '7', (True, False): '|', (False, True): '-', (False, False): 'L'}
+BOTTOM_RIGHT = {(True, True): 'F', (True, False): '|', (False, True): '-', (False, False): 'J'}
+
+
+@generator(10)
+def pipe_maze(random: Random, scale: float) -> Iterator[str]:
+    """
+    138x138 per unit scale. The main loop is the outline of a random tree over a grid of 3x3 blocks: each block's
+    ring of pipes opens wherever a tree edge leaves it, so the loop is simple and everything it encloses is the
+    tree's spine. Every other tile is junk pipe, except around S so that S has exactly two connections
+    """
+    blocks = scaled(46, scale)
+    n = 3 * blocks
+    tree = random_tree(random, blocks, blocks, max(1, int(0.6 * blocks * blocks)))
+    grid = random_grid(random, n, n, {'.': 3, '|': 1, '-': 1, 'L': 1, 'J': 1, '7': 1, 'F': 1})
+
+    loop_cells = set()
+    for (i, j), neighbours in tree.items():
+        up, right, down, left = ((i - 1, j) in neighbours, (i, j + 1) in neighbours,
+                                 (i + 1, j) in neighbours, (i, j - 1) in neighbours)
+        top, bottom, west, east = 3 * i, 3 * i + 2, 3 * j, 3 * j + 2
+        pipes = {(top, west): TOP_LEFT[up, left], (top, east): TOP_RIGHT[up, right],
+                 (bottom, west): BOTTOM_LEFT[down, left], (bottom, east): BOTTOM_RIGHT[down, right]}
+        if not up:
+            pipes[top, west + 1] = '-'
+        if not down:
+            pipes[bottom, west + 1] = '-'
+        if not left:
+            pipes[top + 1, west] = '|'
+        if not right:
+            pipes[top + 1, east] = '|'
+        for (row, column), pipe in pipes.items():
+            grid[row][column] = pipe
+            loop_cells.add((row, column))
+
+    def off_loop_neighbours(cell: tuple[int, int]) -> tuple[tuple[int, int], tuple[int, int]]:
+        row, column = cell
+        if grid[row][column] == '-':
+            return (row - 1, column), (row + 1, column)
+        return (row, column - 1), (row, column + 1)
+
+    # S goes on a straight pipe whose other two sides are off the loop, which are then cleared
+    start = random.choice(sorted(cell for cell in loop_cells if grid[cell[0]][cell[1]] in "-|"
+                                 and not loop_cells.intersection(off_loop_neighbours(cell))))
+    for i, j in off_loop_neighbours(start):
+        if 0 <= i < n and 0 <= j < n:
+            grid[i][j] = '.'
+    grid[start[0]][start[1]] = 'S'
+    for row in grid:
+        yield ''.join(row)
+
+
+@generator(11)
+def cosmos(random: Random, scale: float) -> Iterator[str]:
+    """ 140x140 per unit scale, with a few galaxy free rows and columns to expand """
+    n = scaled(140, scale, minimum=2)
+    empty_rows = set(random.sample(range(n), n // 20))
+    empty_columns = set(random.sample(range(n), n // 20))
+    grid = [['#' if random.random() < 0.02 and i not in empty_rows and j not in empty_columns else '.'
+             for j in range(n)] for i in range(n)]
+    # Two galaxies at least, or there are no pairs to measure
+    grid[0][0] = grid[-1][-1] = '#'
+    for row in grid:
+        yield ''.join(row)
+
+
+def reflection_mismatches(rows: list[str]) -> list[int]:
+    """ For each line between rows i and i + 1, how many cells differ from their mirror image across it """
+    return [sum(a != b for k in range(min(i + 1, len(rows) - i - 1)) for a, b in zip(rows[i - k], rows[i + 1 + k]))
+            for i in range(len(rows) - 1)]
+
+
+def is_clean_pattern(rows: list[str]) -> bool:
+    """ Exactly one perfect reflection line and exactly one line that is a single smudge away, over both axes """
+    columns = [''.join(column) for column in zip(*rows)]
+    mismatches = reflection_mismatches(rows) + reflection_mismatches(columns)
+    return mismatches.count(0) == 1 and mismatches.count(1) == 1
+
+
+def mirror_pattern(random: Random) -> list[str]:
+    while True:
+        n, m = random.randint(5, 17), random.randint(5, 17)
+        perfect_dimension, smudge_dimension = random.randint(0, 1), random.randint(0, 1)
+        perfect_line = random.randrange((n, m)[perfect_dimension] - 1)
+        smudge_line = random.randrange((n, m)[smudge_dimension] - 1)
+        if (perfect_dimension, perfect_line) == (smudge_dimension, smudge_line):
+            continue
+
+        # Cells that either reflection forces equal share a union find class, except one smudged pair
+        parents = list(range(n * m))
+
+        def find(x: int) -> int:
+            while parents[x] != x:
+                parents[x] = parents[parents[x]]
+                x = parents[x]
+            return x
+
+        def mirrored_pairs(dimension: int, line: int) -> list[tuple[int, int]]:
+            length = (n, m)[dimension]
+            pairs = []
+            for k in range(min(line + 1, length - line - 1)):
+                a, b = line - k, line + 1 + k
+                for other in range((m, n)[dimension]):
+                    pairs.append((a * m + other, b * m + other) if dimension == 0 else (other * m + a, other * m + b))
+            return pairs
+
+        smudge_pairs = mirrored_pairs(smudge_dimension, smudge_line)
+        smudged = random.choice(smudge_pairs)
+        for a, b in mirrored_pairs(perfect_dimension, perfect_line) + smudge_pairs:
+            if (a, b) != smudged:
+                parents[find(a)] = find(b)
+        if find(smudged[0]) == find(smudged[1]):
+            continue
+
+        values = {}
+        for x in range(n * m):
+            values.setdefault(find(x), random.choice('#.'))
+        values[find(smudged[1])] = '.' if values[find(smudged[0])] == '#' else '#'
+        cells = [values[find(x)] for x in range(n * m)]
+        rows = [''.join(cells[i * m:(i + 1) * m]) for i in range(n)]
+        if is_clean_pattern(rows):
+            return rows
+
+
+@generator(13)
+def mirror_patterns(random: Random, scale: float) -> Iterator[str]:
+    """ 100 patterns per unit scale, each with one reflection line and one line that is off by a single smudge """
+    for i in range(scaled(100, scale)):
+        if i:
+            yield ""
+        yield from mirror_pattern(random)
+
+
+@generator(14)
+def rock_platform(random: Random, scale: float) -> Iterator[str]:
+    """ 100x100 per unit scale of round and cube rocks """
+    n = scaled(100, scale)
+    for row in random_grid(random, n, n, {'.': 0.65, 'O': 0.2, '#': 0.15}):
+        yield ''.join(row)
+
+
+@generator(16)
+def mirror_contraption(random: Random, scale: float) -> Iterator[str]:
+    """ 110x110 per unit scale, mostly empty space between mirrors and splitters """
+    n = scaled(110, scale)
+    for row in random_grid(random, n, n, {'.': 0.9, '/': 0.025, '\\': 0.025, '|': 0.025, '-': 0.025}):
+        yield ''.join(row)
+
+
+@generator(17)
+def heat_loss_map(random: Random, scale: float) -> Iterator[str]:
+    """ 141x141 per unit scale of heat loss digits """
+    n = scaled(141, scale, minimum=2)
+    for _ in range(n):
+        yield ''.join(random.choices("123456789", k=n))
+
+
+@generator(21)
+def garden(random: Random, scale: float) -> Iterator[str]:
+    """
+    131x131 per unit scale, always odd, with S in the centre. The middle row and column and the edges stay clear
+    of rocks, which is what part 2's quadratic extrapolation leans on
+    """
+    n = scaled(65, scale) * 2 + 1
+    middle = n // 2
+    for i in range(n):
+        row = ['#' if random.random() < 0.12 else '.' for _ in range(n)]
+        if i in (0, middle, n - 1):
+            row = ['.'] * n
+        row[0] = row[middle] = row[-1] = '.'
+        if i == middle:
+            row[middle] = 'S'
+        yield ''.join(row)
+
+
+@generator(23)
+def hiking_trails(random: Random, scale: float) -> Iterator[str]:
+    """
+    About 141x141 per unit scale. Trails join a lattice of junctions with slopes on both ends of every trail, all
+    pointing right or down, so part 1's graph is acyclic. Some trails are closed, but every junction keeps a way in
+    and a way out, so they all stay on some start to end path
+    """
+    k = scaled(6, scale, minimum=2)
+    spacings = [random.randint(10, 36) for _ in range(2 * (k - 1))]
+    junction_rows = [random.randint(4, 20)]
+    junction_columns = [1]
+    for spacing in spacings[:k - 1]:
+        junction_rows.append(junction_rows[-1] + spacing)
+    for spacing in spacings[k - 1:]:
+        junction_columns.append(junction_columns[-1] + spacing)
+    n = junction_rows[-1] + random.randint(4, 20) + 1
+    m = junction_columns[-1] + 2
+
+    trails = {((i, j), (i, j + 1)) for i in range(k) for j in range(k - 1)} | \
+             {((i, j), (i + 1, j)) for i in range(k - 1) for j in range(k)}
+    shuffled_trails = sorted(trails)
+    random.shuffle(shuffled_trails)
+    for trail in shuffled_trails:
+        source, target = trail
+        if random.random() < 0.15 and sum(s == source for s, _ in trails) > 1 and \
+                sum(t == target for _, t in trails) > 1:
+            trails.remove(trail)
+
+    grid = [['#'] * m for _ in range(n)]
+    for i in range(junction_rows[0] + 1):
+        grid[i][1] = '.'
+    for i in range(junction_rows[-1], n):
+        grid[i][m - 2] = '.'
+    for (i, j), (i2, j2) in trails:
+        row, column, row2, column2 = junction_rows[i], junction_columns[j], junction_rows[i2], junction_columns[j2]
+        if row == row2:
+            for c in range(column, column2 + 1):
+                grid[row][c] = '.'
+            grid[row][column + 1] = grid[row][column2 - 1] = '>'
+        else:
+            for r in range(row, row2 + 1):
+                grid[r][column] = '.'
+            grid[row + 1][column] = grid[row2 - 1][column] = 'v'
+    for row in grid:
+        yield ''.join(row)
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
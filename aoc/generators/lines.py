@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from random import Random
+from string import ascii_lowercase
+from typing import Iterator
+
+from aoc.generators import generator, scaled
+from handy_dandy_library.string_manipulations import DIGIT_NUMERALS
+
+
+@generator(1)
+def calibration_document(random: Random, scale: float) -> Iterator[str]:
+    """ 1000 lines per unit scale of letters, digits and spelled out digits, always with at least one real digit """
+    for _ in range(scaled(1000, scale)):
+        pieces = [str(random.randint(1, 9))]
+        for _ in range(random.randint(1, 12)):
+            roll = random.random()
+            if roll < 0.25:
+                pieces.append(str(random.randint(1, 9)))
+            elif roll < 0.5:
+                pieces.append(random.choice(DIGIT_NUMERALS))
+            else:
+                pieces.append(''.join(random.choices(ascii_lowercase, k=random.randint(1, 4))))
+        random.shuffle(pieces)
+        yield ''.join(pieces)
+
+
+@generator(2)
+def cube_games(random: Random, scale: float) -> Iterator[str]:
+    """ 100 games per unit scale, each of 1 to 6 rounds """
+    colours = ["red", "green", "blue"]
+    for game_id in range(1, scaled(100, scale) + 1):
+        rounds = []
+        for _ in range(random.randint(1, 6)):
+            round_colours = random.sample(colours, random.randint(1, 3))
+            rounds.append(', '.join(f"{random.randint(1, 20)} {colour}" for colour in round_colours))
+        yield f"Game {game_id}: {'; '.join(rounds)}"
+
+
+@generator(4)
+def scratchcards(random: Random, scale: float) -> Iterator[str]:
+    """
+    200 cards per unit scale with 10 winning numbers and 25 chosen ones. The columns line up on every card, which the
+    solver relies on, and no card wins copies of cards past the end of the table. Fewer than one match per card on
+    average keeps the copy counts from growing exponentially down a long table
+    """
+    n = scaled(200, scale)
+    id_width = len(str(n))
+    for card_id in range(1, n + 1):
+        numbers = random.sample(range(1, 100), 35)
+        winning, others = numbers[:10], numbers[10:]
+        match_count = min(random.choice((0,) * 15 + (1, 1, 2, 3, 10)), n - card_id)
+        chosen = winning[:match_count] + others[:25 - match_count]
+        random.shuffle(chosen)
+        winning_phrase = ' '.join(f"{number:>2}" for number in winning)
+        chosen_phrase = ' '.join(f"{number:>2}" for number in chosen)
+        yield f"Card {card_id:>{id_width}}: {winning_phrase} | {chosen_phrase}"
+
+
+@generator(5)
+def almanac(random: Random, scale: float) -> Iterator[str]:
+    """
+    10 seed ranges and 7 maps of about 30 ranges each per unit scale. Every map shuffles a partition of
+    [0, 2^32) into new places, so source ranges never overlap and neither do destination ranges. Seed ranges are
+    kept short, or together they would cover location 0 and part 2 would always be 0
+    """
+    universe = 2 ** 32
+    seed_pair_count = scaled(10, scale)
+    longest_seed_range = universe // (16 * seed_pair_count)
+    seed_cuts = sorted(random.sample(range(1, universe), 2 * seed_pair_count))
+    seeds = [value for start, end in zip(seed_cuts[::2], seed_cuts[1::2])
+             for value in (start, random.randint(1, min(end - start, longest_seed_range)))]
+    yield "seeds: " + ' '.join(map(str, seeds))
+
+    stages = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    for source_name, destination_name in zip(stages, stages[1:]):
+        yield ""
+        yield f"{source_name}-to-{destination_name} map:"
+        cuts = [0] + sorted(random.sample(range(1, universe), scaled(30, scale) - 1)) + [universe]
+        lengths = [end - start for start, end in zip(cuts, cuts[1:])]
+        destination_order = list(range(len(lengths)))
+        random.shuffle(destination_order)
+        destination_starts = [0] * len(lengths)
+        position = 0
+        for i in destination_order:
+            destination_starts[i] = position
+            position += lengths[i]
+        mappings = list(zip(destination_starts, cuts, lengths))
+        random.shuffle(mappings)
+        for destination_start, source_start, length in mappings:
+            yield f"{destination_start} {source_start} {length}"
+
+
+@generator(6)
+def boat_races(random: Random, scale: float) -> Iterator[str]:
+    """ 4 races per unit scale. Part 2 reads every column as one number, so past ~4 races it outgrows float sqrt """
+    races = scaled(4, scale)
+    times = [random.randint(7, 99) for _ in range(races)]
+    # The best distance is floor(t^2 / 4), keep every record strictly below it so each race can be won
+    records = [random.randint(t, t * t // 4 - 1) for t in times]
+    width = max(len(str(value)) for value in times + records) + 1
+    yield "Time:    " + ''.join(f"{t:>{width}}" for t in times)
+    yield "Distance:" + ''.join(f"{record:>{width}}" for record in records)
+
+
+@generator(7)
+def camel_cards(random: Random, scale: float) -> Iterator[str]:
+    """ 1000 distinct hands per unit scale, capped at the 13^5 hands there are """
+    cards = "23456789TJQKA"
+    n = min(scaled(1000, scale), len(cards) ** 5)
+    hands = set()
+    while len(hands) < n:
+        hands.add(''.join(random.choices(cards, k=5)))
+    hands = sorted(hands)
+    random.shuffle(hands)
+    for hand in hands:
+        yield f"{hand} {random.randint(1, 1000)}"
+
+
+@generator(9)
+def oasis_report(random: Random, scale: float) -> Iterator[str]:
+    """ 200 histories of 21 values per unit scale, each a polynomial of degree at most 19 so differences reach 0 """
+    for _ in range(scaled(200, scale)):
+        degree = random.randint(0, 19)
+        # Grow the sequence from its top-level difference row down, like the puzzle's triangle in reverse
+        row = [random.randint(-9, 9)] * 21
+        for _ in range(degree):
+            value = random.randint(-20, 20)
+            next_row = [value]
+            for difference in row[:-1]:
+                value += difference
+                next_row.append(value)
+            row = next_row
+        yield ' '.join(map(str, row))
+
+
+@generator(12)
+def spring_records(random: Random, scale: float) -> Iterator[str]:
+    """ 1000 rows per unit scale. Rows are drawn from a real arrangement before cells are hidden, so one always fits """
+    for _ in range(scaled(1000, scale)):
+        group_sizes = [random.randint(1, 6) for _ in range(random.randint(1, 6))]
+        springs = []
+        for i, size in enumerate(group_sizes):
+            springs.append('.' * random.randint(1 if i else 0, 3))
+            springs.append('#' * size)
+        springs.append('.' * random.randint(0, 3))
+        row = ''.join(springs)
+        hidden = ''.join('?' if random.random() < 0.5 else char for char in row)
+        yield f"{hidden} {','.join(map(str, group_sizes))}"
+
+
+@generator(15)
+def initialization_sequence(random: Random, scale: float) -> Iterator[str]:
+    """ One line of 4000 steps per unit scale over a pool of labels, so removals often hit lenses that exist """
+    steps = scaled(4000, scale)
+    labels = sorted({''.join(random.choices(ascii_lowercase, k=random.randint(2, 6)))
+                     for _ in range(max(2, steps // 8))})
+    yield ','.join(f"{random.choice(labels)}-" if random.random() < 0.3
+                   else f"{random.choice(labels)}={random.randint(1, 9)}"
+                   for _ in range(steps))
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
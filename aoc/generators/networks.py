@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import math
+
+from collections import defaultdict
+from random import Random
+from string import ascii_lowercase, ascii_uppercase
+from typing import Iterator
+
+from aoc.generators import generator, scaled
+
+
+def unique_names(random: Random, count: int, alphabet: str = ascii_lowercase, length: int = 0,
+                 reserved: set[str] = frozenset()) -> list[str]:
+    """ count distinct random names, all length long. A length of 0 picks the shortest one with room to spare """
+    if length == 0:
+        length = max(2, math.ceil(math.log(4 * (count + len(reserved)), len(alphabet))))
+    names = set()
+    while len(names) < count:
+        name = ''.join(random.choices(alphabet, k=length))
+        if name not in reserved:
+            names.add(name)
+    names = sorted(names)  # Set order varies run to run, the output must not
+    random.shuffle(names)
+    return names
+
+
+def primes_from(start: int, count: int) -> list[int]:
+    primes = []
+    candidate = max(start, 2)
+    while len(primes) < count:
+        if all(candidate % d for d in range(2, math.isqrt(candidate) + 1)):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+@generator(8)
+def haunted_wasteland(random: Random, scale: float) -> Iterator[str]:
+    """
+    6 ghosts per unit scale (at most 20) on the puzzle's structure: each ghost loops through p * L levels of twin
+    nodes, L being the instruction count and p a prime of its own. Either twin leads on to the next level, and only
+    the last instruction of a lap steps onto the ghost's Z node, so ghost i first lands on Z after exactly p_i laps.
+    Node names are 3 letters, which caps the node count, so the instruction count shrinks to fit
+    """
+    ghosts = min(scaled(6, scale), 20)
+    periods = primes_from(7, ghosts)
+    level_name_pool = [a + b + c for a in ascii_uppercase for b in ascii_uppercase for c in ascii_uppercase[1:-1]]
+    most_instructions = min(len(level_name_pool) // (2 * sum(periods)), scaled(73, scale))
+    instruction_count = max(p for p in primes_from(2, 200) if p <= max(2, most_instructions))
+    instructions = ''.join(random.choices("LR", k=instruction_count))
+
+    prefixes = ["AA"] + unique_names(random, ghosts - 1, ascii_uppercase, 2, reserved={"AA", "ZZ"})
+    level_names = iter(random.sample(level_name_pool, 2 * sum(periods) * instruction_count))
+
+    nodes = []
+    for prefix, period in zip(prefixes, periods):
+        levels = period * instruction_count
+        start, end = prefix + 'A', ("ZZ" if prefix == "AA" else prefix) + 'Z'
+        twins = [(start, end)] + [(next(level_names), next(level_names)) for _ in range(1, levels)]
+        for level, names in enumerate(twins):
+            following = twins[(level + 1) % levels]
+            if level == levels - 1:
+                # The last step of every lap reads the last instruction, and only that side reaches the Z node
+                left, right = (end, start) if instructions[-1] == 'L' else (start, end)
+            else:
+                left, right = random.sample(following, 2)
+            nodes.extend(f"{name} = ({left}, {right})" for name in names)
+
+    yield instructions
+    yield ""
+    random.shuffle(nodes)
+    yield from nodes
+
+
+@generator(19)
+def part_workflows(random: Random, scale: float) -> Iterator[str]:
+    """ A tree of 550 workflows and 200 parts per unit scale. Workflows only ever send parts deeper, so none loop """
+    workflow_count = scaled(550, scale)
+    names = iter(unique_names(random, workflow_count, reserved={"in"}))
+    pending = ["in"]
+    created = 1
+    workflows = []
+    while pending:
+        name = pending.pop(random.randrange(len(pending)))
+        targets = []
+        for _ in range(random.randint(2, 4)):
+            if created < workflow_count and (random.random() < 0.6 or not pending):
+                target = next(names)
+                pending.append(target)
+                created += 1
+            else:
+                target = random.choice("AR")
+            targets.append(target)
+        rules = [f"{random.choice('xmas')}{random.choice('<>')}{random.randint(1, 4000)}:{target}"
+                 for target in targets[:-1]]
+        workflows.append(f"{name}{{{','.join(rules + targets[-1:])}}}")
+
+    random.shuffle(workflows)
+    yield from workflows
+    yield ""
+    for _ in range(scaled(200, scale)):
+        yield "{" + ','.join(f"{category}={random.randint(1, 4000)}" for category in "xmas") + "}"
+
+
+@generator(20)
+def pulse_network(random: Random, scale: float) -> Iterator[str]:
+    """
+    4 twelve bit counters per unit scale (never fewer, part 2 looks for 4 by name), built like the puzzle's.
+    Each counter is a chain of flip flops whose hub conjunction resets it on reaching a prime, and the hub's
+    inverter feeds the conjunction in front of rx. The first four inverters are the ones part 2 watches
+    """
+    counters = scaled(4, scale, minimum=4)
+    watched = ["mp", "qt", "qb", "ng"]
+    reserved = set(watched) | {"rx", "in"}
+    names = iter(unique_names(random, counters * 13 + 1, reserved=reserved))
+    final = next(names)
+    periods = random.sample([p for p in primes_from(3001, 150) if p < 4096], counters)
+
+    modules = []
+    first_flip_flops = []
+    for counter, period in enumerate(periods):
+        inverter = watched[counter] if counter < len(watched) else next(names)
+        hub = next(names)
+        flip_flops = [next(names) for _ in range(12)]
+        first_flip_flops.append(flip_flops[0])
+        hub_destinations = [inverter]
+        for bit, flip_flop in enumerate(flip_flops):
+            destinations = flip_flops[bit + 1:bit + 2]
+            if period >> bit & 1:
+                destinations.append(hub)
+            if not period >> bit & 1 or bit == 0:
+                hub_destinations.append(flip_flop)
+            random.shuffle(destinations)
+            modules.append(f"%{flip_flop} -> {', '.join(destinations)}")
+        random.shuffle(hub_destinations)
+        modules.append(f"&{hub} -> {', '.join(hub_destinations)}")
+        modules.append(f"&{inverter} -> {final}")
+    modules.append(f"&{final} -> rx")
+    modules.append(f"broadcaster -> {', '.join(first_flip_flops)}")
+    random.shuffle(modules)
+    yield from modules
+
+
+@generator(25)
+def wiring_diagram(random: Random, scale: float) -> Iterator[str]:
+    """
+    1500 components per unit scale in two halves joined by exactly 3 wires. Inside a half, every component is wired
+    to the next two round a ring plus a few random others, so no cut smaller than 4 wires splits a half
+    """
+    n = scaled(1500, scale, minimum=10)
+    names = unique_names(random, n)
+    first_half = random.randint(n // 3, 2 * n // 3)
+    edges = set()
+    for members in (names[:first_half], names[first_half:]):
+        size = len(members)
+        for i, member in enumerate(members):
+            edges.add(frozenset((member, members[(i + 1) % size])))
+            edges.add(frozenset((member, members[(i + 2) % size])))
+            for _ in range(random.randint(0, 2)):
+                other = random.choice(members)
+                if other != member:
+                    edges.add(frozenset((member, other)))
+    for left, right in zip(random.sample(names[:first_half], 3), random.sample(names[first_half:], 3)):
+        edges.add(frozenset((left, right)))
+
+    wires = defaultdict(list)
+    for edge in sorted(tuple(sorted(edge)) for edge in edges):
+        source, target = random.sample(edge, 2)
+        wires[source].append(target)
+    sources = list(wires)
+    random.shuffle(sources)
+    for source in sources:
+        yield f"{source}: {' '.join(wires[source])}"
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import os
+import pstats
+import signal
+import tracemalloc
+
+from collections import Counter
+from types import FrameType
+
+
+DEFAULT_PROFILE_DIRECTORY = "profiles"
+SUMMARY_LENGTH = 10
+
+
+class Profiler:
+    """ Context manager around a puzzle's parse and solve. After it exits, dump() writes it out and summary() reads """
+    name = ""
+    suffix = ""
+
+    def __enter__(self) -> Profiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.stop()
+        return None
+
+    def start(self) -> None:
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        raise NotImplementedError
+
+    def dump(self, file_path: str) -> None:
+        raise NotImplementedError
+
+    def summary(self) -> str:
+        raise NotImplementedError
+
+
+class CallProfiler(Profiler):
+    """ Deterministic cProfile, written as pstats so snakeviz or python -m pstats can open it """
+    name = "cprofile"
+    suffix = "prof"
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self.profile.enable()
+        return None
+
+    def stop(self) -> None:
+        self.profile.disable()
+        return None
+
+    def dump(self, file_path: str) -> None:
+        self.profile.dump_stats(file_path)
+        return None
+
+    def summary(self) -> str:
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(SUMMARY_LENGTH)
+        # Skip pstats' preamble down to the table itself
+        lines = stream.getvalue().splitlines()
+        start = next((i for i, line in enumerate(lines) if line.lstrip().startswith("ncalls")), 0)
+        return '\n'.join(line for line in lines[start:] if line.strip())
+
+
+class AllocationProfiler(Profiler):
+    """ tracemalloc snapshot by source line of what is still allocated once solve returns, the parsed model included """
+    name = "tracemalloc"
+    suffix = "tracemalloc"
+    FRAMES = 25
+
+    def __init__(self):
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.started_tracing = False
+
+    def start(self) -> None:
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start(self.FRAMES)
+        return None
+
+    def stop(self) -> None:
+        self.snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        if self.started_tracing:
+            tracemalloc.stop()
+        return None
+
+    def dump(self, file_path: str) -> None:
+        self.snapshot.dump(file_path)
+        return None
+
+    def summary(self) -> str:
+        lines = ["  allocated        blocks  where"]
+        for statistic in self.snapshot.statistics("lineno")[:SUMMARY_LENGTH]:
+            frame = statistic.traceback[0]
+            lines.append(f"{statistic.size / 1024:10.1f}KiB {statistic.count:>8} blocks  {frame.filename}:{frame.lineno}")
+        return '\n'.join(lines)
+
+
+class SamplingProfiler(Profiler):
+    """
+    Statistical profiler on a CPU time interval timer: every interval the signal handler records the running stack.
+    Costs little however hot the loop, unlike cProfile's per call hook, but only works in a process's main thread on
+    systems with setitimer. Dumps collapsed stacks, the input flamegraph.pl and speedscope take
+    """
+    name = "sample"
+    suffix = "stacks"
+    INTERVAL_SECONDS = 0.001
+
+    def __init__(self):
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("sampling needs signal.setitimer, which this platform lacks")
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.previous_handler = None
+
+    @staticmethod
+    def frame_name(frame: FrameType) -> str:
+        code = frame.f_code
+        return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def sample(self, _signal_number: int, frame: FrameType | None) -> None:
+        stack = []
+        while frame is not None:
+            stack.append(self.frame_name(frame))
+            frame = frame.f_back
+        self.stacks[tuple(reversed(stack))] += 1
+        return None
+
+    def start(self) -> None:
+        self.previous_handler = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.INTERVAL_SECONDS, self.INTERVAL_SECONDS)
+        return None
+
+    def stop(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self.previous_handler)
+        # The frames above the profiled call (runner, argparse, __main__) are the same in every sample
+        common = os.path.commonprefix(list(self.stacks))
+        trimmed = Counter()
+        for stack, count in self.stacks.items():
+            trimmed[stack[max(len(common) - 1, 0):]] += count
+        self.stacks = trimmed
+        return None
+
+    def dump(self, file_path: str) -> None:
+        with open(file_path, 'w') as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{';'.join(stack)} {count}\n")
+        return None
+
+    def summary(self) -> str:
+        total = sum(self.stacks.values())
+        if total == 0:
+            return "no samples, the puzzle ran for less than one interval"
+        own, inclusive = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for name in set(stack):
+                inclusive[name] += count
+        lines = [f"{total} samples at {self.INTERVAL_SECONDS * 1e3:g}ms     own  inclusive"]
+        for name, count in own.most_common(SUMMARY_LENGTH):
+            lines.append(f"{count / total:>36.1%} {inclusive[name] / total:>10.1%}  {name}")
+        return '\n'.join(lines)
+
+
+PROFILERS: dict[str, type[Profiler]] = {profiler.name: profiler
+                                        for profiler in (CallProfiler, AllocationProfiler, SamplingProfiler)}
+
+
+def profile_file_path(directory: str, day: int, part: int, profiler: Profiler) -> str:
+    return os.path.join(directory, f"day{day:02}_part{part}.{profiler.suffix}")
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import importlib
+import json
+import math
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable, Iterable
+
+from aoc.answers import AnswerStore
+from aoc.profiling import DEFAULT_PROFILE_DIRECTORY, PROFILERS, profile_file_path
+from aoc.session import ParseSession
+from handy_dandy_library.instrumentation import INSTRUMENTATION
+from handy_dandy_library.parse_cache import DEFAULT_CACHE_DIRECTORY
+
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOLUTIONS_DIRECTORY = os.path.join(REPOSITORY_DIRECTORY, "solutions")
+TIMINGS_PATH = os.path.join(DEFAULT_CACHE_DIRECTORY, "timings.json")
+PUZZLE_FILE_PATTERN = re.compile(r"^day_?(\d+)_(\d+)\.py$")
+PHASES = ("parse", "solve", "output")
+
+
+@dataclass(frozen=True, order=True)
+class Puzzle:
+    day: int
+    part: int
+    file_path: str = field(compare=False)
+
+    def __str__(self) -> str:
+        return f"{self.day}.{self.part}"
+
+    @property
+    def module_name(self) -> str:
+        return os.path.splitext(os.path.basename(self.file_path))[0]
+
+    @property
+    def directory(self) -> str:
+        return os.path.dirname(self.file_path)
+
+
+@dataclass(frozen=True)
+class PhaseMeasurement:
+    wall_seconds: float
+    cpu_seconds: float
+    peak_bytes: int | None = None  # None when memory tracing was off
+
+    def __str__(self) -> str:
+        peak = "-" if self.peak_bytes is None else format_bytes(self.peak_bytes)
+        return f"{format_seconds(self.wall_seconds)} wall {format_seconds(self.cpu_seconds)} cpu {peak:>9} peak"
+
+
+@dataclass
+class PuzzleRun:
+    puzzle: Puzzle
+    input_path: str | None = None
+    answer: str | None = None
+    phases: dict[str, PhaseMeasurement] = field(default_factory=dict)
+    skipped: str | None = None
+    error: str | None = None
+    profile_path: str | None = None
+    profile_summary: str | None = None
+    counters: dict[str, int | float] = field(default_factory=dict)
+    parse_reused: bool = False  # The model came from an earlier part's parse in the same session
+    answer_stored: bool = False  # The answer and phases are an earlier run's, taken from the answer store
+
+    @property
+    def ok(self) -> bool:
+        return self.skipped is None and self.error is None
+
+    @property
+    def wall_seconds(self) -> float:
+        return sum(measurement.wall_seconds for measurement in self.phases.values())
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:7.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:7.1f}ms"
+    return f"{seconds:7.2f}s "
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def discover_puzzles(solutions_directory: str = SOLUTIONS_DIRECTORY) -> list[Puzzle]:
+    """ Every solutions/dayN/dayN_P.py (or day_N_P.py), ordered by day then part """
+    puzzles = []
+    for directory_path, _, file_names in os.walk(solutions_directory):
+        for file_name in file_names:
+            match = PUZZLE_FILE_PATTERN.match(file_name)
+            if match:
+                day, part = int(match.group(1)), int(match.group(2))
+                puzzles.append(Puzzle(day, part, os.path.join(directory_path, file_name)))
+    return sorted(puzzles)
+
+
+def parse_selection(selection: str) -> Callable[[Puzzle], bool]:
+    """ "5" is every part of day 5, "5.2" only part 2, "1-5" days 1 to 5 inclusive """
+    if '-' in selection:
+        first, last = (int(day) for day in selection.split('-', 1))
+        return lambda puzzle: first <= puzzle.day <= last
+    if '.' in selection:
+        day, part = (int(x) for x in selection.split('.', 1))
+        return lambda puzzle: (puzzle.day, puzzle.part) == (day, part)
+    day = int(selection)
+    return lambda puzzle: puzzle.day == day
+
+
+def select_puzzles(puzzles: Iterable[Puzzle], selections: Iterable[str]) -> list[Puzzle]:
+    predicates = [parse_selection(selection) for selection in selections]
+    if not predicates:
+        return list(puzzles)
+    return [puzzle for puzzle in puzzles if any(predicate(puzzle) for predicate in predicates)]
+
+
+def load_module(puzzle: Puzzle) -> ModuleType:
+    """ Parts import their siblings by bare module name (from day2_1 import Game), so the day directory goes on sys.path """
+    for directory in (REPOSITORY_DIRECTORY, puzzle.directory):
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+    return importlib.import_module(puzzle.module_name)
+
+
+def resolve_input_path(puzzle: Puzzle, module: ModuleType, input_path: str | None = None,
+                       inputs_directory: str | None = None) -> str | None:
+    """ An explicit input_path wins, then INPUT_FILE_NAME looked up in inputs_directory or next to the solution """
+    if input_path is not None:
+        return input_path
+    input_file_name = getattr(module, "INPUT_FILE_NAME", None)
+    if input_file_name is None:
+        return None
+    return os.path.join(inputs_directory or puzzle.directory, input_file_name)
+
+
+def measure(function: Callable, *args: Any, trace_memory: bool = True) -> (Any, PhaseMeasurement):
+    """ Calls function(*args), timing it and recording the peak traced allocation above what was live beforehand """
+    if trace_memory:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    result = function(*args)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    peak_bytes = None
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        peak_bytes = max(peak - baseline, 0)
+    return result, PhaseMeasurement(wall, cpu, peak_bytes)
+
+
+def run_puzzle(puzzle: Puzzle, input_path: str | None = None, inputs_directory: str | None = None,
+               trace_memory: bool = True, profiler_name: str | None = None,
+               profile_directory: str = DEFAULT_PROFILE_DIRECTORY, collect_counters: bool = False,
+               session: ParseSession | None = None, answers: AnswerStore | None = None) -> PuzzleRun:
+    """
+    profiler_name picks one of aoc.profiling.PROFILERS to wrap parse, solve and output in. None costs nothing.
+    collect_counters turns on the solutions' instrumentation counters and keeps what they counted in run.counters.
+    With a session, a model an earlier part already parsed from the same input is reused instead of parsed again.
+    With answers, an answer stored for the same input and solver code is returned without running anything, unless
+    profiling or counting asks for a real run, and a fresh answer is stored
+    """
+    run = PuzzleRun(puzzle)
+    try:
+        module = load_module(puzzle)
+    except Exception as error:
+        run.error = f"import failed: {error!r}"
+        return run
+
+    if not (callable(getattr(module, "parse", None)) and callable(getattr(module, "solve", None))):
+        run.skipped = "no parse/solve hooks"
+        return run
+    run.input_path = resolve_input_path(puzzle, module, input_path, inputs_directory)
+    if run.input_path is None:
+        run.skipped = "no INPUT_FILE_NAME"
+        return run
+    if not os.path.isfile(run.input_path):
+        run.skipped = f"missing input {run.input_path}"
+        return run
+    use_answers = answers is not None and profiler_name is None and not collect_counters
+    if use_answers and restore_answer(run, answers):
+        return run
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler = PROFILERS[profiler_name]() if profiler_name is not None else None
+    if collect_counters:
+        INSTRUMENTATION.enabled = True
+        INSTRUMENTATION.reset()
+    try:
+        if profiler is None:
+            measure_phases(run, module, trace_memory, session)
+        else:
+            with profiler:
+                # Holding on to the model until the profiler stops lets an allocation snapshot still see it
+                model = measure_phases(run, module, trace_memory, session)
+    except Exception as error:
+        run.error = f"{type(error).__name__}: {error}"
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    if collect_counters:
+        run.counters = INSTRUMENTATION.snapshot()
+    if profiler is not None:
+        os.makedirs(profile_directory, exist_ok=True)
+        run.profile_path = profile_file_path(profile_directory, puzzle.day, puzzle.part, profiler)
+        profiler.dump(run.profile_path)
+        run.profile_summary = profiler.summary()
+    if use_answers and run.ok:
+        answers.put(puzzle.day, puzzle.part, puzzle.directory, run.input_path, run.answer,
+                    {phase: (measurement.wall_seconds, measurement.cpu_seconds)
+                     for phase, measurement in run.phases.items()})
+    return run
+
+
+def restore_answer(run: PuzzleRun, answers: AnswerStore) -> bool:
+    stored = answers.get(run.puzzle.day, run.puzzle.part, run.puzzle.directory, run.input_path)
+    if stored is None:
+        return False
+    run.answer = stored.answer
+    run.phases = {phase: PhaseMeasurement(wall, cpu) for phase, (wall, cpu) in stored.phase_seconds.items()}
+    run.answer_stored = True
+    return True
+
+
+def measure_phases(run: PuzzleRun, module: ModuleType, trace_memory: bool, session: ParseSession | None = None) -> Any:
+    """ Fills in run's phases and answer, returning the parsed model """
+    if session is None:
+        model, run.phases["parse"] = measure(module.parse, run.input_path, trace_memory=trace_memory)
+    else:
+        run.parse_reused = (run.input_path, module.parse) in session
+        model, run.phases["parse"] = measure(session.parsed, module.parse, run.input_path, trace_memory=trace_memory)
+    answer, run.phases["solve"] = measure(module.solve, model, trace_memory=trace_memory)
+    run.answer, run.phases["output"] = measure(str, answer, trace_memory=trace_memory)
+    return model
+
+
+def load_timings(file_path: str = TIMINGS_PATH) -> dict[str, float]:
+    """ Wall seconds each puzzle took on its last successful run, keyed like "5.2" """
+    try:
+        with open(file_path) as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_timings(runs: Iterable[PuzzleRun], file_path: str = TIMINGS_PATH) -> None:
+    timings = load_timings(file_path)
+    timings.update({str(run.puzzle): run.wall_seconds for run in runs if run.ok})
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    temporary_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'w') as file:
+        json.dump(timings, file, indent=2, sort_keys=True)
+    os.replace(temporary_path, file_path)
+    return None
+
+
+def by_day(puzzles: Iterable[Puzzle]) -> list[list[Puzzle]]:
+    days = {}
+    for puzzle in puzzles:
+        days.setdefault(puzzle.day, []).append(puzzle)
+    return list(days.values())
+
+
+def longest_first(days: Iterable[list[Puzzle]], timings: dict[str, float]) -> list[list[Puzzle]]:
+    """ Days by the time all their selected parts took together. Days never timed go first, any could be the longest """
+    return sorted(days, key=lambda puzzles: -sum(timings.get(str(puzzle), math.inf) for puzzle in puzzles))
+
+
+def run_day(puzzles: list[Puzzle], input_path: str | None = None, inputs_directory: str | None = None,
+            trace_memory: bool = True, profiler_name: str | None = None,
+            profile_directory: str = DEFAULT_PROFILE_DIRECTORY, collect_counters: bool = False,
+            share_parses: bool = True, report: Callable[[PuzzleRun], None] | None = None,
+            answers: AnswerStore | None = None) -> list[PuzzleRun]:
+    """ One day's parts in order, sharing one parse session between them unless share_parses is off """
+    session = ParseSession() if share_parses else None
+    runs = []
+    for puzzle in puzzles:
+        run = run_puzzle(puzzle, input_path, inputs_directory, trace_memory, profiler_name, profile_directory,
+                         collect_counters, session, answers)
+        if report is not None:
+            report(run)
+        runs.append(run)
+    return runs
+
+
+def run_parallel(puzzles: list[Puzzle], jobs: int, input_path: str | None = None,
+                 inputs_directory: str | None = None, trace_memory: bool = True,
+                 timings: dict[str, float] | None = None,
+                 report: Callable[[PuzzleRun], None] | None = None, profiler_name: str | None = None,
+                 profile_directory: str = DEFAULT_PROFILE_DIRECTORY,
+                 collect_counters: bool = False, share_parses: bool = True,
+                 answers: AnswerStore | None = None) -> list[PuzzleRun]:
+    """
+    Runs the puzzles across jobs worker processes a day at a time, so a day's parts can share their parse. The
+    longest days are submitted first so that no long day starts last and holds up the finish. report sees the runs
+    in puzzles' order as soon as every earlier one is done too
+    """
+    runs = {}
+    reported = 0
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(run_day, day, input_path, inputs_directory, trace_memory, profiler_name,
+                                   profile_directory, collect_counters, share_parses, None, answers): day
+                   for day in longest_first(by_day(puzzles), timings or {})}
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                runs.update(zip(day, future.result()))
+            except Exception as error:
+                # The worker itself died, e.g. killed for memory, rather than the solution raising
+                runs.update((puzzle, PuzzleRun(puzzle, error=f"worker failed: {type(error).__name__}: {error}"))
+                            for puzzle in day)
+            while reported < len(puzzles) and puzzles[reported] in runs:
+                if report is not None:
+                    report(runs[puzzles[reported]])
+                reported += 1
+    return [runs[puzzle] for puzzle in puzzles]
+
+
+def report_line(run: PuzzleRun) -> str:
+    header = f"day {run.puzzle.day:>2} part {run.puzzle.part}"
+    if run.skipped is not None:
+        return f"{header}  skipped: {run.skipped}"
+    if run.error is not None:
+        return f"{header}  failed: {run.error}"
+    if run.answer_stored:
+        return f"{header}  {run.answer:>20}  | stored answer, solved in {format_seconds(run.wall_seconds)} wall"
+    phases = [f"{phase} {run.phases[phase]}" for phase in PHASES]
+    if run.parse_reused:
+        phases[0] = f"parse {'reused':<{len(str(run.phases['parse']))}}"
+    phases = " | ".join(phases)
+    return f"{header}  {run.answer:>20}  | {phases}"
+
+
+def totals_line(runs: list[PuzzleRun], elapsed_seconds: float | None = None) -> str:
+    completed = [run for run in runs if run.ok and not run.answer_stored]
+    stored_count = sum(run.answer_stored for run in runs)
+    totals = []
+    for phase in PHASES:
+        wall = sum(run.phases[phase].wall_seconds for run in completed)
+        cpu = sum(run.phases[phase].cpu_seconds for run in completed)
+        totals.append(f"{phase} {format_seconds(wall)} wall {format_seconds(cpu)} cpu")
+    elapsed = "" if elapsed_seconds is None else f" | elapsed {format_seconds(elapsed_seconds)}"
+    stored = f", {stored_count} stored" if stored_count else ""
+    return f"{len(completed)}/{len(runs)} puzzles ran{stored}  | " + " | ".join(totals) + elapsed
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
@@ -0,0 +1,241 @@
+"""
+A long running solver process that keeps imported modules and parsed models, and with them the memo tables models
+hold, between queries, so asking the same puzzle again (another expansion rate, another step count) costs only the
+solve rather than interpreter start-up, imports and a parse.
+
+Clients talk to it over a Unix socket, one JSON object per line each way:
+
+    {"op": "solve", "day": 21, "part": 1, "input": "day21.txt", "parameters": {"steps": 200}}
+    {"ok": true, "answer": "...", "solve_seconds": 0.0004, "parse_reused": true}
+
+A relative "input" is looked up in the server's inputs directory and a missing one means the module's INPUT_FILE_NAME.
+"parameters" are passed to solve as keyword arguments. The other ops are "ping", "stats" and "forget", which drops
+every parsed model. Any number of clients may be connected at once, but solves run one at a time on a single worker
+thread, as the models' memo tables are not safe to grow from two threads together.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import os
+import signal
+import socket
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc.runner import Puzzle, discover_puzzles, load_module, resolve_input_path
+from handy_dandy_library.parse_cache import DEFAULT_CACHE_DIRECTORY
+
+
+DEFAULT_SOCKET_PATH = os.path.join(DEFAULT_CACHE_DIRECTORY, "aoc.sock")
+OPERATIONS = ("solve", "ping", "stats", "forget")
+
+
+class RequestError(Exception):
+    """ A request the server cannot answer, reported back to the client rather than raised """
+
+
+@dataclass
+class ServerStats:
+    requests: int = 0
+    solves: int = 0
+    parses: int = 0
+    parses_reused: int = 0
+    errors: int = 0
+    solve_seconds: float = 0.0
+
+
+class SolverServer:
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, inputs_directory: str | None = None,
+                 solutions_directory: str | None = None):
+        self.socket_path = socket_path
+        self.inputs_directory = inputs_directory
+        puzzles = discover_puzzles() if solutions_directory is None else discover_puzzles(solutions_directory)
+        self.puzzles: dict[tuple[int, int], Puzzle] = {(puzzle.day, puzzle.part): puzzle for puzzle in puzzles}
+        self.modules: dict[Puzzle, ModuleType] = {}
+        # Keyed by the input's real path and modification time as well as parse, so an edited input is parsed afresh.
+        # Values are futures so that concurrent requests for one model share a single parse
+        self.models: dict[tuple[str, int, Callable], asyncio.Future] = {}
+        self.stats = ServerStats()
+        self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aoc-solver")
+        self.server: asyncio.AbstractServer | None = None
+
+    def __repr__(self) -> str:
+        return f"SolverServer({self.socket_path!r}, {len(self.modules)} modules, {len(self.models)} models)"
+
+    async def start(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.socket_path))
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.socket_path):
+            if is_listening(self.socket_path):
+                raise RuntimeError(f"a server is already listening on {self.socket_path}")
+            os.remove(self.socket_path)  # Left behind by a server that did not shut down cleanly
+        self.server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path)
+        return None
+
+    async def serve_forever(self) -> None:
+        if self.server is None:
+            await self.start()
+        # A terminated server still closes properly, taking its socket file with it
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            await self.server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self.close()
+        return None
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        self.worker.shutdown(wait=False, cancel_futures=True)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        return None
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                response = await self.respond(line)
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+        return None
+
+    async def respond(self, line: bytes) -> dict[str, Any]:
+        self.stats.requests += 1
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError("a request is a JSON object")
+            return {"ok": True, **await self.dispatch(request)}
+        except (RequestError, json.JSONDecodeError) as error:
+            self.stats.errors += 1
+            return {"ok": False, "error": str(error)}
+        except Exception as error:
+            self.stats.errors += 1
+            return {"ok": False, "error": f"{type(error).__name__}: {error}"}
+
+    async def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        operation = request.get("op", "solve")
+        if operation == "ping":
+            return {}
+        if operation == "stats":
+            return {"stats": asdict(self.stats), "modules": len(self.modules), "models": len(self.models)}
+        if operation == "forget":
+            forgotten = len(self.models)
+            self.models.clear()
+            return {"forgotten": forgotten}
+        if operation == "solve":
+            return await self.solve(request)
+        raise RequestError(f"unknown op {operation!r}, expected one of {', '.join(OPERATIONS)}")
+
+    async def solve(self, request: dict[str, Any]) -> dict[str, Any]:
+        try:
+            puzzle = self.puzzles[(int(request["day"]), int(request["part"]))]
+        except KeyError:
+            raise RequestError(f"no puzzle for day {request.get('day')} part {request.get('part')}")
+        except (TypeError, ValueError):
+            raise RequestError("day and part must be whole numbers")
+        parameters = request.get("parameters") or {}
+        if not isinstance(parameters, dict):
+            raise RequestError("parameters must be a JSON object of solve's keyword arguments")
+
+        loop = asyncio.get_running_loop()
+        module = await self.module(puzzle)
+        input_path = self.input_path(puzzle, module, request.get("input"))
+        try:
+            inspect.signature(module.solve).bind(None, **parameters)
+        except TypeError as error:
+            raise RequestError(f"day {puzzle} solve does not take those parameters: {error}")
+        model, parse_reused = await self.model(module.parse, input_path)
+
+        def timed_solve() -> (Any, float):
+            started = time.perf_counter()
+            answer = module.solve(model, **parameters)
+            return answer, time.perf_counter() - started
+
+        answer, solve_seconds = await loop.run_in_executor(self.worker, timed_solve)
+        self.stats.solves += 1
+        self.stats.solve_seconds += solve_seconds
+        return {"answer": str(answer), "solve_seconds": solve_seconds, "parse_reused": parse_reused}
+
+    async def module(self, puzzle: Puzzle) -> ModuleType:
+        if puzzle not in self.modules:
+            # Imports run on the worker too, as solution modules may do real work at import time
+            module = await asyncio.get_running_loop().run_in_executor(self.worker, load_module, puzzle)
+            if not (callable(getattr(module, "parse", None)) and callable(getattr(module, "solve", None))):
+                raise RequestError(f"day {puzzle} has no parse/solve hooks")
+            self.modules[puzzle] = module
+        return self.modules[puzzle]
+
+    def input_path(self, puzzle: Puzzle, module: ModuleType, requested: str | None) -> str:
+        if requested is not None and not os.path.isabs(requested) and self.inputs_directory is not None:
+            requested = os.path.join(self.inputs_directory, requested)
+        input_path = resolve_input_path(puzzle, module, requested, self.inputs_directory)
+        if input_path is None or not os.path.isfile(input_path):
+            raise RequestError(f"no input file {input_path!r} for day {puzzle}")
+        return input_path
+
+    async def model(self, parse: Callable[[str], Any], input_path: str) -> (Any, bool):
+        real_path = os.path.realpath(input_path)
+        modified = os.stat(real_path).st_mtime_ns
+        key = (real_path, modified, parse)
+        pending = self.models.get(key)
+        if pending is not None:
+            self.stats.parses_reused += 1
+            return await asyncio.shield(pending), True
+
+        for stale in [other for other in self.models if other[0] == real_path and other[2] is parse]:
+            del self.models[stale]
+        loop = asyncio.get_running_loop()
+        pending = self.models[key] = loop.run_in_executor(self.worker, parse, real_path)
+        try:
+            model = await asyncio.shield(pending)
+        except Exception:
+            self.models.pop(key, None)
+            raise
+        self.stats.parses += 1
+        return model, False
+
+
+def is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def query(request: dict[str, Any], socket_path: str = DEFAULT_SOCKET_PATH, timeout: float | None = None) -> dict:
+    """ Sends one request to a running server and waits for its response """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(socket_path)
+        connection.sendall(json.dumps(request).encode() + b'\n')
+        with connection.makefile('rb') as responses:
+            line = responses.readline()
+    if not line:
+        raise ConnectionError(f"the server on {socket_path} closed the connection without answering")
+    return json.loads(line)
+
+
+def serve(socket_path: str = DEFAULT_SOCKET_PATH, inputs_directory: str | None = None) -> None:
+    server = SolverServer(socket_path, inputs_directory)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return None
@@ -0,0 +1,74 @@
+import argparse
+import json
+import sys
+
+from aoc.server import DEFAULT_SOCKET_PATH, OPERATIONS, query, serve
+
+
+def argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc.server",
+                                     description="Keep parsed puzzles in memory and answer queries over a Unix socket")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, metavar="PATH",
+                        help="the Unix socket to listen or connect on. Default: %(default)s")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_command = commands.add_parser("serve", help="run the server until interrupted")
+    serve_command.add_argument("--inputs", metavar="DIR",
+                               help="where relative inputs and INPUT_FILE_NAMEs are looked up. "
+                                    "Default: next to each solution")
+
+    query_command = commands.add_parser("query", help="send one request to a running server")
+    query_command.add_argument("puzzle", nargs="?", metavar="DAY.PART", help="e.g. 11.2, needed for solve")
+    query_command.add_argument("--op", choices=OPERATIONS, default="solve")
+    query_command.add_argument("--input", metavar="FILE", help="Default: the puzzle's INPUT_FILE_NAME")
+    query_command.add_argument("--param", action="append", default=[], metavar="NAME=VALUE",
+                               help="a keyword argument for solve, VALUE read as JSON where it parses. Repeatable")
+    return parser
+
+
+def parse_parameters(parameters: list[str]) -> dict:
+    parsed = {}
+    for parameter in parameters:
+        name, _, value = parameter.partition('=')
+        if not value:
+            raise argparse.ArgumentTypeError(f"--param takes NAME=VALUE, not {parameter!r}")
+        try:
+            parsed[name] = json.loads(value)
+        except json.JSONDecodeError:
+            parsed[name] = value
+    return parsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argument_parser()
+    arguments = parser.parse_args(argv)
+    if arguments.command == "serve":
+        print(f"Serving on {arguments.socket}", flush=True)
+        try:
+            serve(arguments.socket, arguments.inputs)
+        except RuntimeError as error:
+            print(error, file=sys.stderr)
+            return 2
+        return 0
+
+    request = {"op": arguments.op}
+    if arguments.op == "solve":
+        day, _, part = (arguments.puzzle or "").partition('.')
+        if not (day.isdigit() and part.isdigit()):
+            parser.error("solve needs the puzzle as DAY.PART, e.g. 11.2")
+        try:
+            parameters = parse_parameters(arguments.param)
+        except argparse.ArgumentTypeError as error:
+            parser.error(str(error))
+        request.update(day=int(day), part=int(part), input=arguments.input, parameters=parameters)
+    try:
+        response = query(request, arguments.socket)
+    except OSError as error:
+        print(f"No server on {arguments.socket}: {error}", file=sys.stderr)
+        return 2
+    print(json.dumps(response))
+    return 0 if response.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+
+from typing import Any, Callable
+
+
+class ParseSession:
+    """
+    Parsed models by input file and parse function. Every part 2 imports its parse from part 1, so running a day's
+    parts through one session parses the input once and hands both solves the same model. That is safe as long as a
+    model only ever grows caches that do not change its answers: days that need mutable state (14, 20) build it
+    inside solve, and memos such as Farmer.sorted_maps, FallingBricks.bricks_supported_by (frozen, as callers share
+    it) and Garden's plot counts are filled on first use and read the same by every later solve
+    """
+    def __init__(self):
+        self.models: dict[tuple[str, Callable], Any] = {}
+
+    def __repr__(self) -> str:
+        return f"ParseSession({len(self.models)} models)"
+
+    def __contains__(self, key: tuple[str, Callable]) -> bool:
+        input_path, parse = key
+        return (os.path.realpath(input_path), parse) in self.models
+
+    def parsed(self, parse: Callable[[str], Any], input_path: str) -> Any:
+        key = (os.path.realpath(input_path), parse)
+        if key not in self.models:
+            self.models[key] = parse(input_path)
+        return self.models[key]
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
@@ -1,8 +1,103 @@
+import mmap
+
+from array import array
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from handy_dandy_library.string_manipulations import extract_ints, extract_ints_by_line
+
+
 def read_lines(file_path: str) -> list[str]:
     with open(file_path, 'r') as file:
         content = [line[:-1] if line[-1] == '\n' else line for line in file]
     return content
 
 
+@contextmanager
+def mapped_file(file_path: str) -> Iterator[mmap.mmap | bytes]:
+    """ Read-only memory map of the file. Empty files cannot be mapped, so they give b'' """
+    with open(file_path, 'rb') as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b''
+            return
+        try:
+            yield buffer
+        finally:
+            buffer.close()
+
+
+def line_offsets(buffer: mmap.mmap | bytes) -> array:
+    """ Line i is buffer[offsets[i]:offsets[i + 1] - 1], the final offset always points one past a newline """
+    offsets = array('q', [0])
+    n = len(buffer)
+    newline_index = buffer.find(b'\n')
+    while newline_index != -1:
+        offsets.append(newline_index + 1)
+        newline_index = buffer.find(b'\n', newline_index + 1)
+
+    if offsets[-1] != n:
+        offsets.append(n + 1)
+    return offsets
+
+
+def iterate_line_spans(buffer: mmap.mmap | bytes, offsets: array) -> Iterator[bytes]:
+    for i in range(len(offsets) - 1):
+        yield buffer[offsets[i]:offsets[i + 1] - 1]
+
+
+def newline_aligned_ranges(buffer: mmap.mmap | bytes, count: int, minimum_size: int = 1) -> list[tuple[int, int]]:
+    """
+    At most count (start, end) ranges of about equal size covering the whole buffer, every one ending just after a
+    newline or at the buffer's end, so no line is split between two ranges. None is shorter than minimum_size bytes
+    unless it is the only one
+    """
+    n = len(buffer)
+    size = max(-(-n // max(count, 1)), minimum_size, 1)
+    ranges = []
+    start = 0
+    while start < n:
+        end = buffer.find(b'\n', start + size - 1) + 1 if start + size < n else n
+        end = end or n
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def stream_lines(file_path: str) -> Iterator[bytes]:
+    """
+    Lazily yield every line from a memory map, one line in memory at a time. Lines come without their newline, Windows
+    line endings included, just as read_lines gives them
+    """
+    with mapped_file(file_path) as buffer:
+        n = len(buffer)
+        start = 0
+        while start < n:
+            end = buffer.find(b'\n', start)
+            if end == -1:
+                end = n
+            line = buffer[start:end]
+            yield line[:-1] if line.endswith(b'\r') else line
+            start = end + 1
+
+
+@contextmanager
+def mapped_lines(file_path: str) -> Iterator[tuple[mmap.mmap | bytes, array]]:
+    """ Whole file buffer plus its line offsets, so lines can be sliced out on demand """
+    with mapped_file(file_path) as buffer:
+        yield buffer, line_offsets(buffer)
+
+
+def read_ints(file_path: str, as_numpy: bool = False) -> array | Any:
+    with mapped_file(file_path) as buffer:
+        return extract_ints(buffer, as_numpy)
+
+
+def read_ints_by_line(file_path: str, as_numpy: bool = False) -> (array | Any, array):
+    with mapped_file(file_path) as buffer:
+        return extract_ints_by_line(buffer, as_numpy)
+
+
 if __name__ == "__main__":
     print("This is lower library file. Import, but don't run.")
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Any, Hashable, Iterable, Mapping
+
+
+UNREACHED = -1
+
+
+class NodeInterner:
+    """ Hands out dense int ids to hashable node labels, in first seen order """
+    __slots__ = ("ids", "labels")
+
+    def __init__(self, labels: Iterable[Hashable] = ()):
+        self.ids: dict[Hashable, int] = {}
+        self.labels: list[Hashable] = []
+        for label in labels:
+            self.intern(label)
+
+    def __repr__(self) -> str:
+        return f"NodeInterner({len(self.labels)} labels)"
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __contains__(self, label: Hashable) -> bool:
+        return label in self.ids
+
+    def intern(self, label: Hashable) -> int:
+        node = self.ids.get(label)
+        if node is None:
+            node = self.ids[label] = len(self.labels)
+            self.labels.append(label)
+        return node
+
+
+class CSRGraph:
+    """
+    Directed graph over dense int nodes in compressed sparse row form.
+    The out-edges of node v are targets[offsets[v]:offsets[v + 1]], with matching weights when the graph is weighted.
+    Edge order is preserved from construction, so traversals visit neighbours in insertion order.
+    """
+    __slots__ = ("interner", "offsets", "targets", "weights")
+
+    def __init__(self, interner: NodeInterner, offsets: array, targets: array, weights: array | None = None):
+        self.interner = interner
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    def __repr__(self) -> str:
+        return f"CSRGraph({len(self)} nodes, {self.edge_count} edges, weighted={self.weights is not None})"
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Hashable, Hashable] | tuple[Hashable, Hashable, int]],
+                   nodes: Iterable[Hashable] = (), undirected: bool = False) -> CSRGraph:
+        """ Edges are (source, target) or (source, target, weight). nodes fixes the id order of those labels """
+        interner = NodeInterner(nodes)
+        sources, targets, weights = array('q'), array('q'), array('q')
+        is_weighted = None
+        for edge in edges:
+            if is_weighted is None:
+                is_weighted = len(edge) == 3
+            source, target = interner.intern(edge[0]), interner.intern(edge[1])
+            weight = edge[2] if is_weighted else 1
+            sources.append(source)
+            targets.append(target)
+            weights.append(weight)
+            if undirected:
+                sources.append(target)
+                targets.append(source)
+                weights.append(weight)
+        return cls.__from_coordinate_arrays(interner, sources, targets, weights if is_weighted else None)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Mapping[Hashable, Iterable[Hashable]],
+                       weights: Mapping[tuple[Hashable, Hashable], int] | None = None) -> CSRGraph:
+        """ Dict-of-iterables adjacency. Keys are interned first, in key order, so ids follow the mapping """
+        interner = NodeInterner(adjacency)
+        offsets, targets = array('q', [0]), array('q')
+        edge_weights = array('q') if weights is not None else None
+        for source, successors in adjacency.items():
+            for successor in successors:
+                targets.append(interner.intern(successor))
+                if edge_weights is not None:
+                    edge_weights.append(weights[(source, successor)])
+            offsets.append(len(targets))
+        # Labels only ever seen as targets have no out-edges
+        offsets.extend([len(targets)] * (len(interner) - len(offsets) + 1))
+        return cls(interner, offsets, targets, edge_weights)
+
+    @classmethod
+    def __from_coordinate_arrays(cls, interner: NodeInterner, sources: array, targets: array,
+                                 weights: array | None) -> CSRGraph:
+        # Counting sort by source, stable so each node keeps its edges in insertion order
+        n = len(interner)
+        offsets = array('q', [0]) * (n + 1)
+        for source in sources:
+            offsets[source + 1] += 1
+        for v in range(n):
+            offsets[v + 1] += offsets[v]
+
+        cursor = offsets[:-1]
+        sorted_targets = array('q', [0]) * len(targets)
+        sorted_weights = array('q', [0]) * len(targets) if weights is not None else None
+        for i, source in enumerate(sources):
+            position = cursor[source]
+            sorted_targets[position] = targets[i]
+            if weights is not None:
+                sorted_weights[position] = weights[i]
+            cursor[source] = position + 1
+        return cls(interner, offsets, sorted_targets, sorted_weights)
+
+    def node(self, label: Hashable) -> int:
+        return self.interner.ids[label]
+
+    def label(self, node: int) -> Hashable:
+        return self.interner.labels[node]
+
+    def labelled(self, values: Iterable[Any]) -> dict[Hashable, Any]:
+        """ Per-node values (e.g. distances) keyed by label instead """
+        return dict(zip(self.interner.labels, values))
+
+    def successors(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def edge_weights(self, node: int) -> array:
+        if self.weights is None:
+            return array('q', [1]) * (self.offsets[node + 1] - self.offsets[node])
+        return self.weights[self.offsets[node]:self.offsets[node + 1]]
+
+    def out_degrees(self) -> array:
+        offsets = self.offsets
+        return array('q', (offsets[v + 1] - offsets[v] for v in range(len(self))))
+
+    def in_degrees(self) -> array:
+        degrees = array('q', [0]) * len(self)
+        for target in self.targets:
+            degrees[target] += 1
+        return degrees
+
+    def reversed(self) -> CSRGraph:
+        """ Same nodes and ids, every edge flipped. successors() of the result are the predecessors here """
+        offsets, targets = self.offsets, self.targets
+        sources = array('q', (v for v in range(len(self)) for _ in range(offsets[v + 1] - offsets[v])))
+        return self.__from_coordinate_arrays(self.interner, targets, sources, self.weights)
+
+    def bfs_parents(self, source: int, excluded_edges: set[tuple[int, int]] | None = None) -> (array, list[int]):
+        """
+        Breadth first search tree from source. Returns (parents, visit order), parents[source] == source and
+        unreached nodes have UNREACHED. Edges in excluded_edges (as (from, to) pairs) are not walked
+        """
+        offsets, targets = self.offsets, self.targets
+        parents = array('q', [UNREACHED]) * len(self)
+        parents[source] = source
+        order = [source]
+        queue = deque(order)
+        while queue:
+            node = queue.popleft()
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if parents[target] != UNREACHED:
+                    continue
+                if excluded_edges and (node, target) in excluded_edges:
+                    continue
+                parents[target] = node
+                order.append(target)
+                queue.append(target)
+        return parents, order
+
+    def bfs_distances(self, source: int) -> array:
+        """ Unweighted hop counts from source, UNREACHED where there is no path """
+        offsets, targets = self.offsets, self.targets
+        distances = array('q', [UNREACHED]) * len(self)
+        distances[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            next_distance = distances[node] + 1
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if distances[target] == UNREACHED:
+                    distances[target] = next_distance
+                    queue.append(target)
+        return distances
+
+    @staticmethod
+    def path_to(parents: array, target: int) -> list[int]:
+        """ Source to target path through a bfs_parents tree, empty if target was not reached """
+        if parents[target] == UNREACHED:
+            return []
+        path = [target]
+        while parents[path[-1]] != path[-1]:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+    def dfs_preorder(self, source: int) -> list[int]:
+        """ Iterative depth first preorder from source, neighbours taken in edge order """
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(len(self))
+        order = []
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            if visited[node]:
+                continue
+            visited[node] = 1
+            order.append(node)
+            stack.extend(reversed(targets[offsets[node]:offsets[node + 1]]))
+        return order
+
+    def reachable(self, source: int) -> bytearray:
+        """ 1 for every node reachable from source (source included) """
+        reached = bytearray(len(self))
+        for node in self.dfs_preorder(source):
+            reached[node] = 1
+        return reached
+
+    def toposort(self) -> list[int]:
+        """ Kahn's algorithm. Raises ValueError when the graph has a cycle """
+        offsets, targets = self.offsets, self.targets
+        in_degrees = self.in_degrees()
+        order = [v for v in range(len(self)) if in_degrees[v] == 0]
+        for node in order:
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                in_degrees[target] -= 1
+                if in_degrees[target] == 0:
+                    order.append(target)
+        if len(order) != len(self):
+            raise ValueError("Graph has a cycle, so no topological order exists")
+        return order
+
+    def is_acyclic(self, source: int | None = None) -> bool:
+        """ Whole graph, or only the part reachable from source """
+        if source is None:
+            return all(len(component) == 1 and not self.__has_self_loop(component[0])
+                       for component in self.strongly_connected_components())
+        reached = self.reachable(source)
+        return all(len(component) == 1 and not self.__has_self_loop(component[0])
+                   for component in self.strongly_connected_components() if reached[component[0]])
+
+    def __has_self_loop(self, node: int) -> bool:
+        return node in self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def strongly_connected_components(self) -> list[list[int]]:
+        """ Iterative Tarjan. Components come out in reverse topological order of the condensation """
+        offsets, targets = self.offsets, self.targets
+        n = len(self)
+        index_of = array('q', [UNREACHED]) * n
+        low_link = array('q', [0]) * n
+        on_stack = bytearray(n)
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(n):
+            if index_of[root] != UNREACHED:
+                continue
+            # Frames are (node, position of the next edge to look at)
+            call_stack = [(root, offsets[root])]
+            index_of[root] = low_link[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            while call_stack:
+                node, edge = call_stack[-1]
+                if edge < offsets[node + 1]:
+                    call_stack[-1] = (node, edge + 1)
+                    target = targets[edge]
+                    if index_of[target] == UNREACHED:
+                        index_of[target] = low_link[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = 1
+                        call_stack.append((target, offsets[target]))
+                    elif on_stack[target]:
+                        low_link[node] = min(low_link[node], index_of[target])
+                    continue
+
+                call_stack.pop()
+                if call_stack:
+                    parent = call_stack[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[node])
+                if low_link[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def longest_path_lengths(self) -> array:
+        """ For a DAG, the heaviest path from every node to any sink (edge weights default to 1) """
+        offsets, targets = self.offsets, self.targets
+        weights = self.weights
+        lengths = array('q', [0]) * len(self)
+        for node in reversed(self.toposort()):
+            best = 0
+            for edge in range(offsets[node], offsets[node + 1]):
+                length = (weights[edge] if weights is not None else 1) + lengths[targets[edge]]
+                if length > best:
+                    best = length
+            lengths[node] = best
+        return lengths
+
+    def longest_simple_path_length(self, source: int, target: int) -> int:
+        """
+        The heaviest path from source to target that repeats no node, cycles allowed, or UNREACHED if there is none.
+        An exhaustive search over visited bitmasks, so only for small graphs such as a maze condensed to its junctions
+        """
+        offsets, targets = self.offsets, self.targets
+        weights = self.weights
+        # When the target has a single way in, reaching that node leaves no choice but to finish there
+        entrances = [node for node in range(len(self)) if target in targets[offsets[node]:offsets[node + 1]]]
+        if len(entrances) == 1 and entrances[0] != source:
+            last_step = entrances[0]
+            edge = offsets[last_step] + targets[offsets[last_step]:offsets[last_step + 1]].index(target)
+            finish_length = weights[edge] if weights is not None else 1
+        else:
+            last_step, finish_length = target, 0
+
+        best = UNREACHED
+        stack = [(source, 1 << source, 0)]
+        while stack:
+            node, visited, length = stack.pop()
+            if node == last_step:
+                if length + finish_length > best:
+                    best = length + finish_length
+                continue
+            for edge in range(offsets[node], offsets[node + 1]):
+                successor = targets[edge]
+                if not visited >> successor & 1:
+                    weight = weights[edge] if weights is not None else 1
+                    stack.append((successor, visited | 1 << successor, length + weight))
+        return best
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Mapping
+
+from handy_dandy_library.file_processing import mapped_file
+
+
+BORDER = 0xFF
+
+# Direction codes, clockwise from up. (code + 1) % 4 turns right, (code - 1) % 4 turns left
+UP, RIGHT, DOWN, LEFT = range(4)
+
+
+def translation_table(encodings: Mapping[str | int, int]) -> bytes:
+    """ 256 byte table for bytes.translate. Characters not in encodings keep their own byte value """
+    table = bytearray(range(256))
+    for char, code in encodings.items():
+        table[char if isinstance(char, int) else ord(char)] = code
+    return bytes(table)
+
+
+def reverse_translation_table(encodings: Mapping[str | int, int]) -> bytes:
+    """ Undoes translation_table(encodings). Where several characters share a code, the first one wins """
+    table = bytearray(range(256))
+    for char, code in reversed(encodings.items()):
+        table[code] = char if isinstance(char, int) else ord(char)
+    return bytes(table)
+
+
+class Grid:
+    """
+    2D map of byte codes stored row by row in one flat bytearray, framed by a one cell border of sentinels.
+    (row, column) lives at index (row + 1) * width + column + 1, so neighbours are index + offset and stepping
+    off the map lands on a border cell instead of needing bounds checks.
+    """
+    __slots__ = ("cells", "n", "m", "width", "border")
+
+    def __init__(self, cells: bytearray, n: int, m: int, border: int = BORDER):
+        if len(cells) != (n + 2) * (m + 2):
+            raise ValueError(f"{len(cells)} cells cannot hold a bordered {n}x{m} grid")
+        self.cells = cells
+        self.n = n
+        self.m = m
+        self.width = m + 2
+        self.border = border
+
+    def __repr__(self) -> str:
+        return f"Grid({self.n}x{self.m})"
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, code: int) -> None:
+        self.cells[index] = code
+        return None
+
+    def __eq__(self, other: Grid) -> bool:
+        if not isinstance(other, Grid):
+            return False
+        return self.n == other.n and self.m == other.m and self.cells == other.cells
+
+    # Cells are mutable, so a grid is not hashable. Hash bytes(grid.cells) to key a snapshot of it
+    __hash__ = None
+
+    @classmethod
+    def filled(cls, n: int, m: int, code: int = 0, border: int = BORDER) -> Grid:
+        width = m + 2
+        border_row = bytes((border,)) * width
+        row = bytes((border,)) + bytes((code,)) * m + bytes((border,))
+        return cls(bytearray(border_row + row * n + border_row), n, m, border)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str | bytes], table: bytes | None = None, border: int = BORDER) -> Grid:
+        """ Rows of characters, translated to codes in one bytes.translate call when a table is given """
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        n = len(rows)
+        m = len(rows[0]) if rows else 0
+        if any(len(row) != m for row in rows):
+            raise ValueError("Grid rows must all be the same length")
+
+        codes = b''.join(rows)
+        if table is not None:
+            codes = codes.translate(table)
+
+        edge = bytes((border,))
+        border_row = edge * (m + 2)
+        cells = bytearray(border_row)
+        for i in range(n):
+            cells += edge + codes[i * m:(i + 1) * m] + edge
+        cells += border_row
+        return cls(cells, n, m, border)
+
+    @classmethod
+    def from_file(cls, file_path: str, table: bytes | None = None, border: int = BORDER) -> Grid:
+        with mapped_file(file_path) as buffer:
+            lines = buffer[:].split(b'\n')
+        if lines and lines[-1] == b'':
+            lines.pop()
+        return cls.from_lines(lines, table, border)
+
+    def copy(self) -> Grid:
+        return Grid(self.cells.copy(), self.n, self.m, self.border)
+
+    def translated(self, table: bytes) -> Grid:
+        """ New grid with every code (border included) passed through table """
+        return Grid(bytearray(self.cells.translate(table)), self.n, self.m, table[self.border])
+
+    def index(self, row: int, column: int) -> int:
+        return (row + 1) * self.width + column + 1
+
+    def coordinate(self, index: int) -> (int, int):
+        row, column = divmod(index, self.width)
+        return row - 1, column - 1
+
+    def cell(self, row: int, column: int) -> int:
+        return self.cells[(row + 1) * self.width + column + 1]
+
+    def is_border(self, index: int) -> bool:
+        return self.cells[index] == self.border
+
+    @property
+    def offsets(self) -> (int, int, int, int):
+        """ Index offsets of the up, right, down and left neighbours, indexed by direction code """
+        return -self.width, 1, self.width, -1
+
+    @property
+    def diagonal_offsets(self) -> (int, int, int, int):
+        width = self.width
+        return -width - 1, -width + 1, width + 1, width - 1
+
+    @property
+    def king_offsets(self) -> tuple[int, ...]:
+        """ All eight surrounding cells """
+        width = self.width
+        return -width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1
+
+    def neighbours(self, index: int) -> Iterator[int]:
+        """ Orthogonal neighbours that are on the map """
+        cells, border = self.cells, self.border
+        for offset in self.offsets:
+            if cells[index + offset] != border:
+                yield index + offset
+
+    def indices(self) -> Iterator[int]:
+        """ Every on-map index, row by row """
+        for row_start in self.row_starts():
+            yield from range(row_start, row_start + self.m)
+
+    def row_starts(self) -> range:
+        """ Index of the first on-map cell of every row """
+        width = self.width
+        return range(width + 1, (self.n + 1) * width, width)
+
+    def find(self, code: int) -> list[int]:
+        """ Indices of every on-map cell holding code, row by row. The border is never matched """
+        cells, m = self.cells, self.m
+        found = []
+        for row_start in self.row_starts():
+            row_end = row_start + m
+            index = cells.find(code, row_start, row_end)
+            while index != -1:
+                found.append(index)
+                index = cells.find(code, index + 1, row_end)
+        return found
+
+    def count(self, code: int) -> int:
+        """ On-map cells holding code, the border excluded """
+        cells, m = self.cells, self.m
+        return sum(cells.count(code, row_start, row_start + m) for row_start in self.row_starts())
+
+    def row(self, i: int) -> bytes:
+        start = (i + 1) * self.width + 1
+        return bytes(self.cells[start:start + self.m])
+
+    def rows(self) -> list[bytes]:
+        return [self.row(i) for i in range(self.n)]
+
+    def column(self, j: int) -> bytes:
+        start = self.width + j + 1
+        return bytes(self.cells[start:start + self.n * self.width:self.width])
+
+    def columns(self) -> list[bytes]:
+        return [self.column(j) for j in range(self.m)]
+
+    def transposed(self) -> Grid:
+        return Grid.from_lines(self.columns(), border=self.border)
+
+    def rotated_clockwise(self) -> Grid:
+        return Grid.from_lines([column[::-1] for column in self.columns()], border=self.border)
+
+    def rotated_anticlockwise(self) -> Grid:
+        return Grid.from_lines(reversed(self.columns()), border=self.border)
+
+    def to_lines(self, reverse_table: bytes | None = None) -> list[str]:
+        rows = self.rows()
+        if reverse_table is not None:
+            rows = [row.translate(reverse_table) for row in rows]
+        return [row.decode('latin-1') for row in rows]
+
+    def as_numpy(self, with_border: bool = False) -> Any:
+        """ (n, m) view sharing memory with the grid, or (n + 2, m + 2) with the border """
+        import numpy as np
+        cells = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.n + 2, self.width)
+        if with_border:
+            return cells
+        return cells[1:-1, 1:-1]
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
@@ -0,0 +1,59 @@
+import os
+
+from collections import Counter
+
+
+class Instrumentation:
+    """
+    Named counters (totals such as nodes expanded or pulses sent) and gauges (a last and a highest value, such as a
+    frontier size) for diagnostics that would otherwise be printed from inside a loop. While disabled every call
+    returns straight away, and hot loops keep their own local tallies and report them once when they finish
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.counters: Counter[str] = Counter()
+        self.gauges: dict[str, tuple[float, float]] = {}
+
+    def __repr__(self) -> str:
+        return f"Instrumentation(enabled={self.enabled}, counters={dict(self.counters)}, gauges={self.gauges})"
+
+    def count(self, name: str, amount: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] += amount
+        return None
+
+    def gauge(self, name: str, value: float) -> None:
+        if self.enabled:
+            _, highest = self.gauges.get(name, (value, value))
+            self.gauges[name] = (value, max(highest, value))
+        return None
+
+    def reset(self) -> None:
+        self.counters.clear()
+        self.gauges.clear()
+        return None
+
+    def snapshot(self) -> dict[str, int | float]:
+        """ Counters by name, gauges as their last value and their highest under "name (max)" """
+        values: dict[str, int | float] = dict(self.counters)
+        for name, (last, highest) in self.gauges.items():
+            values[name] = last
+            if highest != last:
+                values[f"{name} (max)"] = highest
+        return values
+
+    def summary(self) -> str:
+        return format_snapshot(self.snapshot())
+
+
+def format_snapshot(values: dict[str, int | float]) -> str:
+    return '\n'.join(f"{name:>40}: {value:,}" for name, value in sorted(values.items()))
+
+
+INSTRUMENTATION = Instrumentation(enabled=os.environ.get("AOC_COUNTERS", "0") != "0")
+count = INSTRUMENTATION.count
+gauge = INSTRUMENTATION.gauge
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
-from handy_dandy_library.list_operations import consecutive_pairs
+from typing import Any, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+# Coordinates are packed into a single int for hashing, unique while |y| < HASH_PACKING_FACTOR / 2
+HASH_PACKING_FACTOR = 1 << 21
 
 
 class UnitVector2D:
+    UNIT_VECTOR_CODENAMES = {"up": 0, "right": 1, "down": 2, "left": 3}
     UNIT_VECTOR_NAMES_FROM_VECTOR = {(1, 0): "right", (0, 1): "down", (-1, 0): "left", (0, -1): "up"}
+    __slots__ = ("x", "y")
 
     def __init__(self, values: tuple[int, int]):
         self.x = values[0]
         self.y = values[1]
 
     def __eq__(self, other: UnitVector2D) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, UnitVector2D):
             return False
         return self.x == other.x and self.y == other.y
@@ -22,16 +36,29 @@ class UnitVector2D:
     def direction_name(self) -> str:
         return self.UNIT_VECTOR_NAMES_FROM_VECTOR.get((self.x, self.y), "not_unit_vector")
 
+    @classmethod
+    def UP(cls):
+        return cls((0, -1))
+
+    @classmethod
+    def RIGHT(cls):
+        return cls((1, 0))
+
+    @classmethod
+    def DOWN(cls):
+        return cls((0, 1))
+
+    @classmethod
+    def LEFT(cls):
+        return cls((-1, 0))
+
 
 class Vector2D(UnitVector2D):
-    def __init__(self, values: tuple[float, float]):
-        super().__init__(values)
+    """ Immutable by convention, as the hash is taken from x and y """
+    __slots__ = ()
 
     def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other: Vector2D) -> bool:
-        return hash(self) == hash(other)
+        return hash(self.x * HASH_PACKING_FACTOR + self.y)
 
     def __add__(self, other: Vector2D) -> Vector2D:
         return Vector2D((self.x + other.x, self.y + other.y))
@@ -54,20 +81,38 @@ class Vector2D(UnitVector2D):
     def cross_product(self, other: Vector2D) -> float:
         return self.x * other.y - other.x * self.y
 
+    @property
+    def rotated_right(self) -> Vector2D:
+        """ Quarter turn of a unit vector, e.g. right to down """
+        return Vector2D((self.y * -abs(self.y), self.x))
+
+    @property
+    def rotated_left(self) -> Vector2D:
+        return Vector2D((self.y, self.x * -abs(self.x)))
+
     @classmethod
     def zero(cls):
         return cls((0, 0))
 
 
 class Vector3D:
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, values: tuple[float, float, float]):
         self.x = values[0]
         self.y = values[1]
         self.z = values[2]
 
     def __eq__(self, other: Vector3D) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Vector3D):
+            return False
         return self.x == other.x and self.y == other.y and self.z == other.z
 
+    def __hash__(self):
+        return hash((self.x * HASH_PACKING_FACTOR + self.y) * HASH_PACKING_FACTOR + self.z)
+
     def __repr__(self) -> str:
         return f"({self.x}, {self.y}, {self.z})"
 
@@ -135,12 +180,203 @@ class Vector3D:
         return self.dot(other.cross(other2))
 
 
-def polygon_area(polygon: list[Vector2D]) -> float:
-    return 0.5 * abs(sum(a.cross_product(b) for a, b in consecutive_pairs(polygon)))
+class Vector3DArray:
+    """ Struct-of-arrays batch of Vector3D, every operation runs as a NumPy kernel over the whole batch.
+    Keep the array on the left of binary operators, Vector3D does not know how to combine with it """
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: Any, y: Any, z: Any):
+        if np is None:
+            raise ImportError("Vector3DArray requires numpy")
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.z = np.asarray(z)
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector3D], dtype: Any = None) -> Vector3DArray:
+        if np is None:
+            raise ImportError("Vector3DArray requires numpy")
+        values = np.array([vector.values for vector in vectors], dtype=dtype).reshape(-1, 3)
+        return cls(values[:, 0], values[:, 1], values[:, 2])
+
+    @classmethod
+    def zeros(cls, n: int, dtype: Any = float) -> Vector3DArray:
+        if np is None:
+            raise ImportError("Vector3DArray requires numpy")
+        return cls(np.zeros(n, dtype=dtype), np.zeros(n, dtype=dtype), np.zeros(n, dtype=dtype))
+
+    def to_vectors(self) -> list[Vector3D]:
+        return [Vector3D(values) for values in zip(self.x.tolist(), self.y.tolist(), self.z.tolist())]
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __iter__(self) -> Iterator[Vector3D]:
+        return iter(self.to_vectors())
+
+    def __getitem__(self, item: Any) -> Vector3D | Vector3DArray:
+        """ Integers give a scalar Vector3D, slices, index arrays and boolean masks give a Vector3DArray """
+        if isinstance(item, (int, np.integer)):
+            return Vector3D((self.x[item].item(), self.y[item].item(), self.z[item].item()))
+        return Vector3DArray(self.x[item], self.y[item], self.z[item])
+
+    def __repr__(self) -> str:
+        return f"Vector3DArray({self.to_vectors()})"
+
+    @staticmethod
+    def __components(other: Vector3D | Vector3DArray) -> (Any, Any, Any):
+        return other.x, other.y, other.z
+
+    def __add__(self, other: Vector3D | Vector3DArray) -> Vector3DArray:
+        x, y, z = self.__components(other)
+        return Vector3DArray(self.x + x, self.y + y, self.z + z)
+
+    def __sub__(self, other: Vector3D | Vector3DArray) -> Vector3DArray:
+        x, y, z = self.__components(other)
+        return Vector3DArray(self.x - x, self.y - y, self.z - z)
+
+    def __mul__(self, other: Any) -> Vector3DArray:
+        """ Scale by a scalar, or elementwise by an array of len(self) scalars """
+        return Vector3DArray(self.x * other, self.y * other, self.z * other)
+
+    def __rmul__(self, other: Any) -> Vector3DArray:
+        return self.__mul__(other)
+
+    def __neg__(self) -> Vector3DArray:
+        return Vector3DArray(-self.x, -self.y, -self.z)
+
+    @property
+    def magnitude(self) -> Any:
+        return np.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+
+    @property
+    def xy_projection(self) -> Vector3DArray:
+        return Vector3DArray(self.x, self.y, np.zeros_like(self.z))
+
+    @property
+    def manhattan_distance_from_zero(self) -> Any:
+        return self.x + self.y + self.z
+
+    def xy_projected_cross_product(self, other: Vector3D | Vector3DArray) -> Any:
+        x, y, _ = self.__components(other)
+        return self.x * y - x * self.y
+
+    def cross(self, other: Vector3D | Vector3DArray) -> Vector3DArray:
+        x, y, z = self.__components(other)
+        return Vector3DArray(self.y * z - self.z * y,
+                             self.z * x - self.x * z,
+                             self.x * y - self.y * x)
+
+    def dot(self, other: Vector3D | Vector3DArray) -> Any:
+        x, y, z = self.__components(other)
+        return self.x * x + self.y * y + self.z * z
+
+    def triple_product(self, other: Vector3D | Vector3DArray, other2: Vector3D | Vector3DArray) -> Any:
+        return self.dot(Vector3DArray(*self.__components(other)).cross(other2))
+
+    def projection_onto(self, other: Vector3D | Vector3DArray) -> Vector3DArray:
+        x, y, z = self.__components(other)
+        scale = self.dot(other) / (x * x + y * y + z * z)
+        return Vector3DArray(x * scale, y * scale, z * scale)
+
+    def linearly_independent(self, other: Vector3D | Vector3DArray) -> Any:
+        cross = self.cross(other)
+        return (cross.x != 0) | (cross.y != 0) | (cross.z != 0)
+
+
+class PolygonAccumulator:
+    """ Shoelace twice-area and rectilinear border length of a closed polygon, fed one vertex or edge at a time.
+    Only the first and latest vertex are kept, so memory is O(1) however long the boundary is """
+    __slots__ = ("first_x", "first_y", "last_x", "last_y", "vertex_count", "open_twice_signed_area",
+                 "open_boundary_length")
+
+    def __init__(self):
+        self.first_x = self.first_y = 0
+        self.last_x = self.last_y = 0
+        self.vertex_count = 0
+        self.open_twice_signed_area = 0
+        self.open_boundary_length = 0
+
+    def __repr__(self) -> str:
+        return f"PolygonAccumulator(vertices: {self.vertex_count}, twice_area: {self.twice_area})"
+
+    @classmethod
+    def from_vertices(cls, vertices: Iterable[Vector2D]) -> PolygonAccumulator:
+        polygon = cls()
+        for vertex in vertices:
+            polygon.add_xy(vertex.x, vertex.y)
+        return polygon
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Vector2D], start: Vector2D = Vector2D.zero()) -> PolygonAccumulator:
+        polygon = cls()
+        polygon.add_xy(start.x, start.y)
+        for edge in edges:
+            polygon.add_xy(polygon.last_x + edge.x, polygon.last_y + edge.y)
+        return polygon
+
+    def add_vertex(self, vertex: Vector2D) -> None:
+        self.add_xy(vertex.x, vertex.y)
+        return None
+
+    def add_edge(self, edge: Vector2D) -> None:
+        self.add_xy(self.last_x + edge.x, self.last_y + edge.y)
+        return None
+
+    def add_xy(self, x: float, y: float) -> None:
+        if self.vertex_count == 0:
+            self.first_x, self.first_y = x, y
+        else:
+            self.open_twice_signed_area += self.last_x * y - x * self.last_y
+            self.open_boundary_length += abs(x - self.last_x) + abs(y - self.last_y)
+        self.last_x, self.last_y = x, y
+        self.vertex_count += 1
+        return None
+
+    @property
+    def twice_area(self) -> float:
+        """ The closing edge back to the first vertex is included without being added """
+        closing = self.last_x * self.first_y - self.first_x * self.last_y
+        return abs(self.open_twice_signed_area + closing)
+
+    @property
+    def area(self) -> float:
+        return 0.5 * self.twice_area
+
+    @property
+    def boundary_length(self) -> float:
+        closing = abs(self.first_x - self.last_x) + abs(self.first_y - self.last_y)
+        return self.open_boundary_length + closing
+
+    @property
+    def interior_points(self) -> int:
+        # Pick's theorem: A = I + B / 2 - 1
+        return (self.twice_area - self.boundary_length) // 2 + 1
+
+    @property
+    def enclosed_points(self) -> int:
+        return self.interior_points + self.boundary_length
+
+
+def polygon_twice_area_and_boundary_length(xs: Any, ys: Any) -> (Any, Any):
+    """ NumPy fast path of PolygonAccumulator over whole coordinate arrays """
+    next_xs = np.roll(xs, -1)
+    next_ys = np.roll(ys, -1)
+    twice_area = abs(int(np.sum(xs * next_ys - next_xs * ys)))
+    boundary_length = int(np.sum(np.abs(next_xs - xs) + np.abs(next_ys - ys)))
+    return twice_area, boundary_length
+
+
+def polygon_area(polygon: Iterable[Vector2D]) -> float:
+    if np is not None and isinstance(polygon, np.ndarray):
+        return 0.5 * polygon_twice_area_and_boundary_length(polygon[:, 0], polygon[:, 1])[0]
+    return PolygonAccumulator.from_vertices(polygon).area
 
 
-def integer_border_points_count(polygon: list[Vector2D]) -> int:
-    return sum(a.manhattan_distance(b) for a, b in consecutive_pairs(polygon)) + 1
+def integer_border_points_count(polygon: Iterable[Vector2D]) -> int:
+    if np is not None and isinstance(polygon, np.ndarray):
+        return polygon_twice_area_and_boundary_length(polygon[:, 0], polygon[:, 1])[1] + 1
+    return PolygonAccumulator.from_vertices(polygon).boundary_length + 1
 
 
 def sign(x: float) -> int:
@@ -1,30 +1,75 @@
-from typing import TypeVar, Iterable
+import math
+
+from bisect import bisect_left, bisect_right
+from itertools import pairwise
+from typing import Any, TypeVar, Iterable, Iterator, Sequence
 
 T = TypeVar('T')
 
 
 def binary_search(haystack: list, target) -> (int, bool):
-    first = 0
-    last = len(haystack) - 1
-    found = False
-    found_at_index = 0
-
-    while first <= last and not found:
-        found_at_index = 0
-        midpoint = int((last - first) / 2 + first)
-        if haystack[midpoint] == target:
-            found_at_index = midpoint
-            found = True
-        else:
-            if target < haystack[midpoint]:
-                last = midpoint - 1
-            else:
-                first = midpoint + 1
-    return found_at_index, found
-
-
-def consecutive_pairs(sequence: list[T]) -> Iterable[tuple[T, T]]:
-    return zip(sequence, sequence[1:] + [sequence[0]])
+    index = bisect_left(haystack, target)
+    if index < len(haystack) and haystack[index] == target:
+        return index, True
+    return 0, False
+
+
+def is_sorted(sequence: Sequence) -> bool:
+    return all(a <= b for a, b in pairwise(sequence))
+
+
+def insertion_point_bounds(haystack: Sequence, queries: Sequence,
+                           queries_sorted: bool | None = None) -> (list[int] | Any, list[int] | Any):
+    """ For every query, the lower (bisect_left) and upper (bisect_right) insertion points into sorted haystack.
+    haystack[lower:upper] is then the run equal to the query, and lower == upper means it is missing """
+    if _is_numpy_array(haystack) or _is_numpy_array(queries):
+        import numpy as np
+        return np.searchsorted(haystack, queries, 'left'), np.searchsorted(haystack, queries, 'right')
+
+    if queries_sorted is None:
+        queries_sorted = is_sorted(queries)
+
+    n = len(haystack)
+    q = len(queries)
+    # A merge walk costs n + q steps, bisecting costs q log n, take whichever is cheaper
+    if queries_sorted and n + q < q * math.log2(n + 1):
+        return _merge_walk_insertion_points(haystack, queries)
+    return ([bisect_left(haystack, query) for query in queries],
+            [bisect_right(haystack, query) for query in queries])
+
+
+def _merge_walk_insertion_points(haystack: Sequence, sorted_queries: Sequence) -> (list[int], list[int]):
+    n = len(haystack)
+    lower_points = []
+    upper_points = []
+    lower = 0
+    upper = 0
+    for query in sorted_queries:
+        while lower < n and haystack[lower] < query:
+            lower += 1
+        upper = max(upper, lower)
+        while upper < n and haystack[upper] <= query:
+            upper += 1
+        lower_points.append(lower)
+        upper_points.append(upper)
+    return lower_points, upper_points
+
+
+def _is_numpy_array(x: Any) -> bool:
+    return type(x).__module__ == "numpy" and type(x).__name__ == "ndarray"
+
+
+def consecutive_pairs(sequence: Iterable[T]) -> Iterator[tuple[T, T]]:
+    """ Cyclic pairs (a, b), (b, c), ..., (z, a) without copying the sequence """
+    iterator = iter(sequence)
+    try:
+        first = previous = next(iterator)
+    except StopIteration:
+        return
+    for item in iterator:
+        yield previous, item
+        previous = item
+    yield previous, first
 
 
 def main():
@@ -0,0 +1,162 @@
+import hashlib
+import os
+import pickle
+import time
+
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_CACHE_DIRECTORY = os.environ.get("AOC_CACHE_DIR",
+                                         os.path.join(os.path.expanduser('~'), ".cache", "advent_of_code_2023"))
+PARSE_CACHE_ENABLED = os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+
+
+def file_content_hash(file_path: str) -> str:
+    with open(file_path, 'rb') as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+class DiskCache:
+    """
+    Directory of pickled entries. Once max_bytes is exceeded, the least recently used entries are evicted, and with
+    max_age_seconds so is anything not used for that long
+    """
+    SUFFIX = ".pickle"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024, max_age_seconds: float | None = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+
+    def __repr__(self) -> str:
+        return f"DiskCache({self.directory}, max_bytes={self.max_bytes}, max_age_seconds={self.max_age_seconds})"
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return default
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Stale or unreadable entries (e.g. classes pickled from another __main__) are just misses
+            self.discard(key)
+            return default
+        os.utime(path)  # mtime is the recency marker for LRU eviction
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # Values that cannot be pickled (lambdas, open files) are simply never cached
+            os.remove(temporary_path)
+            return None
+        os.replace(temporary_path, path)
+        self.evict()
+        return None
+
+    def discard(self, key: str) -> None:
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+        return None
+
+    def entries(self) -> list[tuple[os.stat_result, str]]:
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX):
+                try:
+                    entries.append((entry.stat(), entry.path))
+                except FileNotFoundError:
+                    continue
+        return entries
+
+    def size(self) -> int:
+        return sum(stat.st_size for stat, _ in self.entries())
+
+    def evict(self) -> None:
+        entries = self.entries()
+        total_bytes = sum(stat.st_size for stat, _ in entries)
+        entries.sort(key=lambda entry: entry[0].st_mtime)
+        oldest_kept = -float('inf') if self.max_age_seconds is None else time.time() - self.max_age_seconds
+        for stat, path in entries:
+            if total_bytes <= self.max_bytes and stat.st_mtime >= oldest_kept:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= stat.st_size
+        return None
+
+    def clear(self) -> None:
+        for _, path in self.entries():
+            os.remove(path)
+        return None
+
+
+class ParseCache:
+    def __init__(self, disk_cache: DiskCache):
+        self.disk_cache = disk_cache
+
+    @classmethod
+    def default(cls, max_bytes: int = 256 * 1024 * 1024):
+        return cls(DiskCache(os.path.join(DEFAULT_CACHE_DIRECTORY, "parsed"), max_bytes))
+
+    @staticmethod
+    def key(file_path: str, parser: Callable, parser_version: int) -> str:
+        parser_name = f"{parser.__module__}.{parser.__qualname__}#{parser_version}"
+        return hashlib.sha256(f"{file_content_hash(file_path)}|{parser_name}".encode()).hexdigest()
+
+    def parsed(self, file_path: str, parser: Callable[[str], T], parser_version: int = 1) -> T:
+        key = self.key(file_path, parser, parser_version)
+        miss = object()
+        value = self.disk_cache.get(key, miss)
+        if value is not miss:
+            return value
+        value = parser(file_path)
+        self.disk_cache.put(key, value)
+        return value
+
+
+_default_parse_cache: ParseCache | None = None
+
+
+def default_parse_cache() -> ParseCache:
+    global _default_parse_cache
+    if _default_parse_cache is None:
+        _default_parse_cache = ParseCache.default()
+    return _default_parse_cache
+
+
+def cached_parser(version: int = 1) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
+    """ Bump version whenever the parser output changes shape, old entries then age out of the cache """
+    def decorator(parser: Callable[[str], T]) -> Callable[[str], T]:
+        @wraps(parser)
+        def wrapper(file_path: str) -> T:
+            if not PARSE_CACHE_ENABLED:
+                return parser(file_path)
+            return default_parse_cache().parsed(file_path, parser, version)
+        wrapper.uncached = parser
+        return wrapper
+    return decorator
+
+
+if __name__ == "__main__":
+    print("This is lower library file. Import, but don't run.")
@@ -1,5 +1,9 @@
 import re
 
+from array import array
+from collections import Counter, deque
+from typing import Any, Iterable, Iterator, Mapping
+
 
 DIGIT_NUMERALS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
 
@@ -7,6 +11,12 @@ DIGIT_NUMERAL_REPLACEMENTS = {"one": "1", "two": "2", "three": "3", "four": "4",
                               "six": "6", "seven": "7", "eight": "8", "nine": "9"}
 
 
+SIGNED_INT_PATTERN = re.compile(r"-?\d+")
+SIGNED_INT_OR_NEWLINE_PATTERN = re.compile(r"-?\d+|\n")
+SIGNED_INT_BYTES_PATTERN = re.compile(rb"-?\d+")
+SIGNED_INT_OR_NEWLINE_BYTES_PATTERN = re.compile(rb"-?\d+|\n")
+
+
 class PrintColors:
     HEADER = '\033[95m'
     OKBLUE = '\033[94m'
@@ -19,17 +29,206 @@ class PrintColors:
     UNDERLINE = '\033[4m'
 
 
-def convert_numeric_in_text_to_digits(phrase: str) -> str:
-    """ One pass literal numeric to digit numeric """
-    digit_replacements_escaped = map(re.escape, DIGIT_NUMERAL_REPLACEMENTS)
+class AhoCorasick:
+    """
+    Multi-pattern automaton over str or bytes (patterns and scanned text must be the same kind).
+    Every match, overlapping ones included, is found in a single left to right pass.
+    Matches are (start index, value) pairs, value defaults to the matched pattern itself.
+    """
+    __slots__ = ("transitions", "longest_outputs", "shortest_outputs", "outputs", "max_pattern_length")
+
+    def __init__(self, patterns: Mapping[str | bytes, Any] | Iterable[str | bytes]):
+        if not isinstance(patterns, Mapping):
+            patterns = {pattern: pattern for pattern in patterns}
+        if any(len(pattern) == 0 for pattern in patterns):
+            raise ValueError("Empty patterns would match everywhere")
+
+        goto: list[dict] = [{}]
+        outputs: list[list[tuple[int, Any]]] = [[]]
+        for pattern, value in patterns.items():
+            state = 0
+            for symbol in pattern:
+                if symbol not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][symbol] = len(goto) - 1
+                state = goto[state][symbol]
+            outputs[state].append((len(pattern), value))
+
+        # Breadth first, so every failure state is complete before it is inherited from
+        self.transitions: list[dict] = [{} for _ in goto]
+        self.transitions[0] = dict(goto[0])
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] += outputs[fail[state]]
+            self.transitions[state] = {**self.transitions[fail[state]], **goto[state]}
+            for symbol, next_state in goto[state].items():
+                fail[next_state] = self.transitions[fail[state]].get(symbol, 0)
+                queue.append(next_state)
+
+        self.outputs = [tuple(output) for output in outputs]
+        self.longest_outputs = [max(output, key=lambda o: o[0]) if output else None for output in outputs]
+        self.shortest_outputs = [min(output, key=lambda o: o[0]) if output else None for output in outputs]
+        self.max_pattern_length = max(map(len, patterns), default=0)
+
+    def __repr__(self) -> str:
+        return f"AhoCorasick({len(self.transitions)} states, max_pattern_length={self.max_pattern_length})"
+
+    def iter_matches(self, text: str | bytes, start: int = 0, end: int | None = None) -> Iterator[tuple[int, Any]]:
+        """ All matches in text[start:end], in order of their end index """
+        transitions, outputs = self.transitions, self.outputs
+        state = 0
+        for i in range(start, len(text) if end is None else end):
+            state = transitions[state].get(text[i], 0)
+            for length, value in outputs[state]:
+                yield i - length + 1, value
+
+    def first_match(self, text: str | bytes, start: int = 0, end: int | None = None) -> tuple[int, Any] | None:
+        """ Match with the smallest start index, None if nothing matches """
+        transitions, longest_outputs = self.transitions, self.longest_outputs
+        best = None
+        state = 0
+        for i in range(start, len(text) if end is None else end):
+            # Anything ending from here on starts after the best match found so far
+            if best is not None and i - self.max_pattern_length + 1 >= best[0]:
+                break
+            state = transitions[state].get(text[i], 0)
+            output = longest_outputs[state]
+            if output is not None and (best is None or i - output[0] + 1 < best[0]):
+                best = (i - output[0] + 1, output[1])
+        return best
+
+    def last_match(self, text: str | bytes, start: int = 0, end: int | None = None) -> tuple[int, Any] | None:
+        """ Match with the largest start index, None if nothing matches """
+        return self.first_and_last_match(text, start, end)[1]
+
+    def first_and_last_match(self, text: str | bytes, start: int = 0, end: int | None = None) \
+            -> tuple[tuple[int, Any] | None, tuple[int, Any] | None]:
+        transitions, longest_outputs, shortest_outputs = self.transitions, self.longest_outputs, self.shortest_outputs
+        first = last = None
+        state = 0
+        for i in range(start, len(text) if end is None else end):
+            state = transitions[state].get(text[i], 0)
+            output = shortest_outputs[state]
+            if output is None:
+                continue
+            if last is None or i - output[0] + 1 > last[0]:
+                last = (i - output[0] + 1, output[1])
+            output = longest_outputs[state]
+            if first is None or i - output[0] + 1 < first[0]:
+                first = (i - output[0] + 1, output[1])
+        return first, last
+
+    def first_and_last_by_line(self, buffer: str | bytes) -> list[tuple[Any, Any]]:
+        """
+        Whole buffer (str, bytes or mmap) in one pass, giving the (first, last) matched value of each line,
+        None where a line has no match. Patterns must not contain newlines, a trailing newline adds no line
+        """
+        is_text = isinstance(buffer, str)
+        newline = '\n' if is_text else ord('\n')
+        transitions, longest_outputs, shortest_outputs = self.transitions, self.longest_outputs, self.shortest_outputs
+
+        results = []
+        first = last = None
+        first_start = last_start = 0
+        state = 0
+        # mmap iterates in 1 byte slices, a memoryview gives plain ints like bytes does
+        with (memoryview(b'') if is_text else memoryview(buffer)) as view:
+            for i, symbol in enumerate(buffer if is_text else view):
+                if symbol == newline:
+                    results.append((first, last))
+                    first = last = None
+                    state = 0
+                    continue
+                state = transitions[state].get(symbol, 0)
+                output = shortest_outputs[state]
+                if output is None:
+                    continue
+                if last is None or i - output[0] + 1 > last_start:
+                    last_start, last = i - output[0] + 1, output[1]
+                output = longest_outputs[state]
+                if first is None or i - output[0] + 1 < first_start:
+                    first_start, first = i - output[0] + 1, output[1]
+
+        if len(buffer) and buffer[-1:] not in ('\n', b'\n'):
+            results.append((first, last))
+        return results
 
-    # OR regex to match any digit replacement strings
-    pattern = re.compile("|".join(digit_replacements_escaped), 0)
 
-    def digit_matching(match):
-        return DIGIT_NUMERAL_REPLACEMENTS[match.group(0)]
+class LineEndsScanner:
+    """
+    First and last match of every line, for patterns over str or bytes, compiled into one regular expression.
+    On each line a lazy prefix stops where the first match starts, and from that same spot a greedy lookahead runs to
+    the line's end and backs off to where the last match starts, so overlapping matches count ("oneight" gives one
+    and eight). Each line is walked once from the left inside re's C matcher instead of symbol by symbol in Python.
+    Where several patterns start at the same index the longest wins, as with AhoCorasick.first_match
+    """
+    __slots__ = ("values", "pattern", "newline")
+    CHUNK_SIZE = 1 << 24
 
-    return pattern.sub(digit_matching, phrase)
+    def __init__(self, patterns: Mapping[str | bytes, Any] | Iterable[str | bytes]):
+        if not isinstance(patterns, Mapping):
+            patterns = {pattern: pattern for pattern in patterns}
+        if not patterns or any(len(pattern) == 0 for pattern in patterns):
+            raise ValueError("Needs at least one pattern, and empty patterns would match everywhere")
+        self.values = dict(patterns)
+        is_text = isinstance(next(iter(patterns)), str)
+        alternatives = (b'|' if not is_text else '|').join(
+            re.escape(pattern) for pattern in sorted(patterns, key=len, reverse=True))
+        line_ends = r"^[^\n]*?(?=({0}))(?=[^\n]*({0}))."
+        # The final . takes the first match's first symbol, so the next search cannot start on the same line
+        self.pattern = re.compile(line_ends.format(alternatives) if is_text
+                                  else line_ends.encode().replace(b"{0}", alternatives), re.MULTILINE)
+        self.newline = '\n' if is_text else b'\n'
+
+    def __repr__(self) -> str:
+        return f"LineEndsScanner({len(self.values)} patterns)"
+
+    def first_and_last(self, line: str | bytes) -> tuple[Any, Any] | None:
+        match = self.pattern.match(line)
+        if match is None:
+            return None
+        return self.values[match[1]], self.values[match[2]]
+
+    def count_first_and_last(self, buffer: str | bytes, start: int = 0, end: int | None = None) \
+            -> Counter[tuple[Any, Any]]:
+        """
+        How many lines of buffer[start:end] (str, bytes or mmap) have each (first, last) pair of values. Lines
+        without a match are left out. start must be 0 or just after a newline, and end the buffer's end or just after
+        a newline. Works through newline aligned windows of CHUNK_SIZE, so only one window's matches are held at once
+        """
+        end = len(buffer) if end is None else end
+        matched_pairs = Counter()
+        while start < end:
+            window_end = buffer.find(self.newline, min(start + self.CHUNK_SIZE, end) - 1, end) + 1 or end
+            matched_pairs.update(self.pattern.findall(buffer, start, window_end))
+            start = window_end
+        values = self.values
+        counts = Counter()
+        for (first, last), count in matched_pairs.items():
+            counts[values[first], values[last]] += count
+        return counts
+
+
+NUMERAL_AUTOMATON = AhoCorasick(DIGIT_NUMERALS)
+DIGIT_OR_NUMERAL_VALUES = {**{numeral: int(digit) for numeral, digit in DIGIT_NUMERAL_REPLACEMENTS.items()},
+                           **{str(digit): digit for digit in range(10)}}
+DIGIT_OR_NUMERAL_BYTE_VALUES = {pattern.encode(): value for pattern, value in DIGIT_OR_NUMERAL_VALUES.items()}
+DIGIT_BYTE_VALUES = {str(digit).encode(): digit for digit in range(10)}
+
+
+def convert_numeric_in_text_to_digits(phrase: str) -> str:
+    """ One pass literal numeric to digit numeric. Overlapping numerals each give their digit, "eightwo" -> "82" """
+    converted = []
+    covered_until = 0
+    for start, numeral in sorted(NUMERAL_AUTOMATON.iter_matches(phrase)):
+        converted.append(phrase[covered_until:start])
+        converted.append(DIGIT_NUMERAL_REPLACEMENTS[numeral])
+        covered_until = max(covered_until, start + len(numeral))
+    converted.append(phrase[covered_until:])
+    return "".join(converted)
 
 
 def find_first_char_index(phrase: str, target_char: str) -> int:
@@ -62,6 +261,41 @@ def parse_ints(phrase: str) -> list[int]:
     return [int(substring) for substring in phrase.split(' ') if substring != '']
 
 
+def extract_ints(buffer: str | bytes, as_numpy: bool = False) -> array | Any:
+    """ Every signed integer in the buffer (str, bytes or mmap), in one regex pass """
+    pattern = SIGNED_INT_PATTERN if isinstance(buffer, str) else SIGNED_INT_BYTES_PATTERN
+    values = array('q', map(int, pattern.findall(buffer)))
+    if as_numpy:
+        return ints_as_numpy(values)
+    return values
+
+
+def extract_ints_by_line(buffer: str | bytes, as_numpy: bool = False) -> (array | Any, array):
+    """ Line i holds values[offsets[i]:offsets[i + 1]]. A trailing newline does not start an extra line """
+    is_text = isinstance(buffer, str)
+    pattern = SIGNED_INT_OR_NEWLINE_PATTERN if is_text else SIGNED_INT_OR_NEWLINE_BYTES_PATTERN
+    newline = '\n' if is_text else b'\n'
+
+    values = array('q')
+    offsets = array('q', [0])
+    for token in pattern.findall(buffer):
+        if token == newline:
+            offsets.append(len(values))
+        else:
+            values.append(int(token))
+
+    if len(buffer) and buffer[-1:] != newline:
+        offsets.append(len(values))
+    if as_numpy:
+        return ints_as_numpy(values), offsets
+    return values, offsets
+
+
+def ints_as_numpy(values: array) -> Any:
+    import numpy as np
+    return np.frombuffer(values, dtype=np.int64)
+
+
 def horizontal_rule(rule_char: str='-', rule_length: int=50) -> str:
     return rule_char * rule_length
 
@@ -1,5 +1,19 @@
-from handy_dandy_library.file_processing import read_lines
-from handy_dandy_library.string_manipulations import first_digit
+import os
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from handy_dandy_library.file_processing import stream_lines, mapped_file, newline_aligned_ranges
+from handy_dandy_library.string_manipulations import first_digit, LineEndsScanner, DIGIT_BYTE_VALUES
+
+
+INPUT_FILE_NAME = "puzzle1_input.txt"
+
+
+DIGIT_SCANNER = LineEndsScanner(DIGIT_BYTE_VALUES)
+# Below this many bytes per worker, starting the processes costs more than the scan they take over
+PARALLEL_MINIMUM_RANGE = 1 << 22
 
 
 def calibration_value(phrase: str) -> int:
@@ -8,7 +22,42 @@ def calibration_value(phrase: str) -> int:
 
 
 def sum_calibration_values(file_path: str) -> int:
-    return sum(calibration_value(phrase) for phrase in read_lines(file_path))
+    return sum(calibration_value(phrase.decode()) for phrase in stream_lines(file_path))
+
+
+def calibration_sum(first_and_last_counts: dict[tuple[int, int], int]) -> int:
+    return sum(count * (10 * first + last) for (first, last), count in first_and_last_counts.items())
+
+
+def count_range(file_path: str, scanner: LineEndsScanner, start: int, end: int) -> Counter[tuple[int, int]]:
+    """ Each worker maps the file itself, the pages come from the same page cache whichever process reads them """
+    with mapped_file(file_path) as buffer:
+        return scanner.count_first_and_last(buffer, start, end)
+
+
+def parallel_calibration_sum(file_path: str, scanner: LineEndsScanner = DIGIT_SCANNER, jobs: int | None = None) -> int:
+    """ A line's value does not depend on any other line, so newline aligned slices are counted in separate processes """
+    jobs = jobs or os.cpu_count() or 1
+    with mapped_file(file_path) as buffer:
+        ranges = newline_aligned_ranges(buffer, jobs, PARALLEL_MINIMUM_RANGE)
+        if len(ranges) <= 1:
+            return calibration_sum(scanner.count_first_and_last(buffer))
+
+    counts = Counter()
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        for range_counts in executor.map(count_range, repeat(file_path), repeat(scanner), starts, ends):
+            counts.update(range_counts)
+    return calibration_sum(counts)
+
+
+def parse(file_path: str) -> bytes:
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+
+def solve(buffer: bytes) -> int:
+    return calibration_sum(DIGIT_SCANNER.count_first_and_last(buffer))
 
 
 def tests():
@@ -16,11 +65,13 @@ def tests():
     assert calibration_value("pqr3stu8vwx") == 38
     assert calibration_value("a1b2c3d4e5f") == 15
     assert calibration_value("treb7uchet") == 77  # noqa
+    assert solve(b"1abc2\npqr3stu8vwx\na1b2c3d4e5f\ntreb7uchet") == 142  # noqa
     assert sum_calibration_values("puzzle1_test_input.txt") == 142
+    assert parallel_calibration_sum("puzzle1_test_input.txt", jobs=2) == 142
 
 
 def main():
-    t = sum_calibration_values("puzzle1_input.txt")
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
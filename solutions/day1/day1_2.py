@@ -1,54 +1,49 @@
-from handy_dandy_library.file_processing import read_lines
-from handy_dandy_library.string_manipulations import DIGIT_NUMERALS, DIGIT_NUMERAL_REPLACEMENTS
-from typing import Callable
+from handy_dandy_library.file_processing import mapped_file
+from handy_dandy_library.string_manipulations import (AhoCorasick, LineEndsScanner, DIGIT_OR_NUMERAL_VALUES,
+                                                      DIGIT_OR_NUMERAL_BYTE_VALUES)
+from day1_1 import parse, calibration_sum, parallel_calibration_sum
 
 
-NUMERAL_FIRST_LETTERS = {"o", "t", "f", "s", "e", "n"}
-NUMERAL_LAST_LETTERS = {"e", "o", "r", "part_list", "n", "t"}
+INPUT_FILE_NAME = "puzzle1_input.txt"
 
 
-def digit_or_numeral_first_match(phrase: str, match_pattern: Callable) -> int:
-    m = len(phrase) - 1
-    for i, char in enumerate(phrase):
-        if char in NUMERAL_LAST_LETTERS:
-            for numeral in DIGIT_NUMERALS:
-                is_valid_length = m - i >= len(numeral)
-                if is_valid_length and match_pattern(i, numeral, phrase):
-                    return int(DIGIT_NUMERAL_REPLACEMENTS[numeral])
+DIGIT_OR_NUMERAL_AUTOMATON = AhoCorasick(DIGIT_OR_NUMERAL_VALUES)
+DIGIT_OR_NUMERAL_SCANNER = LineEndsScanner(DIGIT_OR_NUMERAL_BYTE_VALUES)
 
-        if char.isdigit():
-            return int(char)
 
-    raise TypeError
-
-
-def substring_match_forwards(start_index: int, numeral: str, phrase: str) -> bool:
-    return phrase[start_index:start_index + len(numeral)] == numeral
+def calibration_value(phrase: str) -> int:
+    first, last = DIGIT_OR_NUMERAL_AUTOMATON.first_and_last_match(phrase)
+    if first is None:
+        raise TypeError
+    return 10 * first[1] + last[1]
 
 
-def substring_match_backwards(start_index: int, numeral: str, phrase: str) -> bool:
-    return phrase[start_index:start_index + len(numeral)] == numeral[::-1]
+def sum_calibration_values(file_path: str) -> int:
+    with mapped_file(file_path) as buffer:
+        return solve(buffer)
 
 
-def calibration_value(phrase: str) -> int:
-    first_digit = digit_or_numeral_first_match(phrase, substring_match_forwards)
-    total = 10 * first_digit + digit_or_numeral_first_match(phrase[::-1], substring_match_backwards)
-    return total
+def sum_calibration_values_parallel(file_path: str, jobs: int | None = None) -> int:
+    return parallel_calibration_sum(file_path, DIGIT_OR_NUMERAL_SCANNER, jobs)
 
 
-def sum_calibration_values(file_path: str) -> int:
-    return sum(calibration_value(phrase) for phrase in read_lines(file_path))
+def solve(buffer: bytes) -> int:
+    return calibration_sum(DIGIT_OR_NUMERAL_SCANNER.count_first_and_last(buffer))
 
 
 def tests():
     assert calibration_value("eightwothree") == 83  # noqa
+    assert calibration_value("7pqrstsixteen") == 76  # noqa
+    assert calibration_value("oneight") == 18  # noqa
+    assert DIGIT_OR_NUMERAL_SCANNER.first_and_last(b"zoneight234") == (1, 4)  # noqa
     assert sum_calibration_values("puzzle1_2_test_input.txt") == 281
+    assert sum_calibration_values_parallel("puzzle1_2_test_input.txt", jobs=2) == 281
 
 
 def main():
     tests()
 
-    t = sum_calibration_values("puzzle1_input.txt")
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
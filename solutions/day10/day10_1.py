@@ -1,12 +1,13 @@
 from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.grid import Grid
 from handy_dandy_library.string_manipulations import make_blue
-from handy_dandy_library.linear_algebra import Vector2D, polygon_area, integer_border_points_count
+from handy_dandy_library.linear_algebra import Vector2D, PolygonAccumulator
 
 from collections import deque
 
 
-type Grid = list[list]
+INPUT_FILE_NAME = "day_10_1_input.txt"
 
 
 class PipeGrid:
@@ -21,52 +22,49 @@ class PipeGrid:
     CARTESIAN_PIPES = {'|', '-'}
 
     def __init__(self, grid: Grid):
+        # Cells hold the raw pipe characters, x is the column and y the row
         self.grid = grid
-        self.n = len(grid[0])
-        self.m = len(grid)
-        self._pipes = self._pipe_chars(grid)
+        self.n = grid.m
+        self.m = grid.n
+        up, right, down, left = grid.offsets
+        self.neighbour_offsets = (right, up, down, left)
         self.starting_coordinate = self._starting_coordinate(grid)
 
     def __repr__(self) -> str:
-        lines = '\n'.join(''.join(char for char in line) for line in self.grid)
-        return lines
+        return '\n'.join(self.grid.to_lines())
 
-    def __getitem__(self, item: Vector2D) -> set[Vector2D]:
-        return self.grid[item.y][item.x]
+    def __getitem__(self, item: Vector2D) -> str:
+        return chr(self.grid.cell(item.y, item.x))
 
     def coloured_squares(self, square_coordinates: set[Vector2D]) -> None:
         representation = '\n'.join(''.join(make_blue(encoding) if Vector2D((j, i)) in square_coordinates
                                            else encoding
                                            for j, encoding in enumerate(line))
-                                   for i, line in enumerate(self.grid))
+                                   for i, line in enumerate(self.grid.to_lines()))
         return representation
 
-    @staticmethod
-    def _pipe_chars(grid: Grid) -> Grid:
-        return [[1 if char != '.' else 0 for char in row] for row in grid]
-
     @staticmethod
     def _starting_coordinate(grid: Grid) -> (int, int):
-        n = len(grid)
-        m = len(grid[0])
-        for j in range(n):
-            for i in range(m):
-                if grid[j][i] == 'S':
-                    return Vector2D((i, j))
-        raise TypeError
+        starts = grid.find(ord('S'))
+        if not starts:
+            raise TypeError
+        row, column = grid.coordinate(starts[0])
+        return Vector2D((column, row))
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        return cls(lines)
+        return cls(Grid.from_lines(lines))
 
     def _edge_checks(self, coordinate: Vector2D) -> (bool, bool, bool, bool):
-        return coordinate.x < self.n - 1, coordinate.y > 0, coordinate.y < self.m - 1, coordinate.x > 0
+        index = self.grid.index(coordinate.y, coordinate.x)
+        cells, border = self.grid.cells, self.grid.border
+        return tuple(cells[index + offset] != border for offset in self.neighbour_offsets)
 
     def _potential_neighbours(self, coordinate: Vector2D) -> (Vector2D, Vector2D, Vector2D, Vector2D):
         return coordinate + self.RIGHT, coordinate + self.UP, coordinate + self.DOWN, coordinate + self.LEFT
 
     def is_pipe(self, coordinate: Vector2D) -> bool:
-        return self._pipes[coordinate.y][coordinate.x]
+        return self.grid.cell(coordinate.y, coordinate.x) != ord('.')
 
     def _surrounding_squares(self, coordinate: Vector2D) -> set[Vector2D]:
         # Right, Up, Down, Left
@@ -140,12 +138,16 @@ class PipeGrid:
 
     @property
     def area_enclosed(self) -> int:
-        main_loop = self.main_loop_shortened_coordinates
         # Using Pick's theorem. Quicker than raytracing, since all points are on the integer grid.
-        total_area = polygon_area(main_loop)
-        border_points = integer_border_points_count(main_loop)
-        interior_points = int(total_area) + 1 - border_points // 2
-        return interior_points
+        return PolygonAccumulator.from_vertices(self.main_loop_shortened_coordinates).interior_points
+
+
+def parse(file_path: str) -> PipeGrid:
+    return PipeGrid.from_lines(read_lines(file_path))
+
+
+def solve(pipe_grid: PipeGrid) -> int:
+    return pipe_grid.main_loop_furthest_distance
 
 
 def tests():
@@ -162,8 +164,7 @@ def tests():
 def main():
     tests()
 
-    pipe_grid = PipeGrid.from_lines(read_lines("day_10_1_input.txt"))
-    t = pipe_grid.main_loop_furthest_distance
+    t = solve(parse(INPUT_FILE_NAME))
 
     assert t == 6613
 
@@ -1,5 +1,12 @@
 from handy_dandy_library.file_processing import read_lines
-from day10_1 import PipeGrid
+from day10_1 import PipeGrid, parse
+
+
+INPUT_FILE_NAME = "day_10_1_input.txt"
+
+
+def solve(pipe_grid: PipeGrid) -> int:
+    return pipe_grid.area_enclosed
 
 
 def tests():
@@ -25,8 +32,7 @@ def tests():
 def main():
     tests()
 
-    pipe_grid = PipeGrid.from_lines(read_lines("day_10_1_input.txt"))
-    t = pipe_grid.area_enclosed
+    t = solve(parse(INPUT_FILE_NAME))
 
     assert t == 511
 
@@ -4,6 +4,9 @@ from handy_dandy_library.file_processing import read_lines
 from itertools import combinations
 
 
+INPUT_FILE_NAME = "day_11_1_input.txt"
+
+
 type GalaxyCoordinates = list[list[int, int]]
 
 
@@ -72,6 +75,14 @@ def galaxy_brain_sum(lines: list[str], expansion_rate=1) -> int:
     return total
 
 
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str], expansion_rate: int = 1) -> int:
+    return galaxy_brain_sum(lines, expansion_rate)
+
+
 def tests():
     assert coordinate_distance([6, 1], [11, 5]) == 9
     assert galaxy_brain_sum(read_lines("day_11_1_test_input.txt")) == 374
@@ -80,7 +91,7 @@ def tests():
 def main():
     tests()
 
-    t = galaxy_brain_sum(read_lines("day_11_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
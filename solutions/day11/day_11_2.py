@@ -1,9 +1,15 @@
-from handy_dandy_library.file_processing import read_lines
-from day11_1 import galaxy_brain_sum
+from day11_1 import galaxy_brain_sum, parse
+
+
+INPUT_FILE_NAME = "day_11_1_input.txt"
+
+
+def solve(lines: list[str], expansion_rate: int = 1_000_000 - 1) -> int:
+    return galaxy_brain_sum(lines, expansion_rate)
 
 
 def main():
-    t = galaxy_brain_sum(read_lines("day_11_1_input.txt"), expansion_rate=1_000_000 - 1)
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
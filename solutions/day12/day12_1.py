@@ -1,8 +1,12 @@
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.instrumentation import count
 import math
 from itertools import accumulate
 
 
+INPUT_FILE_NAME = "day_12_1_input.txt"
+
+
 def contiguous_permutations_collective(capacity: int, ordered_contiguous_lengths: list[int]) -> int:
     total_elements = sum(ordered_contiguous_lengths)
 
@@ -30,12 +34,16 @@ def combinations_from_puzzle_line(line: str) -> int:
     total_combinations = 0
 
     memo = {}
+    memo_hits = 0
+    steps = 0
     chars_to_check = [(nonogram_string, 0, nonogram_numbers)]
     while chars_to_check:
         step = chars_to_check.pop()
+        steps += 1
 
         if step in memo:
             total_combinations += memo[step]
+            memo_hits += 1
             continue
 
         if not step[0]:
@@ -58,17 +66,27 @@ def combinations_from_puzzle_line(line: str) -> int:
             if step[2] and step[2][0] == step[1]:
                 chars_to_check.append((step[0][1:], 0, step[2][1:]))
 
+    count("states expanded", steps)
+    count("memo hits", memo_hits)
     return total_combinations
 
 
 def combinations_from_puzzle(lines: list[str]) -> int:
     total = 0
-    for i, line in enumerate(lines):
-        print(f"Processing line #: {i} | {line}")
+    for line in lines:
         total += combinations_from_puzzle_line(line)
+    count("rows", len(lines))
     return total
 
 
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str]) -> int:
+    return combinations_from_puzzle(lines)
+
+
 def tests():
     assert contiguous_permutations(3, 1) == 3
     assert contiguous_permutations(3, 2) == 2
@@ -107,7 +125,7 @@ def tests():
 def main():
     tests()
 
-    t = combinations_from_puzzle(read_lines("day_12_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
     assert t == 7460
 
@@ -1,7 +1,10 @@
 import time
 
 from handy_dandy_library.file_processing import read_lines
-from day12_1 import combinations_from_puzzle
+from day12_1 import combinations_from_puzzle, parse
+
+
+INPUT_FILE_NAME = "day_12_1_input.txt"
 
 
 def unfold_line(line: str) -> str:
@@ -18,6 +21,10 @@ def unfold(lines: list[str]) -> list[str]:
     return [unfold_line(line) for line in lines]
 
 
+def solve(lines: list[str]) -> int:
+    return combinations_from_puzzle(unfold(lines))
+
+
 def tests():
     assert unfold_line(read_lines("day_12_1_test_input.txt")[0]) == "???.###????.###????.###????.###????.### 1,1,3,1,1,3,1,1,3,1,1,3,1,1,3"
     assert combinations_from_puzzle(unfold(read_lines("day_12_1_test_input.txt"))) == 525152
@@ -26,7 +33,7 @@ def tests():
 def main():
     tests()
 
-    # t = combinations_from_puzzle(unfold(read_lines("day_12_1_input.txt")))
+    # t = solve(parse(INPUT_FILE_NAME))
     # print(t)
 
 
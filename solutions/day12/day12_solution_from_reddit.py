@@ -3,6 +3,9 @@ from handy_dandy_library.file_processing import read_lines
 from functools import cache
 
 
+INPUT_FILE_NAME = "day_12_1_input.txt"
+
+
 # This solution is edited, sourced originally from: https://aoc-puzzle-solver.streamlit.app/
 
 def part2(lines: list[str]):
@@ -48,5 +51,18 @@ def unfold(lines: list[str]) -> list[str]:
     return [unfold_line(line) for line in lines]
 
 
-t = part2(read_lines("day_12_1_input.txt"))
-print(t)
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str]) -> int:
+    return part2(lines)
+
+
+def main():
+    t = solve(parse(INPUT_FILE_NAME))
+    print(t)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,36 @@
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.grid import Grid, translation_table
 
-type RockCoordinates = list[list[int]]
+
+INPUT_FILE_NAME = "day_13_1_input.txt"
+
+
+ROCK_TABLE = translation_table({'#': 1, '.': 0})
 
 
 class MirrorMapper:
     dimension_weights = [100, 1]
 
     def __init__(self, lines: list[str]):
-        self.rocks = self.__rock_coordinates(lines)
-        self.n = len(lines)
-        self.m = len(lines[0])
+        self.rocks = Grid.from_lines(lines, ROCK_TABLE)
+        self.n = self.rocks.n
+        self.m = self.rocks.m
+        # Rows and columns as bytes, so a whole line compares in one go
+        self.rock_rows = self.rocks.rows()
+        self.rock_columns = self.rocks.columns()
 
-    @staticmethod
-    def __rock_coordinates(lines: list[str]) -> RockCoordinates:
-        rocks = [[1 if char == '#' else 0 for char in line] for line in lines]
-        return rocks
-
-    def rock_column(self, index: int) -> list[int]:
-        return [self.rocks[i][index] for i in range(self.n)]
+    def rock_column(self, index: int) -> bytes:
+        return self.rock_columns[index]
 
     def shape(self, dimension: int) -> int:
         if dimension == 0:
             return self.n
         return self.m
 
-    def get_rock_row_or_column(self, index: int, dimension: int) -> list[int]:
+    def get_rock_row_or_column(self, index: int, dimension: int) -> bytes:
         if dimension == 0:
-            return self.rocks[index]
-        return self.rock_column(index)
+            return self.rock_rows[index]
+        return self.rock_columns[index]
 
     def is_mirrored(self, index: int, dimension: int) -> bool:
         dim_length = self.shape(dimension)
@@ -58,7 +61,7 @@ class MirrorMapper:
             above = self.get_rock_row_or_column(above_index, dimension)
             below = self.get_rock_row_or_column(below_index, dimension)
             if above != below:
-                incorrect_count = sum(1 if a != b else 0 for a, b in zip(above, below))
+                incorrect_count += sum(1 if a != b else 0 for a, b in zip(above, below))
             if incorrect_count > 1:
                 return False
             above_index += 1
@@ -92,6 +95,14 @@ def read_puzzles(lines: list[str]) -> list[list[str]]:
     return puzzles
 
 
+def parse(file_path: str) -> list[list[str]]:
+    return read_puzzles(read_lines(file_path))
+
+
+def solve(puzzles: list[list[str]]) -> int:
+    return sum(MirrorMapper(puzzle).mirror_summary() for puzzle in puzzles)
+
+
 def test2():
     mirror_mapper2 = MirrorMapper(read_lines("day_13_1_test_input1.txt"))
     assert mirror_mapper2.mirror_summary() == 5
@@ -128,9 +139,7 @@ def main():
     test1()
     test2()
 
-    puzzles = read_puzzles(read_lines("day_13_1_input.txt"))
-
-    total = sum(MirrorMapper(puzzle).mirror_summary() for puzzle in puzzles)
+    total = solve(parse(INPUT_FILE_NAME))
     print(total)
 
 
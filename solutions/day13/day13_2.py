@@ -1,19 +1,28 @@
 from handy_dandy_library.file_processing import read_lines
-from day13_1 import MirrorMapper, read_puzzles
+from day13_1 import MirrorMapper, parse
+
+
+INPUT_FILE_NAME = "day_13_1_input.txt"
+
+
+def solve(puzzles: list[list[str]]) -> int:
+    return sum(MirrorMapper(puzzle).mirror_summary(smudged=True) for puzzle in puzzles)
 
 
 def tests():
     assert MirrorMapper(read_lines("day_13_1_test_input1.txt")).mirror_summary(smudged=True) == 300
     assert MirrorMapper(read_lines("day_13_1_test_input2.txt")).mirror_summary(smudged=True) == 100
 
+    # Rows 1 and 2 differ in one cell and so do rows 0 and 3: two smudges, so the line between rows 1 and 2 is no mirror
+    two_smudges = MirrorMapper(["##.", "...", "#..", "#.."])
+    assert not two_smudges.is_smudged_mirrored(1, 0)
+    assert two_smudges.mirror_summary(smudged=True) == 2
+
 
 def main():
     tests()
 
-    puzzles = read_puzzles(read_lines("day_13_1_input.txt"))
-    totals = [MirrorMapper(puzzle).mirror_summary(smudged=True) for puzzle in puzzles]
-    print(totals)
-    t = sum(totals)
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
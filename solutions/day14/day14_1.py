@@ -1,13 +1,11 @@
 from __future__ import annotations
 
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.grid import Grid, translation_table, reverse_translation_table
+from handy_dandy_library.instrumentation import gauge
 
 
-type Grid = list[list[int, int]]
-
-
-def empty_grid(number_of_rows: int, number_of_columns: int) -> Grid:
-    return [[0 for _ in range(number_of_columns)] for _ in range(number_of_rows)]
+INPUT_FILE_NAME = "day_14_1_input.txt"
 
 
 class RockNRoller:
@@ -16,32 +14,26 @@ class RockNRoller:
     EMPTY_CHAR = '.'
     ROCK_ENCODINGS = {EMPTY_CHAR: 0, HARD_ROCK_CHAR: 1, SMOOTH_ROCK_CHAR: 2}
     ROCK_ENCODINGS_REVERSED = {0: EMPTY_CHAR, 1: HARD_ROCK_CHAR, 2: SMOOTH_ROCK_CHAR}
+    ROCK_TABLE = translation_table(ROCK_ENCODINGS)
+    ROCK_REVERSE_TABLE = reverse_translation_table(ROCK_ENCODINGS)
 
     def __init__(self, encoded_grid: Grid):
+        # Every move builds a new Grid, so rollers may share one without seeing each other's moves
         self.encoded_grid = encoded_grid
-        self.n = len(encoded_grid)
-        self.m = len(encoded_grid[0])
+        self.n = encoded_grid.n
+        self.m = encoded_grid.m
 
     def __repr__(self) -> str:
-        return '\n'.join(''.join(self.ROCK_ENCODINGS_REVERSED[encoding] for encoding in line)
-                         for line in self.encoded_grid)
+        return '\n'.join(self.encoded_grid.to_lines(self.ROCK_REVERSE_TABLE))
 
     def __getitem__(self, item: tuple[int, int]):
-        value = self.encoded_grid[item[0]][item[1]]
-        return value
+        return self.encoded_grid.cell(item[0], item[1])
 
     def __eq__(self, other: RockNRoller) -> bool:
-        if self.n != other.n or self.m != other.m:
-            return False
-
-        for i in range(self.n):
-            for j in range(self.m):
-                if self[(i, j)] != other[(i, j)]:
-                    return False
-        return True
+        return self.encoded_grid == other.encoded_grid
 
     def __hash__(self):
-        return hash(tuple(tuple(row) for row in self.encoded_grid))
+        return hash(bytes(self.encoded_grid.cells))
 
     @property
     def hard_rock_encoding(self) -> int:
@@ -53,77 +45,48 @@ class RockNRoller:
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        n = len(lines)
-        m = len(lines[0])
-        encoded_grid = empty_grid(n, m)
-
-        for i, row in enumerate(lines):
-            for j, char in enumerate(row):
-                encoded_grid[i][j] = cls.ROCK_ENCODINGS[char]
-
-        return cls(encoded_grid)
+        return cls(Grid.from_lines(lines, cls.ROCK_TABLE))
 
     def copy(self) -> RockNRoller:
         return RockNRoller(self.encoded_grid)
 
     def rotate_clockwise_90_degrees(self) -> None:
-        new_grid = empty_grid(self.m, self.n)
-        for i, row in enumerate(self.encoded_grid):
-            for j, encoding in enumerate(row):
-                new_grid[j][self.m - i - 1] = encoding
-
-        self.encoded_grid = new_grid
+        self.encoded_grid = self.encoded_grid.rotated_clockwise()
+        self.n, self.m = self.m, self.n
         return None
 
     def rotate_anticlockwise_90_degrees(self) -> None:
-        new_grid = empty_grid(self.m, self.n)
-        for i, row in enumerate(self.encoded_grid):
-            for j, encoding in enumerate(row):
-                new_grid[self.m - j - 1][i] = encoding
-
-        self.encoded_grid = new_grid
+        self.encoded_grid = self.encoded_grid.rotated_anticlockwise()
+        self.n, self.m = self.m, self.n
         return None
 
     def roll_north(self) -> None:
         hard_rock_encoding = self.hard_rock_encoding
         smooth_rock_encoding = self.smooth_rock_encoding
-
-        hard_rock_positions = [[i for i in range(self.n) if self.encoded_grid[i][j] == hard_rock_encoding] + [self.n]
-                               for j in range(self.m)]
-        smooth_rock_positions = [[i for i in range(self.n) if self.encoded_grid[i][j] == smooth_rock_encoding]
-                                 for j in range(self.m)]
-
-        new_grid = empty_grid(self.n, self.m)
-
-        for j, hard_rocks in enumerate(hard_rock_positions):
-            for hard_rock in hard_rocks[:-1]:
-                new_grid[hard_rock][j] = hard_rock_encoding
-
-        for col_idx in range(self.m):
-            hard_idx = 0
-            current_smooth_rock_idx = 0
-            for smooth_rock in smooth_rock_positions[col_idx]:
-                hard_rock = hard_rock_positions[col_idx][hard_idx]
-                while smooth_rock > hard_rock:
-                    current_smooth_rock_idx = hard_rock + 1
-                    hard_idx += 1
-                    hard_rock = hard_rock_positions[col_idx][hard_idx]
-                new_grid[current_smooth_rock_idx][col_idx] = smooth_rock_encoding
-                current_smooth_rock_idx += 1
+        empty_encoding = self.ROCK_ENCODINGS[self.EMPTY_CHAR]
+
+        new_grid = self.encoded_grid.copy()
+        cells = new_grid.cells
+        width = new_grid.width
+        for column_index in range(new_grid.index(0, 0), new_grid.index(0, self.m)):
+            # Smooth rocks stack up from the resting index, which restarts below every hard rock
+            resting_index = column_index
+            for index in range(column_index, column_index + self.n * width, width):
+                encoding = cells[index]
+                if encoding == hard_rock_encoding:
+                    resting_index = index + width
+                elif encoding == smooth_rock_encoding:
+                    cells[index] = empty_encoding
+                    cells[resting_index] = smooth_rock_encoding
+                    resting_index += width
 
         self.encoded_grid = new_grid
         return None
 
     @property
     def total_load(self) -> int:
-        total = 0
         smooth_rock_encoding = self.smooth_rock_encoding
-
-        for i, row in enumerate(reversed(self.encoded_grid), 1):
-            for j, encoding in enumerate(row):
-                if encoding == smooth_rock_encoding:
-                    total += i
-        return total
+        return sum((self.n - i) * row.count(smooth_rock_encoding) for i, row in enumerate(self.encoded_grid.rows()))
 
     def spin_cycle_one_iter(self) -> None:
         self.roll_north()  # North
@@ -177,13 +140,22 @@ class RockNRoller:
             return RockNRoller(slow_state)
 
         cycle_rollers = self.__cycle_states(cycle_length_upper_bound, slow_state)
-        total_loads = [roller.total_load for roller in cycle_rollers]
-        print(f"Cycle total loads: {total_loads}")
-        print(f"cycle length: {len(cycle_rollers)}")
+        gauge("spin cycles before repeating", cycle_iter_start)
+        gauge("spin cycle length", len(cycle_rollers))
         roller_index = (num_iterations - cycle_iter_start) % len(cycle_rollers)
         return cycle_rollers[roller_index]
 
 
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str]) -> int:
+    rock_roller = RockNRoller.from_lines(lines)
+    rock_roller.roll_north()
+    return rock_roller.total_load
+
+
 def test1():
     rock_roller = RockNRoller.from_lines(read_lines("day_14_1_test_input1.txt"))
     rock_roller.roll_north()
@@ -206,9 +178,7 @@ def tests():
 def main():
     tests()
 
-    rock_roller = RockNRoller.from_lines(read_lines("day_14_1_input.txt"))
-    rock_roller.roll_north()
-    t = rock_roller.total_load
+    t = solve(parse(INPUT_FILE_NAME))
     assert t == 108889
 
 
@@ -1,5 +1,12 @@
 from handy_dandy_library.file_processing import read_lines
-from day14_1 import RockNRoller
+from day14_1 import RockNRoller, parse
+
+
+INPUT_FILE_NAME = "day_14_1_input.txt"
+
+
+def solve(lines: list[str], iters: int = 1_000_000_000) -> int:
+    return RockNRoller.from_lines(lines).spin_cycle(iters).total_load
 
 
 def test1():
@@ -38,12 +45,7 @@ def tests():
 def main():
     tests()
 
-    rock_roller = RockNRoller.from_lines(read_lines("day_14_1_input.txt"))
-    iters = 1_000_000_000
-
-    roller = rock_roller.spin_cycle(iters)
-
-    t = roller.total_load
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,6 +1,9 @@
 from handy_dandy_library.file_processing import read_lines
 
 
+INPUT_FILE_NAME = "day_15_1_input.txt"
+
+
 class Hasher:
     def __init__(self, x: str):
         self.x = x
@@ -27,6 +30,14 @@ def total_csv_hash(phrases: list[str]) -> int:
     return sum(Hasher(phrase).encoded for phrase in phrases)
 
 
+def parse(file_path: str) -> list[str]:
+    return read_single_line_csv(file_path)
+
+
+def solve(phrases: list[str]) -> int:
+    return total_csv_hash(phrases)
+
+
 def tests():
     assert total_csv_hash(read_single_line_csv("day_15_1_test_input1.txt")) == 1320
 
@@ -34,7 +45,7 @@ def tests():
 def main():
     tests()
 
-    t = total_csv_hash(read_single_line_csv("day_15_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,4 +1,8 @@
-from day15_1 import Hasher, read_single_line_csv
+from day15_1 import Hasher, read_single_line_csv, parse
+
+
+INPUT_FILE_NAME = "day_15_1_input.txt"
+
 
 type DataEntry = tuple[str, str, int] | tuple[str, str]
 
@@ -35,6 +39,13 @@ def read_data_from_csv_phrase(phrase: str) -> DataEntry:
     return phrase[:-2], phrase[-2], int(final_char)
 
 
+def solve(phrases: list[str]) -> int:
+    hashmap = HashMap()
+    for phrase in phrases:
+        hashmap.process(read_data_from_csv_phrase(phrase))
+    return hashmap.total_focusing_power
+
+
 def tests():
     hashmap = HashMap()
     data_entries = list(read_data_from_csv_phrase(phrase)
@@ -49,14 +60,7 @@ def tests():
 def main():
     tests()
 
-    hashmap = HashMap()
-
-    data_entries = list(read_data_from_csv_phrase(phrase) for phrase in read_single_line_csv("day_15_1_input.txt"))
-
-    for entry in data_entries:
-        hashmap.process(entry)
-
-    t = hashmap.total_focusing_power
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,64 +1,29 @@
 from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.grid import Grid, UP, RIGHT, DOWN, LEFT, translation_table, reverse_translation_table
+from handy_dandy_library.linear_algebra import Vector2D
 from handy_dandy_library.string_manipulations import pad_with_horizontal_rules
 
 
-MIRROR_ENCODING = {'.': 0, '|': 1, '-': 2, '\\': 3, '/': 4}
-MIRROR_REVERSE_ENCODING = {0: '.', 1: '|', 2: '-', 3: '\\', 4: '/'}
-
-type Grid = list[list[int]]
-
-
-class UnitVector:
-    UNIT_VECTOR_CODENAMES = {"up": 0, "right": 1, "down": 2, "left": 3}
-    UNIT_VECTOR_NAMES_FROM_VECTOR = {(1, 0): "right", (0, 1): "down", (-1, 0): "left", (0, -1): "up"}
-
-    def __init__(self, values: tuple[int, int]):
-        self.x = values[0]
-        self.y = values[1]
-        self.direction_name = self.UNIT_VECTOR_NAMES_FROM_VECTOR.get(values, "not_unit_vector")
-
-    def __eq__(self, other: UnitVector) -> bool:
-        return self.x == other.x and self.y == other.y
-
-    def __repr__(self) -> str:
-        return f"({self.x},{self.y})"
-
-    @classmethod
-    def UP(cls):
-        return cls((0, -1))
-
-    @classmethod
-    def RIGHT(cls):
-        return cls((1, 0))
-
-    @classmethod
-    def DOWN(cls):
-        return cls((0, 1))
+INPUT_FILE_NAME = "day_16_1_input.txt"
 
-    @classmethod
-    def LEFT(cls):
-        return cls((-1, 0))
 
+MIRROR_ENCODING = {'.': 0, '|': 1, '-': 2, '\\': 3, '/': 4}
+MIRROR_REVERSE_ENCODING = {0: '.', 1: '|', 2: '-', 3: '\\', 4: '/'}
+MIRROR_TABLE = translation_table(MIRROR_ENCODING)
+MIRROR_REVERSE_TABLE = reverse_translation_table(MIRROR_ENCODING)
 
-class Vector(UnitVector):
-    def __init__(self, values: tuple[int, int]):
-        super().__init__(values)
-
-    def __add__(self, other: Vector) -> Vector:
-        return Vector((self.x + other.x, self.y + other.y))
-
-    @property
-    def rotated_right(self) -> Vector:
-        return Vector((self.y * -abs(self.y), self.x))
-
-    @property
-    def rotated_left(self) -> Vector:
-        return Vector((self.y, self.x * -abs(self.x)))
+# MIRROR_DIRECTIONS[mirror_code][direction code] -> outgoing direction codes, the same rules as
+# Light.new_lights_according_to_mirror_code
+MIRROR_DIRECTIONS = (((UP,), (RIGHT,), (DOWN,), (LEFT,)),
+                     ((UP,), (UP, DOWN), (DOWN,), (UP, DOWN)),
+                     ((LEFT, RIGHT), (RIGHT,), (LEFT, RIGHT), (LEFT,)),
+                     ((LEFT,), (DOWN,), (RIGHT,), (UP,)),
+                     ((RIGHT,), (UP,), (LEFT,), (DOWN,)))
 
 
 class Light:
-    def __init__(self, coordinate: Vector, direction: Vector):
+    def __init__(self, coordinate: Vector2D, direction: Vector2D):
         self.coordinate = coordinate
         self.direction = direction
 
@@ -97,14 +62,14 @@ class Light:
             return [self.copy()]
         if mirror_code == 1:
             if self.direction.direction_name in ("left", "right"):
-                return [Light(self.coordinate, Vector.UP()),
-                        Light(self.coordinate, Vector.DOWN())]
+                return [Light(self.coordinate, Vector2D.UP()),
+                        Light(self.coordinate, Vector2D.DOWN())]
             if self.direction.direction_name in ("up", "down"):
                 return [self.copy()]
         if mirror_code == 2:
             if self.direction.direction_name in ("up", "down"):
-                return [Light(self.coordinate, Vector.LEFT()),
-                        Light(self.coordinate, Vector.RIGHT())]
+                return [Light(self.coordinate, Vector2D.LEFT()),
+                        Light(self.coordinate, Vector2D.RIGHT())]
             if self.direction.direction_name in ("left", "right"):
                 return [self.copy()]
         if mirror_code == 3:
@@ -121,69 +86,67 @@ class Light:
 
 
 class EnergyGrid:
-    def __init__(self, n: int, m: int):
-        self.n = n
-        self.m = m
-        self.grid = [[[0, 0, 0, 0] for _ in range(self.m)] for _ in range(self.n)]
+    """ Bitmask per cell of the directions light has passed through it in """
+    def __init__(self, beams: Grid):
+        self.beams = beams
+        self.n = beams.n
+        self.m = beams.m
 
     def __repr__(self) -> str:
-        return '\n'.join([''.join(['#' if any(direction == 1 for direction in directions)
-                                   else '.' for directions in line])
-                          for line in self.grid])
+        return '\n'.join(''.join('#' if directions else '.' for directions in line) for line in self.beams.rows())
 
     @property
     def total_energy(self) -> int:
-        return sum(int(any(directions)) for line in self.grid for directions in line)
+        # Border cells are never lit, so every non-zero cell is an energized tile
+        cells = self.beams.cells
+        return len(cells) - cells.count(0)
 
 
 class MirrorGrid:
     def __init__(self, grid: Grid):
         self.grid = grid
-        self.n = len(grid)
-        self.m = len(grid[0])
+        self.n = grid.n
+        self.m = grid.m
 
     def __repr__(self) -> str:
-        lines = ['\t' + str(line) for line in self.grid]
+        lines = ['\t' + str(list(line)) for line in self.grid.rows()]
         return pad_with_horizontal_rules('\n'.join(lines))
 
     def print_mirrors(self) -> None:
-        lines = [''.join(['\t' + str(MIRROR_REVERSE_ENCODING[char]) for char in line])
-                 for line in self.grid]
+        lines = [''.join(['\t' + char for char in line]) for line in self.grid.to_lines(MIRROR_REVERSE_TABLE)]
         print(pad_with_horizontal_rules('\n'.join(lines)))
         return None
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        mirror_grid_encoding = [[MIRROR_ENCODING[char] for char in line] for line in lines]
-        return cls(mirror_grid_encoding)
-
-    def light_outside_grid(self, light: Light) -> bool:
-        x_coord_is_invalid = light.x < 0 or light.x > self.n - 1
-        y_coord_is_invalid = light.y < 0 or light.y > self.m - 1
-        invalid_coord = x_coord_is_invalid or y_coord_is_invalid
-        return invalid_coord
-
-    def energized_grid(self, start_light: Light = Light(Vector((-1, 0)), Vector.RIGHT())) -> EnergyGrid:
-        energy_grid = EnergyGrid(self.n, self.m)
-        lights_to_simulate = [start_light]
+        return cls(Grid.from_lines(lines, MIRROR_TABLE))
+
+    def energized_grid(self, start_light: Light = Light(Vector2D((-1, 0)), Vector2D.RIGHT())) -> EnergyGrid:
+        grid = self.grid
+        cells, border, offsets = grid.cells, grid.border, grid.offsets
+        beams = Grid.filled(self.n, self.m, 0, border=0)
+        seen = beams.cells
+
+        # The start light sits just outside the grid, on the border ring, so the first step moves it on-map
+        lights_to_simulate = [(grid.index(start_light.y, start_light.x),
+                               Vector2D.UNIT_VECTOR_CODENAMES[start_light.direction.direction_name])]
         while lights_to_simulate:
-            light = lights_to_simulate.pop()
-            light = light.moved_forwards1
-            direction_code = Vector.UNIT_VECTOR_CODENAMES[light.direction.direction_name]
-            if not self.light_outside_grid(light) and not energy_grid.grid[light.y][light.x][direction_code]:
-                energy_grid.grid[light.y][light.x][direction_code] = 1
-                mirror_code = self.grid[light.y][light.x]
-                lights = light.new_lights_according_to_mirror_code(mirror_code)
-                for new_light in lights:
-                    lights_to_simulate.append(new_light)
-        return energy_grid
+            index, direction = lights_to_simulate.pop()
+            index += offsets[direction]
+            mirror_code = cells[index]
+            if mirror_code == border or seen[index] & (1 << direction):
+                continue
+            seen[index] |= 1 << direction
+            for new_direction in MIRROR_DIRECTIONS[mirror_code][direction]:
+                lights_to_simulate.append((index, new_direction))
+        return EnergyGrid(beams)
 
     def max_energy(self) -> EnergyGrid:
         max_energy = 0
-        iter_thruples = ((self.__start_top_light, self.m, Vector.DOWN()),
-                         (self.__start_right_light, self.n, Vector.RIGHT()),
-                         (self.__start_left_light, self.n, Vector.LEFT()),
-                         (self.__start_up_light, self.m, Vector.UP()))
+        iter_thruples = ((self.__start_top_light, self.m, Vector2D.DOWN()),
+                         (self.__start_right_light, self.n, Vector2D.RIGHT()),
+                         (self.__start_left_light, self.n, Vector2D.LEFT()),
+                         (self.__start_up_light, self.m, Vector2D.UP()))
 
         for thruple in iter_thruples:
             for i in range(thruple[1]):
@@ -193,17 +156,25 @@ class MirrorGrid:
 
     @staticmethod
     def __start_top_light(i, start_direction) -> Light:
-        return Light(Vector((i, -1)), start_direction)
+        return Light(Vector2D((i, -1)), start_direction)
 
     @staticmethod
     def __start_right_light(i, start_direction) -> Light:
-        return Light(Vector((-1, i)), start_direction)
+        return Light(Vector2D((-1, i)), start_direction)
 
     def __start_left_light(self, i, start_direction) -> Light:
-        return Light(Vector((self.m, i)), start_direction)
+        return Light(Vector2D((self.m, i)), start_direction)
 
     def __start_up_light(self, i, start_direction) -> Light:
-        return Light(Vector((i, self.n)), start_direction)
+        return Light(Vector2D((i, self.n)), start_direction)
+
+
+def parse(file_path: str) -> MirrorGrid:
+    return MirrorGrid.from_lines(read_lines(file_path))
+
+
+def solve(mirror_grid: MirrorGrid) -> int:
+    return mirror_grid.energized_grid().total_energy
 
 
 def tests():
@@ -216,10 +187,7 @@ def tests():
 def main():
     tests()
 
-    mirror_grid = MirrorGrid.from_lines(read_lines("day_16_1_input.txt"))
-    energized_grid = mirror_grid.energized_grid()
-
-    t = energized_grid.total_energy
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
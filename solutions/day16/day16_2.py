@@ -1,5 +1,12 @@
 from handy_dandy_library.file_processing import read_lines
-from day16_1 import MirrorGrid
+from day16_1 import MirrorGrid, parse
+
+
+INPUT_FILE_NAME = "day_16_1_input.txt"
+
+
+def solve(mirror_grid: MirrorGrid) -> int:
+    return mirror_grid.max_energy()
 
 
 def tests():
@@ -10,8 +17,7 @@ def tests():
 def main():
     tests()
 
-    mirror_grid = MirrorGrid.from_lines(read_lines("day_16_1_input.txt"))
-    t = mirror_grid.max_energy()
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,83 +1,23 @@
 from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.grid import Grid, translation_table
+from handy_dandy_library.instrumentation import count, gauge
+from handy_dandy_library.linear_algebra import Vector2D
 from handy_dandy_library.string_manipulations import pad_with_horizontal_rules, make_blue
 
 from queue import PriorityQueue
 
-import cProfile
-import re
 
+INPUT_FILE_NAME = "day_17_1_input.txt"
 
-type Grid = list[list[int]]
 
-
-class UnitVector:
-    UNIT_VECTOR_CODENAMES = {"up": 0, "right": 1, "down": 2, "left": 3}
-    UNIT_VECTOR_NAMES_FROM_VECTOR = {(1, 0): "right", (0, 1): "down", (-1, 0): "left", (0, -1): "up"}
-
-    def __init__(self, values: tuple[int, int]):
-        self.x = values[0]
-        self.y = values[1]
-
-    def __eq__(self, other: UnitVector) -> bool:
-        if not isinstance(other, UnitVector):
-            return False
-        return self.x == other.x and self.y == other.y
-
-    def __repr__(self) -> str:
-        return f"({self.x},{self.y})"
-
-    @property
-    def direction_name(self) -> str:
-        return self.UNIT_VECTOR_NAMES_FROM_VECTOR.get((self.x, self.y), "not_unit_vector")
-
-    @classmethod
-    def UP(cls):
-        return cls((0, -1))
-
-    @classmethod
-    def RIGHT(cls):
-        return cls((1, 0))
-
-    @classmethod
-    def DOWN(cls):
-        return cls((0, 1))
-
-    @classmethod
-    def LEFT(cls):
-        return cls((-1, 0))
-
-
-class Vector(UnitVector):
-    def __init__(self, values: tuple[int, int]):
-        super().__init__(values)
-
-    def __add__(self, other: Vector) -> Vector:
-        return Vector((self.x + other.x, self.y + other.y))
-
-    def __sub__(self, other: Vector) -> Vector:
-        return Vector((self.x - other.x, self.y - other.y))
-
-    @classmethod
-    def zero(cls):
-        return cls((0, 0))
-
-    @property
-    def rotated_right(self) -> Vector:
-        return Vector((self.y * -abs(self.y), self.x))
-
-    @property
-    def rotated_left(self) -> Vector:
-        return Vector((self.y, self.x * -abs(self.x)))
-
-    def manhattan_distance(self, other: Vector) -> int:
-        return abs(self.x - other.x, self.y - other.y)
+HEAT_LOSS_TABLE = translation_table({str(digit): digit for digit in range(10)})
 
 
 class Square:
-    ZERO = Vector.zero()
+    ZERO = Vector2D.zero()
 
-    def __init__(self, coordinate: Vector, distance_to_end_node: int, heat_loss: int, parent: Square = None):
+    def __init__(self, coordinate: Vector2D, distance_to_end_node: int, heat_loss: int, parent: Square = None):
         self.coordinate = coordinate
         self.parent = parent
         self.distance_to_end_node = distance_to_end_node
@@ -101,7 +41,7 @@ class Square:
     def f(self) -> int:
         return self.heat_loss + self.distance_to_end_node
 
-    def path_to_root_parent(self) -> tuple[Vector]:
+    def path_to_root_parent(self) -> tuple[Vector2D]:
         parent = self.parent
         path = [self]
         while parent is not None:
@@ -109,7 +49,7 @@ class Square:
             parent = parent.parent
         return tuple(reversed(path))
 
-    def is_valid_next(self, next_coordinate: Vector) -> bool:
+    def is_valid_next(self, next_coordinate: Vector2D) -> bool:
         if self.parent is None:
             return True
         direction = next_coordinate - self.coordinate
@@ -117,30 +57,26 @@ class Square:
 
 
 class LavaGrid:
+    # Coordinates are (row, column) here. Right, down, up, left as (row, column) steps
+    STEPS = (Vector2D((0, 1)), Vector2D((1, 0)), Vector2D((-1, 0)), Vector2D((0, -1)))
+
     def __init__(self, grid: Grid):
         self.grid = grid
-        self.n = len(grid)
-        self.m = len(grid[0])
-        print(f"Grid size: ({self.m}, {self.n})")
-        self.distances_to_end_node = self.__distances_to_end_node(grid)
-
-    def __edge_checks(self, coordinate: Vector) -> (bool, bool, bool, bool):
-        return coordinate.y < self.m - 1, coordinate.x < self.n - 1, coordinate.x > 0, coordinate.y > 0
+        self.n = grid.n
+        self.m = grid.m
+        width = grid.width
+        self.step_offsets = tuple(step.x * width + step.y for step in self.STEPS)
 
     def __repr__(self) -> str:
-        lines = '\n'.join(['\t' + ''.join(str(char) for char in line) for line in self.grid])
+        lines = '\n'.join(['\t' + ''.join(str(heat_loss) for heat_loss in line) for line in self.grid.rows()])
         return pad_with_horizontal_rules(lines)
 
-    @staticmethod
-    def __distances_to_end_node(grid: Grid) -> Grid:
-        m = len(grid[0])
-        n = len(grid)
-        return [[m - j + n - i - 2 for j in range(m)] for i in range(n)]
+    def distance_to_end_node(self, coordinate: Vector2D) -> int:
+        return self.n - 1 - coordinate.x + self.m - 1 - coordinate.y
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        grid = [[int(char) for char in line] for line in lines]
-        return cls(grid)
+        return cls(Grid.from_lines(lines, HEAT_LOSS_TABLE))
 
     def potential_squares(self, square: Square) -> list[Square]:
         previous_square_coordinate = None
@@ -148,65 +84,72 @@ class LavaGrid:
         if previous_square is not None:
             previous_square_coordinate = previous_square.coordinate
         coordinate = square.coordinate
-        coordinate_indices = ((coordinate.x, coordinate.y + 1),
-                              (coordinate.x + 1, coordinate.y),
-                              (coordinate.x - 1, coordinate.y),
-                              (coordinate.x, coordinate.y - 1),
-                              )
-        edge_checks = self.__edge_checks(coordinate)
+        index = self.grid.index(coordinate.x, coordinate.y)
+        cells, border = self.grid.cells, self.grid.border
         squares = []
-        for edge_check, coordinate_indices in zip(edge_checks, coordinate_indices):
-            potential_coordinate = Vector(coordinate_indices)
-            if potential_coordinate != previous_square_coordinate and edge_check:
-                next_square = self.square_from_grid(potential_coordinate, parent=square)
-                if square.is_valid_next(potential_coordinate):
-                    squares.append(next_square)
+        for step, offset in zip(self.STEPS, self.step_offsets):
+            heat_loss = cells[index + offset]
+            if heat_loss == border:
+                continue
+            potential_coordinate = coordinate + step
+            if potential_coordinate != previous_square_coordinate and square.is_valid_next(potential_coordinate):
+                squares.append(Square(potential_coordinate, self.distance_to_end_node(potential_coordinate),
+                                      heat_loss, parent=square))
         return squares
 
-    def square_from_grid(self, coordinate: Vector, parent: Square) -> Square:
-        try:
-            _square = Square(coordinate,
-                             self.distances_to_end_node[coordinate.x][coordinate.y],
-                             self.grid[coordinate.x][coordinate.y],
-                             parent=parent)
-        except IndexError as e:
-            print(f"Bad coordinate: {coordinate}")
-            print(f"Grid size: ({self.n},{self.m})")
-            raise e
-        return _square
-
-    def minimal_route_heat_loss(self) -> (int, list[Vector]):
+    def square_from_grid(self, coordinate: Vector2D, parent: Square) -> Square:
+        if not (0 <= coordinate.x < self.n and 0 <= coordinate.y < self.m):
+            raise IndexError(f"Bad coordinate: {coordinate}, grid size: ({self.n},{self.m})")
+        return Square(coordinate,
+                      self.distance_to_end_node(coordinate),
+                      self.grid.cell(coordinate.x, coordinate.y),
+                      parent=parent)
+
+    def minimal_route_heat_loss(self) -> (int, list[Vector2D]):
         # Definitely a pathfinding problem.
-        start_square = self.square_from_grid(Vector((0, 0)), parent=None)
+        start_square = self.square_from_grid(Vector2D((0, 0)), parent=None)
         start_square.heat_loss = 0  # We don't include the starting heat loss
 
         open_squares = PriorityQueue()
         open_squares.put(start_square)
 
-        final_coordinate = Vector((self.n - 1, self.m - 1))
-        checked_grid = [[False for _ in range(self.m)] for _ in range(self.n)]
+        final_coordinate = Vector2D((self.n - 1, self.m - 1))
+        checked_grid = Grid.filled(self.n, self.m, 0)
 
+        expanded = 0
         while not open_squares.empty():
             square = open_squares.get()
             if square.coordinate == final_coordinate:
+                count("squares expanded", expanded)
+                gauge("open squares left", open_squares.qsize())
                 return square.heat_loss, square.path_to_root_parent()
+            expanded += 1
 
-            checked_grid[square.coordinate.x][square.coordinate.y] = 1
+            checked_grid[self.grid.index(square.coordinate.x, square.coordinate.y)] = 1
 
             potential_next_squares = self.potential_squares(square)
             for potential_next_square in potential_next_squares:
                 next_square_coord = potential_next_square.coordinate
-                if checked_grid[next_square_coord.x][next_square_coord.y]:
+                if checked_grid[self.grid.index(next_square_coord.x, next_square_coord.y)]:
                     continue
 
                 open_squares.put(potential_next_square)
 
 
+def parse(file_path: str) -> LavaGrid:
+    return LavaGrid.from_lines(read_lines(file_path))
+
+
+def solve(lava_grid: LavaGrid) -> int:
+    heat_loss, _ = lava_grid.minimal_route_heat_loss()
+    return heat_loss
+
+
 def tests1():
-    up = Vector.UP()
-    left = Vector.LEFT()
-    down = Vector.DOWN()
-    right = Vector.RIGHT()
+    up = Vector2D.UP()
+    left = Vector2D.LEFT()
+    down = Vector2D.DOWN()
+    right = Vector2D.RIGHT()
 
     assert right.rotated_right == down
     assert down.rotated_right == left
@@ -231,8 +174,7 @@ def tests2():
 
 
 def tests3():
-    # Profiling (493 answer)
-    # cProfile.run("re.compile(LavaGrid.from_lines(read_lines(\"day_17_1_test_input2.txt\")).minimal_route_heat_loss())")
+    # Profiling (493 answer), python -m aoc 17.1 --input day_17_1_test_input2.txt --profile cprofile
     lava_grid = LavaGrid.from_lines(read_lines("day_17_1_test_input2.txt"))
     e, path = lava_grid.minimal_route_heat_loss()
     for p in path:
@@ -244,11 +186,11 @@ def main():
     tests2()
     tests3()
 
-    lava_grid = LavaGrid.from_lines(read_lines("day_17_1_input.txt"))
+    lava_grid = parse(INPUT_FILE_NAME)
     print(lava_grid)
     # 814 - coded myself??? - too high
     # 797 - answer
-    e, path = lava_grid.minimal_route_heat_loss()
+    e = solve(lava_grid)
     print(e)
 
 
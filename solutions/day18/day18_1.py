@@ -1,6 +1,11 @@
 from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
-from handy_dandy_library.linear_algebra import Vector2D, polygon_area, integer_border_points_count
+from handy_dandy_library.linear_algebra import Vector2D, PolygonAccumulator, polygon_area, integer_border_points_count
+
+from typing import Callable, Iterable
+
+
+INPUT_FILE_NAME = "day_18_1_input.txt"
 
 
 def sign(x: int) -> int:
@@ -77,15 +82,28 @@ class Shape:
 class Digger:
     def __init__(self, color_vectors: list[ColorVector]):
         self.color_vectors = color_vectors
-        self.shape = Shape(self.__grid_corner_coordinates(color_vectors))
 
     @classmethod
     def from_lines(cls, lines: list[str]):
         return cls([ColorVector.from_line(line) for line in lines])
 
+    @property
+    def shape(self) -> Shape:
+        return Shape(self.__grid_corner_coordinates(self.color_vectors))
+
     @property
     def area(self):
-        return self.shape.dug_area
+        return self.dug_area_from_edges(color_vector.direction_vector for color_vector in self.color_vectors)
+
+    @staticmethod
+    def dug_area_from_edges(edges: Iterable[Vector2D]) -> int:
+        return PolygonAccumulator.from_edges(edges).enclosed_points
+
+    @classmethod
+    def dug_area_from_lines(cls, lines: Iterable[str],
+                            color_vector_from_line: Callable[[str], ColorVector] = ColorVector.from_line) -> int:
+        """ Streams the dig plan, so no vertex list is ever built """
+        return cls.dug_area_from_edges(color_vector_from_line(line).direction_vector for line in lines)
 
     @staticmethod
     def __grid_corner_coordinates(color_vectors: list[ColorVector]) -> list[Vector2D]:
@@ -95,16 +113,25 @@ class Digger:
         return coordinates
 
 
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str]) -> int:
+    return Digger.from_lines(lines).area
+
+
 def tests():
     digger = Digger.from_lines(read_lines("day_18_1_test_input1.txt"))
     assert digger.area == 62
+    assert digger.shape.dug_area == 62
+    assert Digger.dug_area_from_lines(read_lines("day_18_1_test_input1.txt")) == 62
 
 
 def main():
     tests()
 
-    digger = Digger.from_lines(read_lines("day_18_1_input.txt"))
-    t = digger.area
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,24 +1,33 @@
-from handy_dandy_library.file_processing import read_lines
-from day18_1 import Digger, ColorVector
+from handy_dandy_library.file_processing import read_lines, stream_lines
+from day18_1 import Digger, ColorVector, parse
+
+
+INPUT_FILE_NAME = "day_18_1_input.txt"
 
 
 def read_coordinates_hexadecimal_encoded(lines: list[str]) -> list[ColorVector]:
     return [ColorVector.from_line_but_hexadecimal_twist(line) for line in lines]
 
 
+def solve(lines: list[str]) -> int:
+    return Digger.dug_area_from_lines(lines, ColorVector.from_line_but_hexadecimal_twist)
+
+
 def tests():
     color_vectors = read_coordinates_hexadecimal_encoded(read_lines("day_18_1_test_input1.txt"))
     digger = Digger(color_vectors)
 
     assert digger.area == 952408144115
 
+    lines = read_lines("day_18_1_test_input1.txt")
+    assert Digger.dug_area_from_lines(lines, ColorVector.from_line_but_hexadecimal_twist) == 952408144115
+
 
 def main():
     tests()
 
-    color_vectors = read_coordinates_hexadecimal_encoded(read_lines("day_18_1_input.txt"))
-    digger = Digger(color_vectors)
-    t = digger.area
+    lines = (line.decode() for line in stream_lines(INPUT_FILE_NAME))
+    t = solve(lines)
     print(t)
 
 
@@ -1,4 +1,5 @@
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.parse_cache import cached_parser
 from handy_dandy_library.string_manipulations import find_first_char_index
 
 from collections import defaultdict
@@ -7,6 +8,10 @@ import operator
 
 from typing import Callable
 
+
+INPUT_FILE_NAME = "day_19_1_input.txt"
+
+
 type BinaryOperator = Callable[[int, int], bool]
 type Criteria = Callable[[int], bool]
 type Part = dict[str, int]
@@ -148,22 +153,31 @@ class Policy:
                 bounds_copy1 = bounds.copy()
                 op_code = rule.criteria.operation_encoding
                 threshold = rule.criteria.threshold
-                bounds_copy1[(rule.part_type, op_code)] = threshold + -1 + 2 * op_code
-                bounds[(rule.part_type, 1 - op_code)] = threshold
+                self.tighten(bounds_copy1, rule.part_type, op_code, threshold + -1 + 2 * op_code)
+                self.tighten(bounds, rule.part_type, 1 - op_code, threshold)
                 nodes_to_check.append((rule.target, bounds_copy1))
 
             final_rule = rule_set.rules[-1]
             bounds_copy2 = bounds.copy()
             op_code = final_rule.criteria.operation_encoding
             threshold = final_rule.criteria.threshold
-            bounds_copy2[(final_rule.part_type, op_code)] = threshold - 1 + 2 * op_code
-            bounds[(final_rule.part_type, 1 - op_code)] = threshold
+            self.tighten(bounds_copy2, final_rule.part_type, op_code, threshold - 1 + 2 * op_code)
+            self.tighten(bounds, final_rule.part_type, 1 - op_code, threshold)
             nodes_to_check.append((final_rule.target, bounds_copy2))
             nodes_to_check.append((rule_set.default_target, bounds))
         return total
 
+    @staticmethod
+    def tighten(bounds, part_type: str, op_code: int, threshold: int) -> None:
+        # op_code 0 is an upper bound and 1 a lower one. A rule deeper down the tree on the same category can only
+        # narrow the range it arrived with, never widen it again
+        key = (part_type, op_code)
+        if key in bounds:
+            threshold = min(bounds[key], threshold) if op_code == 0 else max(bounds[key], threshold)
+        bounds[key] = threshold
+
     def bound_volume(self, bounds) -> int:
-        lengths = (1 + bounds.get((part_type, 0), 4000) - bounds.get((part_type, 1), 1) for part_type in
+        lengths = (max(0, 1 + bounds.get((part_type, 0), 4000) - bounds.get((part_type, 1), 1)) for part_type in
                    self.part_types)
         return reduce(operator.mul, lengths)
 
@@ -199,6 +213,20 @@ def read_parts(lines: list[str]) -> list[Part]:
     return [part_from_line(line) for line in lines[empty_line_index+1:]]
 
 
+@cached_parser(version=1)
+def read_part_manager(file_path: str) -> PartManager:
+    lines = read_lines(file_path)
+    return PartManager(read_parts(lines), Policy.from_lines(lines))
+
+
+def parse(file_path: str) -> PartManager:
+    return read_part_manager(file_path)
+
+
+def solve(parts_manager: PartManager) -> int:
+    return parts_manager.sum_of_accepted_parts()
+
+
 def tests():
     lines = read_lines("day_19_1_test_input1.txt")
     policy = Policy.from_lines(lines)
@@ -211,11 +239,7 @@ def tests():
 def main():
     tests()
 
-    lines = read_lines("day_19_1_input.txt")
-    policy = Policy.from_lines(lines)
-    parts = read_parts(lines)
-    parts_manager = PartManager(parts, policy)
-    total_accepted_sum = parts_manager.sum_of_accepted_parts()
+    total_accepted_sum = solve(parse(INPUT_FILE_NAME))
     assert total_accepted_sum == 456651
 
 
@@ -1,5 +1,12 @@
 from handy_dandy_library.file_processing import read_lines
-from day19_1 import Policy
+from day19_1 import Policy, PartManager, parse
+
+
+INPUT_FILE_NAME = "day_19_1_input.txt"
+
+
+def solve(parts_manager: PartManager) -> int:
+    return parts_manager.policy.number_of_distinct_accepted_combinations()
 
 
 def tests():
@@ -8,13 +15,16 @@ def tests():
     t = policy.number_of_distinct_accepted_combinations()
     assert t == 167409079868000
 
+    # A second test on x further down the tree narrows the range x arrived with, it never widens it
+    assert Policy.from_lines(["in{x<2000:b,R}", "b{x<3000:A,R}", ""]).number_of_distinct_accepted_combinations() \
+        == 1999 * 4000 ** 3
+    assert Policy.from_lines(["in{x<2000:b,R}", "b{x>3000:A,R}", ""]).number_of_distinct_accepted_combinations() == 0
+
 
 def main():
     tests()
 
-    lines = read_lines("day_19_1_input.txt")
-    policy = Policy.from_lines(lines)
-    t = policy.number_of_distinct_accepted_combinations()
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
     assert t == 131899818301477
 
@@ -1,12 +1,30 @@
+from __future__ import annotations
+
 import operator
 
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.parse_cache import cached_parser
 from handy_dandy_library.string_manipulations import find_first_char_index
 
+from array import array
+from collections import Counter
 from functools import reduce
+from itertools import pairwise
+from typing import Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
+INPUT_FILE_NAME = "puzzle2_1_input.txt"
 
+
+COLOURS = ("red", "green", "blue")
 COLOURS_EMPTY = {"red": 0, "green": 0, "blue": 0}
+# Games times configurations compared at once by the numpy path, bounding its temporary arrays
+COMPARISON_BLOCK_SIZE = 1 << 22
 
 
 class Round:
@@ -74,23 +92,115 @@ class Game:
         return Round.from_colours(-1, maximal_colours)
 
 
-def total_valid_game_ids(games: list[Game]):
-    return sum(game.game_id if game.is_possible() else 0 for game in games)
+class GameLog:
+    """
+    Columnar games: the red, green and blue counts of every round of every game back to back in flat arrays, game i
+    owning rounds offsets[i]:offsets[i + 1]. Whether a bag could have played a game, and a game's power, only depend
+    on the game's largest count of each colour, so those are reduced once up front
+    """
+    def __init__(self, game_ids: Sequence[int], offsets: Sequence[int], counts: Mapping[str, Sequence[int]]):
+        self.game_ids = array('q', game_ids)
+        self.offsets = array('q', offsets)
+        self.counts = {colour: array('q', counts[colour]) for colour in COLOURS}
+        self.maxima = {colour: array('q', (max(colour_counts[start:end], default=0)
+                                           for start, end in pairwise(self.offsets)))
+                       for colour, colour_counts in self.counts.items()}
+
+    @classmethod
+    def from_games(cls, games: list[Game]) -> GameLog:
+        offsets = [0]
+        counts = {colour: [] for colour in COLOURS}
+        for game in games:
+            for game_round in game.rounds:
+                for colour in COLOURS:
+                    counts[colour].append(game_round.colours[colour])
+            offsets.append(offsets[-1] + len(game.rounds))
+        return cls([game.game_id for game in games], offsets, counts)
+
+    def __repr__(self) -> str:
+        return f"GameLog({len(self)} games, {self.offsets[-1]} rounds)"
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    def total_valid_game_ids(self, max_colours_configurations: Sequence[Mapping[str, int]]) -> list[int]:
+        """ For each bag configuration, the sum of the ids of the games it could have played """
+        limits = [[configuration[colour] for colour in COLOURS] for configuration in max_colours_configurations]
+        if np is not None and len(limits) > 1:
+            return self.__total_valid_game_ids_numpy(limits)
+
+        # Games with the same maxima pass or fail together
+        id_sums = Counter()
+        for game_id, *maxima in zip(self.game_ids, *(self.maxima[colour] for colour in COLOURS)):
+            id_sums[tuple(maxima)] += game_id
+        return [sum(id_sum for (red, green, blue), id_sum in id_sums.items()
+                    if red <= max_red and green <= max_green and blue <= max_blue)
+                for max_red, max_green, max_blue in limits]
+
+    def __total_valid_game_ids_numpy(self, limits: list[list[int]]) -> list[int]:
+        maxima = np.array([self.maxima[colour] for colour in COLOURS], dtype=np.int64).T
+        game_ids = np.frombuffer(self.game_ids, dtype=np.int64)
+        limits = np.array(limits, dtype=np.int64)
+        block = max(1, COMPARISON_BLOCK_SIZE // max(len(self), 1))
+        totals = []
+        for start in range(0, len(limits), block):
+            possible = (maxima[np.newaxis, :, :] <= limits[start:start + block, np.newaxis, :]).all(axis=2)
+            totals.extend((possible @ game_ids).tolist())
+        return totals
+
+    def total_power(self) -> int:
+        return sum(map(lambda red, green, blue: red * green * blue, *(self.maxima[colour] for colour in COLOURS)))
+
+
+def total_valid_game_ids(games: list[Game] | GameLog,
+                         max_colours: Mapping[str, int] | Sequence[Mapping[str, int]] | None = None) -> int | list[int]:
+    """ One bag configuration (Round.DEFAULT_MAX_COLOURS when None) gives one total, a sequence of them a list """
+    if max_colours is None:
+        max_colours = Round.DEFAULT_MAX_COLOURS
+    if not isinstance(games, GameLog):
+        if max_colours is Round.DEFAULT_MAX_COLOURS:
+            return sum(game.game_id if game.is_possible() else 0 for game in games)
+        games = GameLog.from_games(games)
+    if isinstance(max_colours, Mapping):
+        return games.total_valid_game_ids([max_colours])[0]
+    return games.total_valid_game_ids(max_colours)
+
+
+@cached_parser(version=1)
+def read_games(file_path: str) -> list[Game]:
+    return [Game.from_string(game_phrase) for game_phrase in read_lines(file_path)]
+
+
+@cached_parser(version=1)
+def read_game_log(file_path: str) -> GameLog:
+    return GameLog.from_games(read_games.uncached(file_path))
 
 
 def total_valid_game_ids_from_file_path(file_path: str) -> int:
-    games = (Game.from_string(game_phrase) for game_phrase in read_lines(file_path))
-    return total_valid_game_ids(games)
+    return total_valid_game_ids(read_games(file_path))
+
+
+def parse(file_path: str) -> GameLog:
+    return read_game_log(file_path)
+
+
+def solve(game_log: GameLog) -> int:
+    return total_valid_game_ids(game_log)
 
 
 def tests():
     assert total_valid_game_ids_from_file_path("puzzle2_1_test_input.txt") == 8
+    game_log = read_game_log("puzzle2_1_test_input.txt")
+    assert solve(game_log) == 8
+    configurations = [Round.DEFAULT_MAX_COLOURS, {"red": 20, "green": 20, "blue": 20}, COLOURS_EMPTY]
+    assert total_valid_game_ids(game_log, configurations) == [8, 15, 0]
+    assert total_valid_game_ids(read_games("puzzle2_1_test_input.txt"), configurations) == [8, 15, 0]
 
 
 def main():
     tests()
 
-    total = total_valid_game_ids_from_file_path("puzzle2_1_input.txt")
+    total = solve(parse(INPUT_FILE_NAME))
     print(total)
 
 
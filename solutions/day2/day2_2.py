@@ -1,5 +1,8 @@
 from handy_dandy_library.file_processing import read_lines
-from day2_1 import Game
+from day2_1 import Game, GameLog, read_games, parse
+
+
+INPUT_FILE_NAME = "puzzle2_1_input.txt"
 
 
 def total_power(games: list[Game]) -> int:
@@ -7,8 +10,11 @@ def total_power(games: list[Game]) -> int:
 
 
 def total_power_from_file_path(file_path: str) -> int:
-    games = [Game.from_string(game_phrase) for game_phrase in read_lines(file_path)]
-    return sum(game.minimum_possible_round().power() for game in games)
+    return total_power(read_games(file_path))
+
+
+def solve(game_log: GameLog) -> int:
+    return game_log.total_power()
 
 
 def tests():
@@ -21,12 +27,13 @@ def tests():
     assert total_power(games) == 2286
 
     assert total_power_from_file_path("puzzle2_1_test_input.txt") == 2286
+    assert solve(parse("puzzle2_1_test_input.txt")) == 2286
 
 
 def main():
     tests()
 
-    t = total_power_from_file_path("puzzle2_1_input.txt")
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
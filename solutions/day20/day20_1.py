@@ -1,9 +1,14 @@
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.graph import CSRGraph
+from handy_dandy_library.instrumentation import count
 from collections import deque, defaultdict
 from abc import ABC, abstractmethod
 from typing import Callable
 
 
+INPUT_FILE_NAME = "day_20_1_input.txt"
+
+
 type PulseOutput = list[Pulse]
 type SearchParams = list[tuple[str, int]]
 
@@ -126,7 +131,7 @@ class PulseModuleCreator:
     @classmethod
     def pulse_modules(cls, lines: list[str]) -> list[PulseModule]:
         modules = [cls.__module_from_line(line) for line in lines]
-        print(modules)
+        count("modules", len(modules))
         return modules
 
     @classmethod
@@ -168,17 +173,21 @@ class PulseProcessor:
     def state(self):
         return tuple(pulse_module.state for pulse_module in self.pulse_module_map.values())
 
+    @property
+    def module_graph(self) -> CSRGraph:
+        return CSRGraph.from_adjacency({name: pulse_module.destinations
+                                        for name, pulse_module in self.pulse_module_map.items()})
+
     def update_conjunction_modules(self) -> None:
-        # TODO change from O(n^2 * m) to O(n^2) where m is the average # of destinations
+        # A conjunction's inputs are its predecessors, i.e. its successors in the reversed graph
+        module_graph = self.module_graph
+        input_graph = module_graph.reversed()
         conjunction_modules = [pulse_module
                                for pulse_module in self.pulse_module_map.values()
                                if isinstance(pulse_module, Conjunction)]
         for conjunction_module in conjunction_modules:
-            input_module_names = [pulse_module.name
-                                  for pulse_module in self.pulse_module_map.values()
-                                  for destination in pulse_module.destinations
-                                  if destination == conjunction_module.name]
-            conjunction_module.update_inputs_before_process(input_module_names)
+            input_modules = input_graph.successors(module_graph.node(conjunction_module.name))
+            conjunction_module.update_inputs_before_process([module_graph.label(node) for node in input_modules])
         return None
 
     @property
@@ -262,11 +271,29 @@ class PulseProcessor:
         raise ZeroDivisionError
 
 
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str], button_pushes: int = 1_000) -> int:
+    pulse_processor = PulseProcessor(PulseModuleCreator.pulse_modules(lines))
+    for _ in range(button_pushes):
+        pulse_processor.push_the_button()
+    count_pulses(pulse_processor)
+    return pulse_processor.pulse_product
+
+
+def count_pulses(pulse_processor: PulseProcessor) -> None:
+    count("button presses", pulse_processor.number_of_button_presses)
+    count("low pulses", pulse_processor.low_pulses_count)
+    count("high pulses", pulse_processor.high_pulses_count)
+    return None
+
+
 def test1():
     start_modules = PulseModuleCreator.pulse_modules(read_lines("day_20_1_test_input1.txt"))
     pulse_processor = PulseProcessor(start_modules)
-    for i in range(1_000):
-        print(f"Pushing the button #{i+1}")
+    for _ in range(1_000):
         pulse_processor.push_the_button()
     print(pulse_processor.pulse_product, pulse_processor.low_pulses_count, pulse_processor.high_pulses_count)
     assert pulse_processor.pulse_product == 32_000_000
@@ -275,8 +302,7 @@ def test1():
 def test2():
     start_modules = PulseModuleCreator.pulse_modules(read_lines("day_20_1_test_input2.txt"))
     pulse_processor = PulseProcessor(start_modules)
-    for i in range(1_000):
-        print(f"Pushing the button #{i+1}")
+    for _ in range(1_000):
         pulse_processor.push_the_button()
     print(pulse_processor.pulse_product, pulse_processor.low_pulses_count, pulse_processor.high_pulses_count)
     assert pulse_processor.pulse_product == 11_687_500
@@ -286,10 +312,9 @@ def main():
     test1()
     test2()
 
-    start_modules = PulseModuleCreator.pulse_modules(read_lines("day_20_1_input.txt"))
+    start_modules = PulseModuleCreator.pulse_modules(parse(INPUT_FILE_NAME))
     pulse_processor = PulseProcessor(start_modules)
-    for i in range(1_000):
-        print(f"Pushing the button #{i+1}")
+    for _ in range(1_000):
         pulse_processor.push_the_button()
     print(pulse_processor.pulse_product, pulse_processor.low_pulses_count, pulse_processor.high_pulses_count)
 
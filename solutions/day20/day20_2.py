@@ -1,15 +1,20 @@
-from handy_dandy_library.file_processing import read_lines
-from day20_1 import PulseProcessor, PulseModuleCreator
+from day20_1 import PulseProcessor, PulseModuleCreator, count_pulses, parse
 from functools import reduce
 import operator
 
 
+INPUT_FILE_NAME = "day_20_1_input.txt"
+
+
+def solve(lines: list[str], feeders: tuple[str, ...] = ("mp", "qt", "qb", "ng")) -> int:
+    pulse_processor = PulseProcessor(PulseModuleCreator.pulse_modules(lines))
+    cycle_lengths = pulse_processor.cycle_lengths([(name, 0) for name in feeders])
+    count_pulses(pulse_processor)
+    return reduce(operator.mul, cycle_lengths)
+
+
 def main():
-    start_modules = PulseModuleCreator.pulse_modules(read_lines("day_20_1_input.txt"))
-    pulse_processor = PulseProcessor(start_modules)
-    cycle_numbers = pulse_processor.cycle_lengths([(name, 0) for name in ("mp", "qt", "qb", "ng")])
-    print(cycle_numbers)
-    t = reduce(operator.mul, cycle_numbers)
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
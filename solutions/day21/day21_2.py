@@ -1,8 +1,13 @@
 from handy_dandy_library.file_processing import read_lines
-from day21_1 import Garden, Vector
+from handy_dandy_library.instrumentation import gauge
+from handy_dandy_library.linear_algebra import Vector2D
+from day21_1 import Garden, parse
 
 
-def shape_data(start_square: Vector, iter_count: int = 65, shape_name: str = '',
+INPUT_FILE_NAME = "day_21_1_input.txt"
+
+
+def shape_data(start_square: Vector2D, iter_count: int = 65, shape_name: str = '',
                verbose: bool = False) -> int:
     garden = Garden.from_lines(read_lines("day_21_1_input.txt"))
     reachable_plots = garden.reachable_plots(iter_count, start_square)
@@ -11,7 +16,7 @@ def shape_data(start_square: Vector, iter_count: int = 65, shape_name: str = '',
         garden.update_to_s([garden.start_square])
         print(garden)
         print(iter_count, start_square)
-    print(f"{shape_name}: {len(reachable_plots)}")
+    gauge(f"{shape_name} reachable plots".lstrip(), len(reachable_plots))
     return len(reachable_plots)
 
 
@@ -22,15 +27,15 @@ def quadratic(coefficients, n):
     return a * n ** 2 + b * n + c
 
 
-def main_quadratic():
-    number_of_steps = 26501365
-    garden = Garden.from_lines(read_lines("day_21_1_input.txt"))
+def solve(garden: Garden, number_of_steps: int = 26501365) -> int:
     n = garden.n
     n_half = n // 2
-
     y = [garden.reachable_plot_count(n_half + i * n) for i in range(3)]
-    print(y)
-    t = quadratic(y, ((number_of_steps - n_half) // n))
+    return quadratic(y, ((number_of_steps - n_half) // n))
+
+
+def main_quadratic():
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -54,11 +59,11 @@ def main():
                   65 + e, 65 + e, 65 + e, 65 + e,
                   130 + e, 130 + e, 130 + e, 130 + e)
 
-    start_squares = (Vector((0, 65)), Vector((65, 130)), Vector((130, 65)), Vector((65, 0)),
-                     Vector((65, 65)),
-                     Vector((0, 65)), Vector((65, 130)), Vector((130, 65)), Vector((65, 0)),
-                     Vector((0, 0)), Vector((0, 130)), Vector((130, 0)), Vector((130, 130)),
-                     Vector((130, 130)), Vector((130, 0)), Vector((0, 0)), Vector((0, 130)))
+    start_squares = (Vector2D((0, 65)), Vector2D((65, 130)), Vector2D((130, 65)), Vector2D((65, 0)),
+                     Vector2D((65, 65)),
+                     Vector2D((0, 65)), Vector2D((65, 130)), Vector2D((130, 65)), Vector2D((65, 0)),
+                     Vector2D((0, 0)), Vector2D((0, 130)), Vector2D((130, 0)), Vector2D((130, 130)),
+                     Vector2D((130, 130)), Vector2D((130, 0)), Vector2D((0, 0)), Vector2D((0, 130)))
     assert len(iterations) == len(shape_names) == len(start_squares) == 17
     shapes_data = {shape_name: shape_data(start_square, iteration, shape_name)
                    for shape_name, iteration, start_square in zip(shape_names, iterations, start_squares)}
@@ -2,12 +2,16 @@ from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
 from handy_dandy_library.string_manipulations import make_blue
 from handy_dandy_library.linear_algebra import Vector3D
+from handy_dandy_library.parse_cache import cached_parser
 
 from collections import defaultdict, deque
 from abc import abstractmethod
 from typing import Iterable
 
 
+INPUT_FILE_NAME = "day_22_1_input.txt"
+
+
 class Brick:
     def __init__(self, start: Vector3D, end: Vector3D, shape: Vector3D):
         self.start = start
@@ -178,6 +182,7 @@ class FallingBricks:
 
     def __init__(self, bricks: list[Brick]):
         self.bricks = self.__sorted_bricks(bricks)
+        self.__bricks_supported_by = None
 
     def __len__(self) -> int:
         return len(self.bricks)
@@ -209,7 +214,13 @@ class FallingBricks:
     def __sorted_bricks(self, bricks: list[Brick]):
         return sorted(bricks, key=self.__sort_key)
 
-    def bricks_supported_by(self) -> list[set[int]]:
+    def bricks_supported_by(self) -> tuple[frozenset[int], ...]:
+        """ Settled once and then shared by both parts, hence frozen so no caller can change what the next one sees """
+        if self.__bricks_supported_by is None:
+            self.__bricks_supported_by = self.__settle()
+        return self.__bricks_supported_by
+
+    def __settle(self) -> tuple[frozenset[int], ...]:
         n = len(self)
         brick_to_brick_supports = [set() for _ in range(n)]
         height_to_bricks = defaultdict(list)
@@ -223,14 +234,14 @@ class FallingBricks:
             brick = self[i]
             brick_frontier = brick.frontier()
             brick_to_brick_supports[i] = set(frontier.add(brick_frontier, brick.height_of_shape, i))
-        return brick_to_brick_supports
+        return tuple(map(frozenset, brick_to_brick_supports))
 
     def number_of_removable_blocks(self) -> int:
         vital_bricks = self.vital_bricks(self.bricks_supported_by())
         return len(self) - len(vital_bricks)
 
     @staticmethod
-    def vital_bricks(brick_supported_by: list[set[int]]) -> set[int]:
+    def vital_bricks(brick_supported_by: tuple[frozenset[int], ...]) -> set[int]:
         vital_bricks = set()
         for brick_supports in brick_supported_by[1:]:
             if len(brick_supports) == 1:
@@ -238,7 +249,7 @@ class FallingBricks:
         return vital_bricks
 
     @staticmethod
-    def __brick_supports(bricks_supported_by: list[list[int]]) -> list[set[int]]:
+    def __brick_supports(bricks_supported_by: tuple[frozenset[int], ...]) -> list[set[int]]:
         brick_supports = [set() for _ in range(len(bricks_supported_by))]
         for i, values in enumerate(bricks_supported_by):
             for value in values:
@@ -263,6 +274,19 @@ class FallingBricks:
         return total
 
 
+@cached_parser(version=2)
+def read_falling_bricks(file_path: str) -> FallingBricks:
+    return FallingBricks([BrickFactory.from_line(line) for line in read_lines(file_path)])
+
+
+def parse(file_path: str) -> FallingBricks:
+    return read_falling_bricks(file_path)
+
+
+def solve(falling_bricks: FallingBricks) -> int:
+    return falling_bricks.number_of_removable_blocks()
+
+
 def tests():
     falling_bricks = FallingBricks([BrickFactory.from_line(line) for line in read_lines("day_22_1_test_input.txt")])
     brick_supports = falling_bricks.bricks_supported_by()
@@ -280,8 +304,7 @@ def tests():
 def main():
     tests()
 
-    falling_bricks = FallingBricks([BrickFactory.from_line(line) for line in read_lines("day_22_1_input.txt")])
-    t = falling_bricks.number_of_removable_blocks()
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
     assert t == 515
 
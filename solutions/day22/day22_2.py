@@ -1,6 +1,13 @@
 from handy_dandy_library.file_processing import read_lines
 
-from day22_1 import BrickFactory, FallingBricks
+from day22_1 import BrickFactory, FallingBricks, parse
+
+
+INPUT_FILE_NAME = "day_22_1_input.txt"
+
+
+def solve(falling_bricks: FallingBricks) -> int:
+    return falling_bricks.number_of_falls_from_vital_blocks()
 
 
 def tests():
@@ -11,8 +18,7 @@ def tests():
 def main():
     tests()
 
-    falling_bricks = FallingBricks([BrickFactory.from_line(line) for line in read_lines("day_22_1_input.txt")])
-    t = falling_bricks.number_of_falls_from_vital_blocks()
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,110 +1,80 @@
 from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.graph import CSRGraph
+from handy_dandy_library.grid import Grid, translation_table, reverse_translation_table
+from handy_dandy_library.instrumentation import gauge
+from handy_dandy_library.linear_algebra import Vector2D
 from handy_dandy_library.string_manipulations import pad_with_horizontal_rules
 
 from collections import deque, defaultdict
 
 
-type Grid = list[list[int]]
-type Adjacency_set2d = dict[Vector, set[Vector]]
-type Adjacency_weights = dict[tuple[Vector, Vector], int]
+INPUT_FILE_NAME = "day_23_1_input.txt"
 
-INF = 10**20
-
-
-class UnitVector:
-    UNIT_VECTOR_CODENAMES = {"up": 0, "right": 1, "down": 2, "left": 3}
-    UNIT_VECTOR_NAMES_FROM_VECTOR = {(1, 0): "right", (0, 1): "down", (-1, 0): "left", (0, -1): "up"}
-
-    def __init__(self, values: tuple[int, int]):
-        self.x = values[0]
-        self.y = values[1]
-
-    def __eq__(self, other: UnitVector) -> bool:
-        if not isinstance(other, UnitVector):
-            return False
-        return self.x == other.x and self.y == other.y
-
-    def __repr__(self) -> str:
-        return f"({self.x},{self.y})"
-
-    @property
-    def direction_name(self) -> str:
-        return self.UNIT_VECTOR_NAMES_FROM_VECTOR.get((self.x, self.y), "not_unit_vector")
-
-
-class Vector(UnitVector):
-    def __init__(self, values: tuple[int, int]):
-        super().__init__(values)
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other: Vector) -> Vector:
-        return Vector((self.x + other.x, self.y + other.y))
-
-    def __sub__(self, other: Vector) -> Vector:
-        return Vector((self.x - other.x, self.y - other.y))
 
-    def __mul__(self, other: int) -> Vector:
-        return Vector((self.x * other, self.y * other))
+type Adjacency_set2d = dict[Vector2D, set[Vector2D]]
+type Adjacency_weights = dict[tuple[Vector2D, Vector2D], int]
 
-    def __rmul__(self, other: int) -> Vector:
-        return self.__mul__(other)
-
-    def __mod__(self, other: int) -> Vector:
-        return Vector((self.x % other, self.y % other))
-
-    @classmethod
-    def zero(cls):
-        return cls((0, 0))
+INF = 10**20
 
 
 class SnowIsland:
     encodings = {'.': 0, '#': 1, '>': 2, '^': 3, 'v': 4, '<': 5, 'S': 6, 'E': 7}
     reverse_encodings = {0: '.', 1: '#', 2: '>', 3: '^', 4: 'v', 5: '<', 6: 'S', 7: 'E'}
     slope_chars = ('<', 'v', '^', '>')
-    UP = Vector((-1, 0))
-    RIGHT = Vector((0, 1))
-    DOWN = Vector((1, 0))
-    LEFT = Vector((0, -1))
+    UP = Vector2D((-1, 0))
+    RIGHT = Vector2D((0, 1))
+    DOWN = Vector2D((1, 0))
+    LEFT = Vector2D((0, -1))
 
-    def __init__(self, encoded_grid: list[list[int]], start_position: Vector, end_position: Vector):
+    def __init__(self, encoded_grid: Grid, start_position: Vector2D, end_position: Vector2D):
         self.grid = encoded_grid
-        self.n = len(encoded_grid)
-        self.m = len(encoded_grid[0])
+        self.n = encoded_grid.n
+        self.m = encoded_grid.m
+        # Right, up, down and left, in the same order as _potential_neighbours
+        up, right, down, left = encoded_grid.offsets
+        self.neighbour_offsets = (right, up, down, left)
 
         self.start_position = start_position
         self.end_position = end_position
         if start_position is None:
-            self.start_position = Vector((0, 1))
+            self.start_position = Vector2D((0, 1))
         if end_position is None:
-            self.end_position = Vector((self.n-1, self.m-2))
+            self.end_position = Vector2D((self.n-1, self.m-2))
 
-    def __getitem__(self, item: Vector) -> int:
-        return self.grid[item.x][item.y]
+    def __getitem__(self, item: Vector2D) -> int:
+        return self.grid.cell(item.x, item.y)
 
-    def __setitem__(self, key: Vector, value: int) -> None:
-        self.grid[key.x][key.y] = value
+    def __setitem__(self, key: Vector2D, value: int) -> None:
+        self.grid[self.grid.index(key.x, key.y)] = value
         return None
 
+    @classmethod
+    def table(cls) -> bytes:
+        return translation_table(cls.encodings)
+
+    @classmethod
+    def reverse_table(cls) -> bytes:
+        return reverse_translation_table({char: code for code, char in cls.reverse_encodings.items()})
+
     def __repr__(self) -> str:
         start_position_encoding = self[self.start_position]
         end_position_encoding = self[self.end_position]
         self[self.start_position] = self.encodings['S']
         self[self.end_position] = self.encodings['E']
-        lines = '\n'.join(''.join(self.reverse_encodings[encoding] for encoding in line) for line in self.grid)
+        lines = '\n'.join(self.grid.to_lines(self.reverse_table()))
         self[self.start_position] = start_position_encoding
         self[self.end_position] = end_position_encoding
         return pad_with_horizontal_rules(lines, rule_length=self.m)
 
     @classmethod
-    def from_lines(cls, lines: list[str], start_position: Vector=None, end_position: Vector=None):
-        encoded_grid = [[cls.encodings[char] for char in line] for line in lines]
-        return cls(encoded_grid, start_position, end_position)
+    def from_lines(cls, lines: list[str], start_position: Vector2D=None, end_position: Vector2D=None):
+        return cls(Grid.from_lines(lines, cls.table()), start_position, end_position)
 
-    def _edge_checks(self, coordinate: Vector) -> (bool, bool, bool, bool):
-        return coordinate.y < self.m - 1, coordinate.x > 0, coordinate.x < self.n - 1, coordinate.y > 0
+    def _edge_checks(self, coordinate: Vector2D) -> (bool, bool, bool, bool):
+        index = self.grid.index(coordinate.x, coordinate.y)
+        cells, border = self.grid.cells, self.grid.border
+        return tuple(cells[index + offset] != border for offset in self.neighbour_offsets)
 
     def _blocking_slope_checks(self, potential_neighbours, outside_grid_checks):
         is_not_blocking_slope = (edge_check if not edge_check
@@ -112,10 +82,10 @@ class SnowIsland:
                                  for i, edge_check in enumerate(outside_grid_checks))
         return is_not_blocking_slope
 
-    def _potential_neighbours(self, coordinate: Vector) -> (Vector, Vector, Vector, Vector):
+    def _potential_neighbours(self, coordinate: Vector2D) -> (Vector2D, Vector2D, Vector2D, Vector2D):
         return coordinate + self.RIGHT, coordinate + self.UP, coordinate + self.DOWN, coordinate + self.LEFT
 
-    def _coord_checks(self, coordinate: Vector, potential_neighbours) -> (bool, bool, bool, bool):
+    def _coord_checks(self, coordinate: Vector2D, potential_neighbours) -> (bool, bool, bool, bool):
         is_not_outside_grid = self._edge_checks(coordinate)
         is_not_forest = (is_not_outside_grid[i] if not is_not_outside_grid[i]
                          else not self.is_forest(potential_neighbours[i])
@@ -123,10 +93,10 @@ class SnowIsland:
         is_not_blocking_slope = self._blocking_slope_checks(potential_neighbours, is_not_outside_grid)
         return (all(checks) for checks in zip(is_not_forest, is_not_blocking_slope))
 
-    def is_forest(self, coordinate: Vector) -> bool:
+    def is_forest(self, coordinate: Vector2D) -> bool:
         return self[coordinate] == 1
 
-    def neighbours(self, coordinate: Vector) -> set[Vector]:
+    def neighbours(self, coordinate: Vector2D) -> set[Vector2D]:
         # Right, Up, Down, Left
         potential_neighbours = self._potential_neighbours(coordinate)
         for i in range(4):
@@ -154,102 +124,69 @@ class DirectedGraph2D:
     def __init__(self, adjacency_set: Adjacency_set2d, adjacency_weights: Adjacency_weights):
         self.adjacency_set = adjacency_set
         self.adjacency_weights = adjacency_weights
-        print(set(adjacency_set.keys()))
-        print({value for values in adjacency_set.values() for value in values})
+        self.graph = CSRGraph.from_adjacency(adjacency_set, adjacency_weights)
+        gauge("junctions", len(self.graph))
 
     def __repr__(self) -> str:
         return str(self.adjacency_set)
 
-    def __getitem__(self, item: Vector) -> set[Vector]:
+    def __getitem__(self, item: Vector2D) -> set[Vector2D]:
         return self.adjacency_set[item]
 
     @property
-    def given_traversal_order(self) -> list[Vector]:
+    def given_traversal_order(self) -> list[Vector2D]:
         return list(self.adjacency_set.keys())
 
-    def visually_sorted(self, grid_size: tuple[int, int]) -> list[Vector]:
-        n = grid_size[0]
-        m = grid_size[1]
-        return [c for i in range(n) for j in range(m) if ((c := Vector((i, j))) in self.adjacency_set)]
-
-    def is_acyclic(self, known_source: Vector) -> bool:
+    def is_acyclic(self, known_source: Vector2D) -> bool:
         return not self.is_cyclic(known_source)
 
-    def is_cyclic(self, known_source: Vector) -> bool:
-        visited = defaultdict(lambda: False)
-        on_stack = defaultdict(lambda: False)
-        stack = [known_source]
+    def is_cyclic(self, known_source: Vector2D) -> bool:
+        return not self.graph.is_acyclic(self.graph.node(known_source))
 
-        while stack:
-            node = stack[-1]
+    def longest_acyclic_path_size(self, start_position: Vector2D) -> int:
+        assert self.is_acyclic(start_position)
+        distances = self.graph.longest_path_lengths()
+        return distances[self.graph.node(start_position)]
 
-            if not visited[node]:
-                visited[node] = True
-                on_stack[node] = True
-            else:
-                on_stack[node] = False
-                stack.pop()
+    def longest_simple_path_size(self, start_position: Vector2D, end_position: Vector2D) -> int:
+        """ Longest walk to end_position that never steps on a square twice, for graphs with cycles too """
+        return self.graph.longest_simple_path_length(self.graph.node(start_position), self.graph.node(end_position))
 
-            for neighbour in self[node]:
-                if not visited[neighbour]:
-                    stack.append(neighbour)
-                elif on_stack[neighbour]:
-                    return True
 
-        return False
+def parse(file_path: str) -> SnowIsland:
+    return SnowIsland.from_lines(read_lines(file_path))
 
-    def longest_acyclic_path_size(self, start_position: Vector, grid_size: tuple[int, int]) -> list[Vector]:
-        assert self.is_acyclic(start_position)
-        topological_sort = self.visually_sorted(grid_size)
-        distances = {node: 0 for node in topological_sort}
-        visited = {topological_sort[-1]}
-        to_visit = [node for node in reversed(topological_sort)]
-
-        def dfs(_node):
-            visited.add(_node)
-            successors = self[_node]
-            for successor in successors:
-                if successor not in visited:
-                    dfs(successor)
-                distances[_node] = max(distances[_node], self.adjacency_weights[successor] + distances[successor])
-
-        for node in to_visit:
-            if node not in visited:
-                dfs(node)
-        print(distances)
-        return distances[start_position]
+
+def solve(snow_island: SnowIsland) -> int:
+    snow_island_graph = DirectedGraph2D(*snow_island.to_adjacency_set())
+    return snow_island_graph.longest_acyclic_path_size(snow_island.start_position)
 
 
 def tests():
-    start_position = Vector((0, 1))
-    end_position = Vector((22, 21))
+    start_position = Vector2D((0, 1))
+    end_position = Vector2D((22, 21))
     snow_island = SnowIsland.from_lines(read_lines("day_23_1_test_input.txt"), start_position, end_position)
     print(snow_island)
     assert snow_island.neighbours(start_position) == {start_position + snow_island.DOWN}
     assert snow_island.neighbours(end_position) == {end_position + snow_island.UP}
-    x1 = Vector((9, 20))
+    x1 = Vector2D((9, 20))
     x2 = x1 + snow_island.RIGHT + snow_island.DOWN
     assert snow_island.neighbours(x1) == {x1 + snow_island.LEFT, x1 + snow_island.RIGHT}
     assert snow_island.neighbours(x1 + snow_island.RIGHT) == {x1, x2}
     assert snow_island.neighbours(x2) == {x2 + snow_island.DOWN}
     assert snow_island.neighbours(x2 + snow_island.DOWN) == {x2 + 2 * snow_island.DOWN}
     snow_island_graph = DirectedGraph2D(*snow_island.to_adjacency_set())
-    grid_size = (snow_island.n, snow_island.m)
-    print(f"Visually sorted: {snow_island_graph.visually_sorted(grid_size)}")
     print(f"Is the graph acyclic?: {snow_island_graph.is_acyclic(start_position)}")
-    assert snow_island_graph.longest_acyclic_path_size(start_position, grid_size) == 94
+    assert snow_island_graph.longest_acyclic_path_size(start_position) == 94
 
 
 def main():
     tests()
 
-    snow_island = SnowIsland.from_lines(read_lines("day_23_1_input.txt"))
+    snow_island = parse(INPUT_FILE_NAME)
     print(snow_island)
-    snow_island_graph = DirectedGraph2D(*snow_island.to_adjacency_set())
-    grid_size = (snow_island.n, snow_island.m)
-    start_position = snow_island.start_position
 
-    t = snow_island_graph.longest_acyclic_path_size(start_position, grid_size)
+    t = solve(snow_island)
     print(t)
 
 
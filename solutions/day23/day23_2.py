@@ -1,37 +1,42 @@
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.instrumentation import count
 from handy_dandy_library.string_manipulations import make_blue, pad_with_horizontal_rules
+from handy_dandy_library.linear_algebra import Vector2D
 
-from day23_1 import SnowIsland, DirectedGraph2D, Vector, Adjacency_set2d, Adjacency_weights
+from day23_1 import SnowIsland, DirectedGraph2D, Adjacency_set2d, Adjacency_weights
 
 from collections import defaultdict, deque
 
 
+INPUT_FILE_NAME = "day_23_1_input.txt"
+
+
 class SnowIslandNoSlopes(SnowIsland):
     encodings = {'.': 0, '#': 1, '>': 0, '^': 0, 'v': 0, '<': 0, 'S': 2, 'E': 3}
     reverse_encodings = {0: '.', 1: '#', 2: 'S', 3: 'E'}
 
-    def _coord_checks(self, coordinate: Vector, potential_neighbours) -> (bool, bool, bool, bool):
+    def _coord_checks(self, coordinate: Vector2D, potential_neighbours) -> (bool, bool, bool, bool):
         is_not_outside_grid = self._edge_checks(coordinate)
         is_not_forest = (is_not_outside_grid[i] if not is_not_outside_grid[i]
                          else not self.is_forest(potential_neighbours[i])
                          for i in range(4))
         return is_not_forest
 
-    def coloured_squares(self, square_coordinates: set[Vector]) -> None:
+    def coloured_squares(self, square_coordinates: set[Vector2D]) -> None:
         start_position_encoding = self[self.start_position]
         end_position_encoding = self[self.end_position]
         self[self.start_position] = self.encodings['S']
         self[self.end_position] = self.encodings['E']
-        representation = '\n'.join(''.join(make_blue('O') if Vector((i, j)) in square_coordinates
+        representation = '\n'.join(''.join(make_blue('O') if Vector2D((i, j)) in square_coordinates
                                            else self.reverse_encodings[encoding]
                                            for j, encoding in enumerate(line))
-                                   for i, line in enumerate(self.grid))
+                                   for i, line in enumerate(self.grid.rows()))
         self[self.start_position] = start_position_encoding
         self[self.end_position] = end_position_encoding
         representation = pad_with_horizontal_rules(representation, rule_length=self.m)
         return representation
 
-    def neighbours(self, coordinate: Vector) -> set[Vector]:
+    def neighbours(self, coordinate: Vector2D) -> set[Vector2D]:
         # Right, Up, Down, Left
         potential_neighbours = self._potential_neighbours(coordinate)
         coord_checks = self._coord_checks(coordinate, potential_neighbours)
@@ -41,44 +46,46 @@ class SnowIslandNoSlopes(SnowIsland):
         return valid_neighbours
 
     def to_adjacency_set_condensed(self) -> (Adjacency_set2d, Adjacency_weights):
+        """
+        The start, the end and every fork, joined both ways by the trails between them and weighted by their length.
+        Trails are walked from each fork until the next one, trails that dead end are dropped
+        """
         adjacency_set = defaultdict(set)
-        adjacency_weights = defaultdict(lambda: 1)
+        adjacency_weights = {}
+        trail_ends = {self.start_position, self.end_position}
 
-        start = [self.start_position, self.start_position, 0]
+        junctions_to_visit = deque([self.start_position])
+        adjacency_set[self.start_position] = set()  # So it's indexed first
+        while junctions_to_visit:
+            junction = junctions_to_visit.popleft()
+            for first_step in self.neighbours(junction):
+                previous_node, node, distance = junction, first_step, 1
+                onward_nodes = self.neighbours(node) - {previous_node}
+                while len(onward_nodes) == 1 and node not in trail_ends:
+                    previous_node, node = node, onward_nodes.pop()
+                    onward_nodes = self.neighbours(node) - {previous_node}
+                    distance += 1
+
+                if not onward_nodes and node not in trail_ends:
+                    count("dead ends")
+                    continue
+                if node not in adjacency_set:
+                    count("split nodes")
+                    adjacency_set[node] = set()
+                    junctions_to_visit.append(node)
+                adjacency_set[junction].add(node)
+                adjacency_weights[(junction, node)] = max(distance, adjacency_weights.get((junction, node), 0))
 
-        nodes_to_visit = deque([start])
+        return adjacency_set, adjacency_weights
 
-        visited_nodes = set()
 
-        adjacency_set[self.start_position] = set()  # So it's indexed first
-        while nodes_to_visit:
-            parent_node, node, distance = nodes_to_visit.popleft()
-            visited_nodes.add(node)
-
-            potential_neighbours = self.neighbours(node)
-            potential_neighbours -= visited_nodes
-
-            # Divide into 2
-            if len(potential_neighbours) >= 2:
-                print(f"Split node: {node}")
-                adjacency_set[parent_node].add(node)
-                adjacency_weights[(parent_node, node)] = distance
-                for potential_neighbour in potential_neighbours:
-                    nodes_to_visit.append([node, potential_neighbour, 0])
-
-            # Continue path
-            if len(potential_neighbours) == 1:
-                nodes_to_visit.append([parent_node, list(potential_neighbours)[0], distance + 1])
-
-            # Dead end
-            if len(potential_neighbours) == 0:
-                print(f"Dead end on node: {node}")
-                adjacency_set[parent_node].add(node)
-                adjacency_weights[(parent_node, node)] = distance
-
-        print(adjacency_set)
-        print(adjacency_weights)
-        return adjacency_set, adjacency_weights
+def parse(file_path: str) -> SnowIslandNoSlopes:
+    return SnowIslandNoSlopes.from_lines(read_lines(file_path))
+
+
+def solve(snow_island: SnowIslandNoSlopes) -> int:
+    snow_island_graph = DirectedGraph2D(*snow_island.to_adjacency_set_condensed())
+    return snow_island_graph.longest_simple_path_size(snow_island.start_position, snow_island.end_position)
 
 
 def tests():
@@ -87,10 +94,10 @@ def tests():
 
     snow_island_graph = DirectedGraph2D(*snow_island.to_adjacency_set_condensed())
     print(snow_island.coloured_squares({value for values in snow_island_graph.adjacency_set.values() for value in values} | (snow_island_graph.adjacency_set.keys())))
-    grid_size = (snow_island.n, snow_island.m)
-    start_position = snow_island.start_position
+    assert snow_island_graph[snow_island.start_position] == {Vector2D((5, 3))}
+    assert snow_island_graph.adjacency_weights[(Vector2D((5, 3)), snow_island.start_position)] == 15
 
-    t = snow_island_graph.longest_acyclic_path_size(start_position, grid_size)
+    t = snow_island_graph.longest_simple_path_size(snow_island.start_position, snow_island.end_position)
     print(t)
     assert t == 154
 
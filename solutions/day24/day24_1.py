@@ -1,9 +1,13 @@
 from __future__ import annotations
-from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.file_processing import read_lines, read_ints
 from handy_dandy_library.string_manipulations import make_blue
-from handy_dandy_library.linear_algebra import Vector3D, sign
+from handy_dandy_library.linear_algebra import Vector3D, Vector3DArray, sign, NUMPY_AVAILABLE
 
 from itertools import combinations
+from math import inf
+
+
+INPUT_FILE_NAME = "day_24_1_input.txt"
 
 
 class Particle:
@@ -22,6 +26,31 @@ class Particle:
         return cls(position, velocity)
 
 
+def coincident_paths_meet_in_boundaryXY(p0: Particle, p1: Particle, boundary: tuple[float, float]) -> bool:
+    """
+    Whether two particles moving along one line share any future point inside the boundary.
+    Points on the line are p0.position + t * p0.velocity, so p0's future path is t >= 0
+    """
+    v0 = p0.velocity
+    v1 = p1.velocity
+    k = p1.position - p0.position
+    t1 = (k.x * v0.x + k.y * v0.y) / (v0.x ** 2 + v0.y ** 2)
+    lower, upper = 0, inf
+    if v0.x * v1.x + v0.y * v1.y > 0:
+        lower = max(lower, t1)
+    else:
+        upper = min(upper, t1)
+
+    for position, velocity in ((p0.position.x, v0.x), (p0.position.y, v0.y)):
+        if velocity == 0:
+            if position < boundary[0] or position > boundary[1]:
+                return False
+            continue
+        enter, leave = sorted(((boundary[0] - position) / velocity, (boundary[1] - position) / velocity))
+        lower, upper = max(lower, enter), min(upper, leave)
+    return lower <= upper
+
+
 def crosses_in_boundaryXY(p0: Particle, p1: Particle, boundary: tuple[float, float]) -> bool:
     v0 = p0.velocity
     v1 = p1.velocity
@@ -34,7 +63,7 @@ def crosses_in_boundaryXY(p0: Particle, p1: Particle, boundary: tuple[float, flo
         # Coincidental lines may still cross
         mu_b_numerator = v0.xy_projected_cross_product(k)
         if mu_a_numerator == 0 and mu_b_numerator == 0:
-            raise NotImplementedError  # None of the examples are coincidental
+            return coincident_paths_meet_in_boundaryXY(p0, p1, boundary)
         return False
 
     intersection = p0.position + v0 * (mu_a_numerator / denominator)
@@ -55,24 +84,91 @@ def number_of_particles_that_intersect_in_boundary(particles: list[Particle],
     return sum(crosses_in_boundaryXY(pair[0], pair[1], boundary) for pair in combinations(particles, 2))
 
 
+def crosses_in_boundaryXY_batch(p0: Particle, positions: Vector3DArray, velocities: Vector3DArray,
+                                boundary: tuple[float, float]):
+    """ crosses_in_boundaryXY of p0 against every particle in the batch at once, as a boolean mask """
+    import numpy as np
+
+    v0 = p0.velocity
+    denominator = -velocities.xy_projected_cross_product(v0)
+    k = -(positions - p0.position)
+    mu_a_numerator = velocities.xy_projected_cross_product(k)
+
+    parallel = denominator == 0
+    coincident = parallel & (mu_a_numerator == 0) & (k.xy_projected_cross_product(v0) == 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu_a = mu_a_numerator / denominator
+        intersection_x = p0.position.x + v0.x * mu_a
+        intersection_y = p0.position.y + v0.y * mu_a
+
+    a_in_past = np.sign(intersection_x - p0.position.x) != np.sign(v0.x)
+    b_in_past = np.sign(intersection_x - positions.x) != np.sign(velocities.x)
+    in_boundary = ((boundary[0] <= intersection_x) & (intersection_x <= boundary[1]) &
+                   (boundary[0] <= intersection_y) & (intersection_y <= boundary[1]))
+    crosses = ~parallel & ~a_in_past & ~b_in_past & in_boundary
+    # Rare enough to settle one pair at a time
+    for i in np.flatnonzero(coincident).tolist():
+        crosses[i] = coincident_paths_meet_in_boundaryXY(p0, Particle(positions[i], velocities[i]), boundary)
+    return crosses
+
+
+def number_of_particles_that_intersect_in_boundary_batched(particles: list[Particle],
+                                                           boundary: tuple[float, float]) -> int:
+    positions = Vector3DArray.from_vectors((particle.position for particle in particles), dtype=float)
+    velocities = Vector3DArray.from_vectors((particle.velocity for particle in particles), dtype=float)
+    return sum(int(crosses_in_boundaryXY_batch(particle, positions[i + 1:], velocities[i + 1:], boundary).sum())
+               for i, particle in enumerate(particles))
+
+
 def read_particles(lines: list[str]) -> list[Particle]:
     return tuple(Particle.from_line(line) for line in lines)
 
 
+def read_particles_from_file_path(file_path: str) -> tuple[Particle]:
+    values = read_ints(file_path)
+    return tuple(Particle(Vector3D((float(values[i]), float(values[i + 1]), float(values[i + 2]))),
+                          Vector3D((float(values[i + 3]), float(values[i + 4]), float(values[i + 5]))))
+                 for i in range(0, len(values), 6))
+
+
+def parse(file_path: str) -> tuple[Particle]:
+    return read_particles_from_file_path(file_path)
+
+
+def solve(particles: tuple[Particle], boundary: tuple[float, float] = (200000000000000, 400000000000000)) -> int:
+    count_intersections = number_of_particles_that_intersect_in_boundary
+    if NUMPY_AVAILABLE:
+        count_intersections = number_of_particles_that_intersect_in_boundary_batched
+    return count_intersections(particles, boundary)
+
+
 def tests():
     particles = read_particles(read_lines("day_24_1_test_input1.txt"))
+    assert [repr(p) for p in read_particles_from_file_path("day_24_1_test_input1.txt")] == [repr(p) for p in particles]
 
     assert crosses_in_boundaryXY(particles[0], particles[1], (7, 27))
     assert crosses_in_boundaryXY(particles[0], particles[2], (7, 27))
     assert number_of_particles_that_intersect_in_boundary(particles, (7, 27)) == 2
+    if NUMPY_AVAILABLE:
+        assert number_of_particles_that_intersect_in_boundary_batched(particles, (7, 27)) == 2
+
+    # All on one line. The first two head at each other and share (0, 0) to (20, 20), the rest meet outside or never
+    coincident = read_particles(["0, 0, 0 @ 1, 1, 0", "20, 20, 0 @ -1, -1, 0", "30, 30, 0 @ 2, 2, 1",
+                                 "-5, -5, 0 @ -1, -1, 0"])
+    assert crosses_in_boundaryXY(coincident[0], coincident[1], (7, 27))
+    assert not crosses_in_boundaryXY(coincident[0], coincident[2], (7, 27))
+    assert not crosses_in_boundaryXY(coincident[0], coincident[3], (7, 27))
+    assert crosses_in_boundaryXY(coincident[1], coincident[0], (7, 27))
+    assert number_of_particles_that_intersect_in_boundary(coincident, (7, 27)) == 1
+    if NUMPY_AVAILABLE:
+        assert number_of_particles_that_intersect_in_boundary_batched(coincident, (7, 27)) == 1
 
 
 def main():
     tests()
 
-    particles = read_particles(read_lines("day_24_1_input.txt"))
-
-    t = number_of_particles_that_intersect_in_boundary(particles, (200000000000000, 400000000000000))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -2,7 +2,10 @@ from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
 from handy_dandy_library.linear_algebra import Vector3D
 
-from day24_1 import Particle, read_particles
+from day24_1 import Particle, read_particles, parse
+
+
+INPUT_FILE_NAME = "day_24_1_input.txt"
 
 
 def plane(particle0: Particle, particle1: Particle):
@@ -82,8 +85,7 @@ def tests():
 def main():
     tests()
 
-    particles = read_particles(read_lines("day_24_1_input.txt"))
-    t = solve(particles)
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,9 +1,13 @@
 from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.graph import CSRGraph
+from handy_dandy_library.instrumentation import gauge
 
 from collections import defaultdict
 from itertools import pairwise
-from heapq import heappop, heappush
+
+
+INPUT_FILE_NAME = "day_25_1_input.txt"
 
 
 type Adjacency_set2d = dict[str, set[str]]
@@ -28,6 +32,7 @@ class Node:
 class DirectedGraph2D:
     def __init__(self, adjacency_set: Adjacency_set2d):
         self.adjacency_set = adjacency_set
+        self.graph = CSRGraph.from_adjacency(adjacency_set)
         self.dfs_counter = 1
 
     def __repr__(self) -> str:
@@ -179,40 +184,37 @@ class DirectedGraph2D:
             return cut_edges
 
         e_cut = find_cut_pairs(V[0])
-        print(e_cut)
+        gauge("cut pair edges", len(e_cut))
         return e_cut
 
     def minimal_cuts_3_brute_force_disjoint_product(self) -> int:
-        G = self.adjacency_set
-        G_len = len(G)
+        graph = self.graph
+        graph_length = len(graph)
         # Thanks to reddit for the set-masking optimisation ^^
-
-        def bfs(start, exclusions={}):
-            visited = {start: (0, [start])}
-            heap = [(0, start, [start])]
-            while len(heap) > 0:
-                dist, node, path = heappop(heap)
-                for de in G[node]:
-                    if (node, de) in exclusions:
-                        continue
-                    if de not in visited:
-                        visited[de] = (dist + 1, path + [de])
-                        heappush(heap, (dist + 1, de, path + [de]))
-            return len(visited), visited, node
-
-        start = next(k for k in G)
-        _, visited, stop = bfs(start)
-        for x1, y1 in pairwise(visited[stop][1]):
-            exclusions = {(x1, y1), (y1, x1)}
-            _, visited2, _ = bfs(start, exclusions)
-            for x2, y2 in pairwise(visited2[stop][1]):
-                exclusions = {(x1, y1), (y1, x1), (x2, y2), (y2, x2)}
-                _, visited3, _ = bfs(start, exclusions)
-                for x3, y3 in pairwise(visited3[stop][1]):
+        # Any 3 edge cut separating start from the furthest node must use one edge of every path between them
+
+        def path(exclusions=None) -> list[int]:
+            parents, _ = graph.bfs_parents(start, exclusions)
+            return graph.path_to(parents, stop)
+
+        start = 0
+        _, order = graph.bfs_parents(start)
+        stop = order[-1]
+        for x1, y1 in pairwise(path()):
+            for x2, y2 in pairwise(path({(x1, y1), (y1, x1)})):
+                for x3, y3 in pairwise(path({(x1, y1), (y1, x1), (x2, y2), (y2, x2)})):
                     exclusions = {(x1, y1), (y1, x1), (x2, y2), (y2, x2), (x3, y3), (y3, x3)}
-                    lena, _, _ = bfs(start, exclusions)
-                    if G_len != lena:
-                        return lena * (G_len - lena)
+                    _, component = graph.bfs_parents(start, exclusions)
+                    if graph_length != len(component):
+                        return len(component) * (graph_length - len(component))
+
+
+def parse(file_path: str) -> DirectedGraph2D:
+    return DirectedGraph2D.from_lines(read_lines(file_path))
+
+
+def solve(directed_graph: DirectedGraph2D) -> int:
+    return directed_graph.minimal_cuts_3_brute_force_disjoint_product()
 
 
 def tests():
@@ -224,8 +226,7 @@ def tests():
 def main():
     tests()
 
-    directed_graph = DirectedGraph2D.from_lines(read_lines("day_25_1_input.txt"))
-    edge_cut_product = directed_graph.minimal_cuts_3_brute_force_disjoint_product()
+    edge_cut_product = solve(parse(INPUT_FILE_NAME))
     print(edge_cut_product)
 
 
@@ -1,78 +1,193 @@
-from handy_dandy_library.file_processing import read_lines
-
-
-type Grid = list[list[int]]
-
-
-index_filter = [[-1, -1], [-1, 0], [-1, 1], [0, -1], [0, 1], [1, -1], [1, 0], [1, 1]]
+import os
+import re
+import tempfile
+
+from array import array
+from collections import deque
+from itertools import chain
+from typing import Iterator
+
+from handy_dandy_library.file_processing import read_lines, stream_lines
+
+
+INPUT_FILE_NAME = "day_3_1_input.txt"
+
+
+NUMBER_PATTERN = re.compile(r"\d+")
+# Every character is a symbol unless it is '.' or a digit
+SYMBOL_PATTERN = re.compile(r"[^.\d]")
+NUMBER_BYTES_PATTERN = re.compile(rb"\d+")
+SYMBOL_BYTES_PATTERN = re.compile(rb"[^.\d]")
+NO_SPAN = -1
+
+
+class Schematic:
+    """
+    Engine schematic indexed in one pass over its rows. Every number is a span (row, start, end, value), and a label
+    array over the schematic framed by a one cell border holds, for every cell, the number of the span covering it or
+    NO_SPAN. (row, column) is label index (row + 1) * width + column + 1, so the neighbours of a symbol are a fixed
+    set of offsets away and which parts touch it is eight lookups, with no bounds checks and no rescanning of text
+    """
+    def __init__(self, lines: list[str]):
+        self.n = len(lines)
+        self.m = len(lines[0]) if lines else 0
+        self.width = self.m + 2
+        self.spans: list[tuple[int, int, int, int]] = []
+        self.symbols: list[tuple[int, str]] = []  # (label index, symbol)
+        self.labels = array('q', [NO_SPAN]) * ((self.n + 2) * self.width)
+
+        width, spans, labels = self.width, self.spans, self.labels
+        for row, line in enumerate(lines):
+            row_start = (row + 1) * width + 1
+            for match in NUMBER_PATTERN.finditer(line):
+                start, end = match.span()
+                labels[row_start + start:row_start + end] = array('q', [len(spans)]) * (end - start)
+                spans.append((row, start, end, int(match[0])))
+            self.symbols.extend((row_start + match.start(), match[0]) for match in SYMBOL_PATTERN.finditer(line))
+
+        self.neighbour_offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+
+    def __repr__(self) -> str:
+        return f"Schematic({self.n}x{self.m}, {len(self.spans)} numbers, {len(self.symbols)} symbols)"
+
+    def index(self, row: int, column: int) -> int:
+        return (row + 1) * self.width + column + 1
+
+    def span_at(self, row: int, column: int) -> tuple[int, int, int, int] | None:
+        label = self.labels[self.index(row, column)]
+        return None if label == NO_SPAN else self.spans[label]
+
+    def adjacent_spans(self, index: int) -> set[int]:
+        """ Labels of the distinct numbers touching the cell at label index, diagonally included """
+        labels = self.labels
+        adjacent = {labels[index + offset] for offset in self.neighbour_offsets}
+        adjacent.discard(NO_SPAN)
+        return adjacent
+
+    def part_spans(self, symbols: str | None = None) -> set[int]:
+        """ Labels of the numbers next to any symbol, or only to the symbols in symbols, e.g. "*#" """
+        parts = set()
+        for index, symbol in self.symbols:
+            if symbols is None or symbol in symbols:
+                parts |= self.adjacent_spans(index)
+        return parts
+
+    def parts_adjacent_to(self, symbols: str | None = None) -> list[int]:
+        """ Values of those part numbers, in reading order """
+        return [self.spans[label][3] for label in sorted(self.part_spans(symbols))]
+
+    def gear_ratios(self) -> Iterator[int]:
+        """ The product of the two numbers around every '*' touching exactly two """
+        spans = self.spans
+        for index, symbol in self.symbols:
+            if symbol == '*':
+                adjacent = self.adjacent_spans(index)
+                if len(adjacent) == 2:
+                    first, second = adjacent
+                    yield spans[first][3] * spans[second][3]
+
+
+class SchematicRow:
+    """
+    One row of a schematic read as a stream: its text, its number spans (start, end, value), a label per column
+    (shifted one right, so column -1 and column m are NO_SPAN padding) and its symbols as (column, symbol)
+    """
+    __slots__ = ("line", "spans", "labels", "symbols")
+
+    def __init__(self, line: bytes, m: int):
+        self.line = line
+        self.spans: list[tuple[int, int, int]] = []
+        self.labels = [NO_SPAN] * (m + 2)
+        for match in NUMBER_BYTES_PATTERN.finditer(line):
+            start, end = match.span()
+            self.labels[start + 1:end + 1] = [len(self.spans)] * (end - start)
+            self.spans.append((start, end, int(match[0])))
+        self.symbols = [(match.start(), match[0]) for match in SYMBOL_BYTES_PATTERN.finditer(line)]
+
+    def __repr__(self) -> str:
+        return f"SchematicRow({self.line!r})"
+
+    def has_symbol_near(self, start: int, end: int) -> bool:
+        """ Whether columns start - 1 to end hold a symbol, the cells around a number spanning start:end """
+        return SYMBOL_BYTES_PATTERN.search(self.line, max(start - 1, 0), end + 1) is not None
+
+
+def window_totals(window: deque[SchematicRow]) -> (int, int):
+    """ Part numbers and gear ratios of the middle row of three, all it can touch being in the rows either side """
+    row = window[1]
+    parts = sum(value for start, end, value in row.spans
+                if any(neighbour.has_symbol_near(start, end) for neighbour in window))
+    gear_ratios = 0
+    for column, symbol in row.symbols:
+        if symbol != b'*':
+            continue
+        adjacent = {(k, label) for k, neighbour in enumerate(window)
+                    for label in neighbour.labels[column:column + 3] if label != NO_SPAN}
+        if len(adjacent) == 2:
+            (k, first), (l, second) = adjacent
+            gear_ratios += window[k].spans[first][2] * window[l].spans[second][2]
+    return parts, gear_ratios
+
+
+def stream_totals(file_path: str) -> (int, int):
+    """
+    Both parts' totals read row by row off a memory map, with only three rows held at a time. Each row is settled
+    once the row below it arrives, and a blank row above the first and below the last stands in for the edges
+    """
+    total_parts = total_gear_ratios = 0
+    window: deque[SchematicRow] = deque(maxlen=3)
+    for line in chain(stream_lines(file_path), [b'']):
+        if not window:
+            window.append(SchematicRow(b'', len(line)))
+        window.append(SchematicRow(line, len(window[0].labels) - 2))
+        if len(window) == 3:
+            parts, gear_ratios = window_totals(window)
+            total_parts += parts
+            total_gear_ratios += gear_ratios
+    return total_parts, total_gear_ratios
+
+
+def stream_total_parts(file_path: str) -> int:
+    return stream_totals(file_path)[0]
 
 
 def total_parts(lines: list[str]) -> int:
-    intersection_indices = symbol_adjacent_indices(lines)
-    total = 0
-
-    m = len(lines[0])
-
-    for i, line in enumerate(lines):
-        digit_start_index = -1
-        valid_part = False
-        for j, char in enumerate(line):
-            if digit_start_index == -1 and char.isdigit():
-                digit_start_index = j
-
-            if digit_start_index != -1:
-                if char.isdigit() and intersection_indices[i][j] == 1:
-                    valid_part = True
+    return sum(Schematic(lines).parts_adjacent_to())
 
-                if not char.isdigit():
-                    if valid_part:
-                        number_found = int(line[digit_start_index:j])
-                        total += number_found
-                    digit_start_index = -1
-                    valid_part = False
 
-                if j == m - 1 and valid_part:
-                    number_found = int(line[digit_start_index:])
-                    total += number_found
-    return total
+def parse(file_path: str) -> Schematic:
+    return Schematic(read_lines(file_path))
 
 
-def symbol_adjacent_indices(lines: list[str]) -> Grid:
-    n = len(lines)
-    m = len(lines[0])
-
-    all_indices = [[0 for _ in range(m)] for _ in range(n)]
-    for i, line in enumerate(lines):
-        for j, char in enumerate(line):
-            if char != '.' and not char.isdigit():
-                mark_valid_indices(all_indices, i, j)
-    return all_indices
-
-
-def mark_valid_indices(indices: Grid, row: int, column: int) -> None:
-    adjacents = adjacent_indices(row, column)
-    for row in adjacents:
-        indices[row[0]][row[1]] = 1
-    return None
-
-
-def adjacent_indices(row: int, column: int) -> list[list[int, int]]:
-    indices = [row.copy() for row in index_filter]
-    for index in indices:
-        index[0] += row
-        index[1] += column
-    return indices
+def solve(schematic: Schematic) -> int:
+    return sum(schematic.parts_adjacent_to())
 
 
 def tests():
     lines = read_lines("day_3_1_test_input.txt")
     assert total_parts(lines) == 4361
 
+    schematic = Schematic(lines)
+    assert solve(schematic) == 4361
+    assert schematic.span_at(0, 1) == (0, 0, 3, 467)
+    assert schematic.span_at(0, 3) is None
+    assert schematic.parts_adjacent_to("#") == [633]
+    assert schematic.parts_adjacent_to("$") == [664]
+    assert stream_total_parts("day_3_1_test_input.txt") == 4361
+
+    # A carriage return ends the line rather than being a symbol next to the 12
+    with tempfile.TemporaryDirectory() as directory:
+        crlf_file_path = os.path.join(directory, "crlf.txt")
+        with open(crlf_file_path, 'wb') as file:
+            file.write(b"...12\r\n.....\r\n")
+        assert stream_totals(crlf_file_path) == (0, 0)
+        assert solve(parse(crlf_file_path)) == 0
+
 
 def main():
     tests()
 
-    t = total_parts(read_lines("day_3_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,5 +1,8 @@
 from handy_dandy_library.file_processing import read_lines
-from handy_dandy_library.string_manipulations import find_first_char_index
+from handy_dandy_library.string_manipulations import find_first_char_index, extract_ints
+
+
+INPUT_FILE_NAME = "day_4_1_input.txt"
 
 
 def get_separator_indices(line: str) -> (int, int):
@@ -10,8 +13,8 @@ def get_separator_indices(line: str) -> (int, int):
 
 
 def parse_card(line: str, colon_index: int, pipe_index: int) -> (set[int], list[int]):
-    winning_values = {int(value) for value in line[colon_index + 1:pipe_index - 1].split(' ') if value != ''}
-    chosen_values = tuple(int(value) for value in line[pipe_index + 1:].split(' ') if value != '')
+    winning_values = set(extract_ints(line[colon_index + 1:pipe_index]))
+    chosen_values = tuple(extract_ints(line[pipe_index + 1:]))
     return winning_values, chosen_values
 
 
@@ -35,6 +38,14 @@ def total_points(lines: list[str]) -> int:
     return sum(card_points(*parse_card(line, start_index, end_index)) for line in lines)
 
 
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str]) -> int:
+    return total_points(lines)
+
+
 def tests():
     assert card_points({13, 32, 20, 16, 61}, (61, 30, 68, 82, 17, 32, 24, 19)) == 2
     assert total_points(read_lines("day_4_1_test_input.txt")) == 13
@@ -43,7 +54,7 @@ def tests():
 def main():
     tests()
 
-    t = total_points(read_lines("day_4_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
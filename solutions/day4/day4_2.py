@@ -1,8 +1,12 @@
 from handy_dandy_library.file_processing import read_lines
-from day4_1 import get_separator_indices, parse_card, number_of_matches
+from handy_dandy_library.instrumentation import count, gauge
+from day4_1 import get_separator_indices, parse_card, number_of_matches, parse
 from collections import deque
 
 
+INPUT_FILE_NAME = "day_4_1_input.txt"
+
+
 def total_scratchcards(lines: list[str]) -> int:
     # Given that cards cannot cause overflow victories. Card 6 must have 0 matches.
     n = len(lines)
@@ -12,11 +16,10 @@ def total_scratchcards(lines: list[str]) -> int:
     window = deque([1 for _ in range(number_of_winning_values_per_card + 1)])
 
     window_cutoff = n - number_of_winning_values_per_card
-    print(f"cutoff: {window_cutoff}")
+    most_copies = 0
     for i, line in enumerate(lines):
         match_count = number_of_matches(*parse_card(line, start_index, end_index))
 
-        print(f"total: {total} | i: {i} | match_count: {match_count} | window: {window}")
         current_number_of_scorecards = window.popleft()
         total += current_number_of_scorecards
 
@@ -25,10 +28,18 @@ def total_scratchcards(lines: list[str]) -> int:
 
         for j in range(match_count):
             window[j] += current_number_of_scorecards
+        if current_number_of_scorecards > most_copies:
+            most_copies = current_number_of_scorecards
 
+    count("cards read", n)
+    gauge("most copies of one card", most_copies)
     return total
 
 
+def solve(lines: list[str]) -> int:
+    return total_scratchcards(lines)
+
+
 def tests():
     assert total_scratchcards(read_lines("day_4_2_test_input.txt")) == 30
 
@@ -36,7 +47,7 @@ def tests():
 def main():
     tests()
 
-    t = total_scratchcards(read_lines("day_4_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
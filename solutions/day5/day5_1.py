@@ -1,5 +1,8 @@
 from __future__ import annotations
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.parse_cache import cached_parser
+from handy_dandy_library.list_operations import insertion_point_bounds
+from handy_dandy_library.string_manipulations import extract_ints, extract_ints_by_line
 
 import sys
 
@@ -7,6 +10,9 @@ from functools import reduce
 from itertools import chain
 
 
+INPUT_FILE_NAME = "day_5_1_input.txt"
+
+
 class Map:
     def __init__(self, map_ranges: tuple[int]):
         self.interval_mappings = self.__get_interval_mappings(map_ranges)
@@ -64,8 +70,8 @@ class FarmingDataReader:
                 self.__start_index = i + 1
                 break
 
-        seed_numbers = [int(seed) for seed in seeds_phrase[6:].split(' ') if seed != '']
-        return seed_numbers
+        # Everything after the "seeds:" header
+        return list(extract_ints(seeds_phrase[6:]))
 
     def parse_next_source_to_destination_map(self) -> list[Map]:
         map_numbers_phrase = None
@@ -82,14 +88,16 @@ class FarmingDataReader:
                 self.__start_index += i
                 break
 
-        map_numbers = [Map(tuple(int(number) for number in line.split(' '))) for line in map_numbers_phrase]
-        return map_numbers
+        # The section's lines come without their "x-to-y map:" header
+        values, offsets = extract_ints_by_line('\n'.join(map_numbers_phrase))
+        return [Map(tuple(values[offsets[i]:offsets[i + 1]])) for i in range(len(offsets) - 1)]
 
 
 class Farmer:
     def __init__(self, start_seeds: list[int], start_maps: list[list[Map]]):
         self.start_seeds = start_seeds
         self.start_maps = start_maps
+        self.__sorted_maps = None
 
     @classmethod
     def from_farming_data_reader(cls, farming_data_reader: FarmingDataReader):
@@ -97,19 +105,31 @@ class Farmer:
         maps = [farming_data_reader.parse_next_source_to_destination_map() for _ in range(7)]
         return cls(seeds, maps)
 
+    @property
+    def sorted_maps(self) -> list[tuple[list[Map], list[int]]]:
+        """ Each stage's mappings ordered by source start, alongside those starts. Worked out once for both parts """
+        if self.__sorted_maps is None:
+            self.__sorted_maps = []
+            for mappings in self.start_maps:
+                mappings = sorted(mappings, key=lambda mapping: mapping.interval_mappings[0])
+                self.__sorted_maps.append((mappings, [mapping.interval_mappings[0] for mapping in mappings]))
+        return self.__sorted_maps
+
     @staticmethod
-    def __destination(seeds: list[int], mappings: Map) -> list[int]:
+    def __destination(seeds: list[int], sorted_stage: tuple[list[Map], list[int]]) -> list[int]:
+        # Source ranges never overlap, so the only candidate is the last mapping starting at or before the seed
+        mappings, starts = sorted_stage
+        _, upper_points = insertion_point_bounds(starts, seeds)
+
         next_seeds = seeds.copy()
-        for i, seed in enumerate(seeds):
-            for mapping in mappings:
-                if mapping.is_within_mapping(seed):
-                    next_seeds[i] = mapping.destination_assuming_valid(seed)
-                    break
+        for i, (seed, upper_point) in enumerate(zip(seeds, upper_points)):
+            if upper_point and mappings[upper_point - 1].is_within_mapping(seed):
+                next_seeds[i] = mappings[upper_point - 1].destination_assuming_valid(seed)
         return next_seeds
 
     @property
     def lowest_location(self) -> int:
-        final_seeds = reduce(self.__destination, self.start_maps, self.start_seeds)
+        final_seeds = reduce(self.__destination, self.sorted_maps, self.start_seeds)
         return min(final_seeds)
 
     @property
@@ -122,19 +142,25 @@ class Farmer:
 
     @property
     def lowest_possible_location(self) -> int:
-        seed_ends = (s for s in self.__seed_endpoints if self.in_transformed_seed_range(s))
-        return min(self.seed_to_location(s) for s in seed_ends)
+        seed_ends = self.__seed_endpoints
+        seed_ends = [s for s, is_valid in zip(seed_ends, self.in_transformed_seed_ranges(seed_ends)) if is_valid]
+        return min(reduce(self.__destination, self.sorted_maps, seed_ends))
 
     @property
     def __seed_endpoints(self) -> list[int]:
         return reduce(invert_maps, reversed(self.start_maps), (0, sys.maxsize))
 
-    def seed_to_location(self, seed: int) -> int:
-        return reduce(destination_from_maps, self.start_maps, seed)
-
-    def in_transformed_seed_range(self, test_seed: int) -> bool:
+    def in_transformed_seed_ranges(self, test_seeds: list[int]) -> list[bool]:
+        # s alternates [start, end, start, end...], so an odd count of values <= seed means the seed is in a range
         s = self.transformed_seeds
-        return any(s[i] <= test_seed <= s[i + 1] for i in range(0, len(s), 2))
+        lower_points, upper_points = insertion_point_bounds(s, test_seeds)
+        return [upper_point % 2 == 1 or lower_point != upper_point
+                for lower_point, upper_point in zip(lower_points, upper_points)]
+
+
+@cached_parser(version=2)
+def read_farmer(file_path: str) -> Farmer:
+    return Farmer.from_farming_data_reader(FarmingDataReader(file_path))
 
 
 def invert_maps(output_ends: list[int], maps: list[Map]) -> list[int]:
@@ -160,6 +186,14 @@ def destination_from_maps(x: int, maps: list[Map]) -> int:
     return x
 
 
+def parse(file_path: str) -> Farmer:
+    return read_farmer(file_path)
+
+
+def solve(farmer: Farmer) -> int:
+    return farmer.lowest_location
+
+
 def tests():
     farming_data_reader = FarmingDataReader("day_5_1_test_input.txt")
     farmer = Farmer.from_farming_data_reader(farming_data_reader)
@@ -170,9 +204,7 @@ def tests():
 def main():
     tests()
 
-    farming_data_reader = FarmingDataReader("day_5_1_input.txt")
-    farmer = Farmer.from_farming_data_reader(farming_data_reader)
-    t = farmer.lowest_location
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
     assert t == 107430936
 
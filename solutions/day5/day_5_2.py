@@ -1,4 +1,11 @@
-from day5_1 import FarmingDataReader, Farmer
+from day5_1 import FarmingDataReader, Farmer, parse
+
+
+INPUT_FILE_NAME = "day_5_1_input.txt"
+
+
+def solve(farmer: Farmer) -> int:
+    return farmer.lowest_possible_location
 
 
 def tests():
@@ -12,10 +19,7 @@ def tests():
 def main():
     tests()
 
-    farming_data_reader = FarmingDataReader("day_5_1_input.txt")
-    farmer = Farmer.from_farming_data_reader(farming_data_reader)
-
-    t = farmer.lowest_possible_location
+    t = solve(parse(INPUT_FILE_NAME))
     assert t == 23738616
 
 
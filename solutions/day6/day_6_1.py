@@ -1,12 +1,17 @@
 import operator
 
-from handy_dandy_library.file_processing import read_lines
+from array import array
+
+from handy_dandy_library.file_processing import read_lines, read_ints_by_line
 from handy_dandy_library.string_manipulations import find_first_char_index, parse_ints
 from functools import reduce
 
 import math
 
 
+INPUT_FILE_NAME = "day_6_1_input.txt"
+
+
 def number_of_ints_between_two_floats(lower: int, higher: int) -> int:
     lower_floor = math.floor(lower)
     higher_ceiling = math.floor(higher)
@@ -40,18 +45,35 @@ def product_ways(lines: list[str]):
     return reduce(operator.mul, (number_of_ways_to_beat_race(t, r) for t, r in zip(time_limits, distance_records)))
 
 
+def product_ways_from_file_path(file_path: str) -> int:
+    return solve(parse(file_path))
+
+
+def parse(file_path: str) -> (array, array):
+    """ Packed ints, line 0 holds the time limits and line 1 the distance records """
+    return read_ints_by_line(file_path)
+
+
+def solve(packed_ints: (array, array)) -> int:
+    values, offsets = packed_ints
+    time_limits = values[offsets[0]:offsets[1]]
+    distance_records = values[offsets[1]:offsets[2]]
+    return reduce(operator.mul, (number_of_ways_to_beat_race(t, r) for t, r in zip(time_limits, distance_records)))
+
+
 def tests():
     assert number_of_ways_to_beat_race(7, 9) == 4
     assert number_of_ways_to_beat_race(15, 40) == 8
     assert number_of_ways_to_beat_race(30, 200) == 9
 
     assert product_ways(read_lines("day_6_1_test_input.txt")) == 288
+    assert product_ways_from_file_path("day_6_1_test_input.txt") == 288
 
 
 def main():
     tests()
 
-    t = product_ways(read_lines("day_6_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
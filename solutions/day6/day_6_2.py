@@ -3,7 +3,12 @@ from functools import reduce
 
 from handy_dandy_library.file_processing import read_lines
 from handy_dandy_library.string_manipulations import find_first_char_index, parse_int_ignore_spaces
-from day_6_1 import number_of_ways_to_beat_race
+from day_6_1 import number_of_ways_to_beat_race, parse
+
+from array import array
+
+
+INPUT_FILE_NAME = "day_6_1_input.txt"
 
 
 def product_ways2(lines: list[str]):
@@ -15,6 +20,18 @@ def product_ways2(lines: list[str]):
     return number_of_ways_to_beat_race(time_limit, distance_record)
 
 
+def kerned_int(values: array) -> int:
+    """ The ints of a line read as one number, ignoring the spaces between them """
+    return int(''.join(map(str, values)))
+
+
+def solve(packed_ints: (array, array)) -> int:
+    values, offsets = packed_ints
+    time_limit = kerned_int(values[offsets[0]:offsets[1]])
+    distance_record = kerned_int(values[offsets[1]:offsets[2]])
+    return number_of_ways_to_beat_race(time_limit, distance_record) + 1  # 1 lower, rounding error in math.sqrt
+
+
 def tests():
     assert product_ways2(read_lines("day_6_1_test_input.txt")) == 71503
 
@@ -22,8 +39,8 @@ def tests():
 def main():
     tests()
     print('-'*100)
-    t = product_ways2(read_lines("day_6_1_input.txt"))
-    print(t + 1)  # This solution is 1 lower, due to rounding error in math.sqrt
+    t = solve(parse(INPUT_FILE_NAME))
+    print(t)
 
 
 if __name__ == "__main__":
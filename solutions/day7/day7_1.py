@@ -5,6 +5,7 @@ from collections import Counter
 from typing import Callable
 
 
+INPUT_FILE_NAME = "day_7_1_input.txt"
 
 
 class HandReader:
@@ -99,12 +100,18 @@ def total_winnings(lines: list[str], hand_reader: Callable=HandReader) -> int:
         return x[0]
 
     hands_and_bids.sort(key=pair)
-    for i, hand_bid in enumerate(hands_and_bids):
-        print(f"{hand_bid[0]} is rank {i + 1}")
     total = sum(pair[1] * (i+1) for i, pair in enumerate(hands_and_bids))
     return total
 
 
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str]) -> int:
+    return total_winnings(lines)
+
+
 def tests():
     assert HandReader("AAAAA").is_5_of_a_kind()
     assert not HandReader("AAAAK").is_5_of_a_kind()
@@ -144,7 +151,7 @@ def tests():
 def main():
     tests()
 
-    t = total_winnings(read_lines("day_7_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
@@ -1,6 +1,9 @@
 from handy_dandy_library.file_processing import read_lines
 
-from day7_1 import HandReader, total_winnings
+from day7_1 import HandReader, total_winnings, parse
+
+
+INPUT_FILE_NAME = "day_7_1_input.txt"
 
 
 class HandReaderJackOfAllTrades(HandReader):
@@ -36,6 +39,10 @@ class HandReaderJackOfAllTrades(HandReader):
         return self.hand.replace('J', highest_frequency_char_non_j)
 
 
+def solve(lines: list[str]) -> int:
+    return total_winnings(lines, HandReaderJackOfAllTrades)
+
+
 def tests():
     assert HandReaderJackOfAllTrades("2J36J").hand_type == 3
     assert HandReaderJackOfAllTrades("JKKK2") < HandReaderJackOfAllTrades("QQQQ2")
@@ -47,7 +54,7 @@ def tests():
 def main():
     tests()
 
-    t = total_winnings(read_lines("day_7_1_input.txt"), HandReaderJackOfAllTrades)
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
     assert t == 250506580
 
@@ -1,4 +1,9 @@
 from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.graph import CSRGraph
+from handy_dandy_library.instrumentation import count
+
+
+INPUT_FILE_NAME = "day_8_1_input.txt"
 
 
 class RouteManager:
@@ -17,15 +22,22 @@ class RouteManager:
             self.mappings[node[0]] = [node[1], node[2]]
         return None
 
+    @property
+    def graph(self) -> CSRGraph:
+        """ Every node has its left then right edge, so node v goes to targets[offsets[v] + lr_code] """
+        return CSRGraph.from_adjacency(self.mappings)
+
     def zig_zag(self, lr_code: str) -> int:
-        current_node_name = "AAA"
+        graph = self.graph
+        offsets, targets = graph.offsets, graph.targets
+        lr_codes = [int(code) for code in lr_code]
+        current_node = graph.node("AAA")
+        end_node = graph.node("ZZZ")
         iter_count = 0
         i = 0
         n = len(lr_code)
-        while current_node_name != "ZZZ":
-            print(f"i: {i} | {current_node_name} {self.mappings[current_node_name]}")
-            current_lr_code = int(lr_code[i])
-            current_node_name = self.mappings[current_node_name][current_lr_code]
+        while current_node != end_node:
+            current_node = targets[offsets[current_node] + lr_codes[i]]
 
             if i == n - 1:
                 i = 0
@@ -33,6 +45,7 @@ class RouteManager:
             else:
                 i += 1
 
+        count("nodes walked", iter_count * n + i)
         return iter_count * n
 
 
@@ -60,6 +73,14 @@ def zig_zag(lines: list[str]) -> int:
     return route_manager.zig_zag(lr_code)
 
 
+def parse(file_path: str) -> list[str]:
+    return read_lines(file_path)
+
+
+def solve(lines: list[str]) -> int:
+    return zig_zag(lines)
+
+
 def tests():
     assert zig_zag(read_lines("day_8_1_test_input1.txt")) == 2
     print('-' * 50)
@@ -70,7 +91,7 @@ def tests():
 def main():
     tests()
 
-    t = zig_zag(read_lines("day_8_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
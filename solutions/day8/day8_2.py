@@ -1,8 +1,12 @@
 from handy_dandy_library.file_processing import read_lines
-from day8_1 import RouteManager, read_nodes, read_lr
+from handy_dandy_library.instrumentation import count, gauge
+from day8_1 import RouteManager, read_nodes, read_lr, parse
 import math
 
 
+INPUT_FILE_NAME = "day_8_1_input.txt"
+
+
 class RouteManager2(RouteManager):
     def start_nodes(self) -> list[str]:
         return [node for node in self.mappings if node[-1] == 'A']
@@ -13,19 +17,21 @@ class RouteManager2(RouteManager):
 
     def zig_zag(self, lr_code: str) -> int:
         current_node_names = self.start_nodes()
+        graph = self.graph
+        offsets, targets = graph.offsets, graph.targets
+        is_end_node = bytearray(label[-1] == 'Z' for label in graph.interner.labels)
+        lr_codes = [int(code) for code in lr_code]
         iter_count = 0
         i = 0
         n = len(lr_code)
-        print(current_node_names)
+        gauge("ghosts", len(current_node_names))
 
         looping_constants = [0 for _ in current_node_names]
 
         for j, current_node_name in enumerate(current_node_names):
-            while current_node_name[-1] != 'Z':
-                print(f"i: {i} | {current_node_name} {self.mappings[current_node_name]}")
-
-                current_lr_code = int(lr_code[i])
-                current_node_name = self.mappings[current_node_name][current_lr_code]
+            current_node = graph.node(current_node_name)
+            while not is_end_node[current_node]:
+                current_node = targets[offsets[current_node] + lr_codes[i]]
 
                 if i == n - 1:
                     i = 0
@@ -35,7 +41,7 @@ class RouteManager2(RouteManager):
             looping_constants[j] = iter_count
             i = 0
             iter_count = 0
-        print(looping_constants)
+        count("nodes walked", sum(looping_constants))
         return math.lcm(*looping_constants)
 
 
@@ -48,6 +54,10 @@ def zig_zag(lines: list[str]) -> int:
     return route_manager.zig_zag(lr_code)
 
 
+def solve(lines: list[str]) -> int:
+    return zig_zag(lines)
+
+
 def tests():
     assert zig_zag(read_lines("day_8_2_test_input.txt")) == 6
 
@@ -55,7 +65,7 @@ def tests():
 def main():
     tests()
 
-    t = zig_zag(read_lines("day_8_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 
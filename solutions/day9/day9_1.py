@@ -1,8 +1,15 @@
-from handy_dandy_library.file_processing import read_lines
+from handy_dandy_library.file_processing import read_lines, read_ints_by_line
+from handy_dandy_library.instrumentation import count
 
+from array import array
+from typing import Iterable, Iterator
 
-def line_to_sequence(line: str) -> list[int]:
-    return [int(x) for x in line.split(' ')]
+
+INPUT_FILE_NAME = "day_9_1_input.txt"
+
+
+def line_to_sequence(line: str | bytes) -> list[int]:
+    return [int(x) for x in line.split()]
 
 
 def differences(sequence: list[int]) -> list[int]:
@@ -15,30 +22,45 @@ def oasis(sequence: list[int]) -> int:
         if difference_sequences[-1][-1] == 0:
             break
         difference_sequences.append(differences(difference_sequences[-1]))
-
-    print(difference_sequences)
+    count("difference rows", len(difference_sequences))
 
     total = 0
     for sequence in difference_sequences[:-1]:
         total += sequence[-1]
-        print(total)
 
     return total
 
 
-def oasis_total(lines: list[str]) -> int:
+def oasis_total(lines: Iterable[str | bytes]) -> int:
     return sum(oasis(line_to_sequence(line)) for line in lines)
 
 
+def sequences_from_packed_ints(values: array, offsets: array) -> Iterator[list[int]]:
+    return (values[offsets[i]:offsets[i + 1]].tolist() for i in range(len(offsets) - 1))
+
+
+def oasis_total_from_file_path(file_path: str) -> int:
+    return solve(parse(file_path))
+
+
+def parse(file_path: str) -> (array, array):
+    return read_ints_by_line(file_path)
+
+
+def solve(packed_ints: (array, array)) -> int:
+    return sum(oasis(sequence) for sequence in sequences_from_packed_ints(*packed_ints))
+
+
 def tests():
     assert oasis_total(read_lines("day_9_1_test_input.txt")) == 114
+    assert oasis_total_from_file_path("day_9_1_test_input.txt") == 114
 
 
 def main():
     tests()
 
-    # t = oasis_total(read_lines("day_9_1_input.txt"))
-    # print(t)
+    t = solve(parse(INPUT_FILE_NAME))
+    print(t)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,12 @@
 from handy_dandy_library.file_processing import read_lines
-from day9_1 import differences, line_to_sequence
+from day9_1 import differences, line_to_sequence, sequences_from_packed_ints, parse
+
+from array import array
+
+from typing import Iterable
+
+
+INPUT_FILE_NAME = "day_9_1_input.txt"
 
 
 def oasis_backwards(sequence: list[int]) -> int:
@@ -17,18 +24,27 @@ def oasis_backwards(sequence: list[int]) -> int:
     return total
 
 
-def oasis_backwards_total(lines: list[str]) -> int:
+def oasis_backwards_total(lines: Iterable[str | bytes]) -> int:
     return sum(oasis_backwards(line_to_sequence(line)) for line in lines)
 
 
+def oasis_backwards_total_from_file_path(file_path: str) -> int:
+    return solve(parse(file_path))
+
+
+def solve(packed_ints: (array, array)) -> int:
+    return sum(oasis_backwards(sequence) for sequence in sequences_from_packed_ints(*packed_ints))
+
+
 def tests():
     assert oasis_backwards_total(read_lines("day_9_1_test_input.txt")) == 2
+    assert oasis_backwards_total_from_file_path("day_9_1_test_input.txt") == 2
 
 
 def main():
     tests()
 
-    t = oasis_backwards_total(read_lines("day_9_1_input.txt"))
+    t = solve(parse(INPUT_FILE_NAME))
     print(t)
 
 